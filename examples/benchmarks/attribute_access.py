@@ -0,0 +1,62 @@
+# Compares reading and writing option values through the per-field
+# descriptors with the former `__getattr__`/`__setattr__` based access.
+from timeit import Timer
+import gpyconf
+from gpyconf.backends.dummy import DummyBackend
+
+NUMBER = 200000
+STATEMENTS = (
+    ('read', 'conf.foo'),
+    ('write', 'conf.foo = 43'),
+    ('write (other attribute)', 'conf.logging_level = "info"'),
+)
+
+
+class BenchmarkConf(gpyconf.Configuration):
+    backend = DummyBackend
+    foo = gpyconf.fields.IntegerField(default=42)
+    bar = gpyconf.fields.CharField(default='bar')
+
+
+class LegacyBenchmarkConf(gpyconf.Configuration):
+    """ Accesses values the way gpyconf did before field descriptors """
+    backend = DummyBackend
+    foo = gpyconf.fields.IntegerField(default=42)
+    bar = gpyconf.fields.CharField(default='bar')
+
+    def __setattr__(self, attr, value):
+        if attr in self._field_index:
+            return self._set_value(attr, value)
+        else:
+            super(LegacyBenchmarkConf, self).__setattr__(attr, value)
+
+    def __getattr__(self, name):
+        try:
+            index = self._field_index[name]
+        except KeyError:
+            raise AttributeError("No such attribute '%s'" % name)
+        if self._read_pending:
+            self.read()
+        return self._values[index]
+
+# remove the descriptors installed by the metaclass
+for name in LegacyBenchmarkConf.fields:
+    delattr(LegacyBenchmarkConf, name)
+
+
+def run(cls):
+    setup = 'from __main__ import %s; conf = %s(read=False)' % ((cls.__name__,)*2)
+    timings = {}
+    for label, stmt in STATEMENTS:
+        timer = Timer(stmt, setup)
+        timings[label] = min(timer.repeat(3, NUMBER)) / NUMBER * 1e9
+    return timings
+
+
+if __name__ == '__main__':
+    legacy = run(LegacyBenchmarkConf)
+    descriptors = run(BenchmarkConf)
+    print '%-24s %12s %12s %8s' % ('', '__getattr__', 'descriptor', 'speedup')
+    for label, stmt in STATEMENTS:
+        print '%-24s %10.0fns %10.0fns %7.2fx' % (label, legacy[label],
+            descriptors[label], legacy[label] / descriptors[label])
@@ -0,0 +1,92 @@
+# Compares the anydbm based backend with the ConfigParser backend for
+# stores with many options: creating a configuration and accessing a few
+# options (start-up), changing one option and saving, and iterating all
+# options of the backend. Which anydbm implementation is used matters:
+# dumbdbm loads all keys when the database is opened.
+import gc
+import os
+import glob
+import whichdb
+from time import time
+import gpyconf
+from gpyconf.backends import filebased
+from gpyconf.backends.configparser import ConfigParserBackend
+from gpyconf.backends._dbm import DBMBackend
+
+SIZES = (1000, 10000, 100000)
+LOOKUPS = 10
+
+
+def backref():
+    return 'BenchmarkConf'
+
+
+def remove_files():
+    for filename in glob.glob('benchmark_conf.*'):
+        os.remove(filename)
+
+
+def fill(backend, size):
+    backend.read()
+    for i in xrange(size):
+        backend.set_option('option%d' % i, u'value %d' % i)
+    backend.save()
+
+
+def configuration(cls, size):
+    attrs = {'backend': cls}
+    for i in xrange(size):
+        attrs['option%d' % i] = gpyconf.fields.CharField()
+    # (named like `backref` returns, so the same files are used)
+    return type('BenchmarkConf', (gpyconf.Configuration,), attrs)
+
+
+def measure(func):
+    filebased.parsed_file_cache.clear()
+    # (closes databases still open)
+    gc.collect()
+    start = time()
+    func()
+    return (time() - start) * 1000
+
+
+def run(cls, size):
+    remove_files()
+    fill(cls(backref), size)
+    names = ['option%d' % (i * size // LOOKUPS) for i in xrange(LOOKUPS)]
+
+    conf_class = configuration(cls, size)
+
+    def startup():
+        conf = conf_class()
+        for name in names:
+            getattr(conf, name)
+
+    def save():
+        conf = conf_class()
+        setattr(conf, names[0], u'changed')
+        conf.save()
+
+    def iterate():
+        backend = cls(backref)
+        backend.read()
+        for item in backend.tree.iteritems():
+            pass
+
+    timings = [measure(startup), measure(save), measure(iterate)]
+    remove_files()
+    return timings
+
+
+if __name__ == '__main__':
+    backend = DBMBackend(backref)
+    fill(backend, 1)
+    backend.close()
+    print 'anydbm implementation: %s' % whichdb.whichdb('benchmark_conf.db')
+    remove_files()
+    print '%-8s %-20s %12s %12s %12s' % ('options', 'backend', 'start-up',
+                                         'save one', 'iterate')
+    for size in SIZES:
+        for cls in (ConfigParserBackend, DBMBackend):
+            print '%-8d %-20s %10.1fms %10.1fms %10.1fms' % (
+                (size, cls.__name__) + tuple(run(cls, size)))
@@ -0,0 +1,41 @@
+# Measures how long constructing the GTK configuration dialog takes depending
+# on the number of fields, for the first dialog (reading the interface
+# definitions) and for later ones (building from the cached definitions).
+from time import time
+import gpyconf
+from gpyconf.backends.dummy import DummyBackend
+from gpyconf.frontends import gtk
+from gpyconf.frontends.gtk import utils
+
+SIZES = (10, 100, 300, 1000)
+SECTIONS = 5
+REPEAT = 3
+
+
+def configuration(size):
+    attrs = {'backend': DummyBackend, 'frontend': gtk.ConfigurationDialog}
+    for i in xrange(size):
+        attrs['field%d' % i] = gpyconf.fields.CharField(
+            label='Field %d' % i,
+            section='Section %d' % (i % SECTIONS),
+            group='Group %d' % (i % (SECTIONS * 2))
+        )
+    return type('BenchmarkConf%d' % size, (gpyconf.Configuration,), attrs)
+
+
+def measure(cls, cold):
+    if cold:
+        utils._interfaces.clear()
+    conf = cls()
+    start = time()
+    conf.get_frontend()
+    return (time() - start) * 1000
+
+
+if __name__ == '__main__':
+    print '%-8s %12s %12s' % ('fields', 'first', 'later')
+    for size in SIZES:
+        cls = configuration(size)
+        first = measure(cls, cold=True)
+        later = min(measure(cls, cold=False) for i in xrange(REPEAT))
+        print '%-8d %10.1fms %10.1fms' % (size, first, later)
@@ -0,0 +1,27 @@
+# Measures signal emit throughput depending on the number of listeners.
+from timeit import Timer
+
+NUMBER = 20000
+LISTENERS = (0, 1, 10, 100)
+SETUP = '''
+from gpyconf.mvc import MVCComponent
+
+class Component(MVCComponent):
+    __events__ = ('foo', 'bar', 'baz', 'value-changed')
+
+def callback(sender, value):
+    pass
+
+component = Component()
+component.connect('foo', callback) # allocate the event register
+for i in xrange(%d):
+    component.connect('value-changed', callback, lazy=i %% 10 == 9)
+'''
+
+
+if __name__ == '__main__':
+    print '%-10s %14s' % ('listeners', 'emits/s')
+    for listeners in LISTENERS:
+        timer = Timer("component.emit('value-changed', 42)", SETUP % listeners)
+        seconds = min(timer.repeat(3, NUMBER))
+        print '%-10d %14.0f' % (listeners, NUMBER / seconds)
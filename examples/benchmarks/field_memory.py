@@ -0,0 +1,66 @@
+# Reports the memory used per field instance, next to that of the layout
+# before fields were slotted.
+#
+# (`tracemalloc` isn't available for Python 2, so this sums up the sizes of
+# all objects that are only reachable through a field instance.)
+import gc
+import sys
+from types import ModuleType, FunctionType, BuiltinFunctionType
+import gpyconf
+
+NUMBER = 1000
+FIELD_TYPES = (
+    (gpyconf.fields.CharField, dict(label='Label')),
+    (gpyconf.fields.IntegerField, dict(min=1, max=10)),
+    (gpyconf.fields.ListField, dict(item_type=int)),
+    (gpyconf.fields.MultiOptionField, dict(options=(('a', 'A'), ('b', 'B')))),
+)
+# bytes/field measured by this script before fields were slotted and
+# allocated their event registers lazily (CPython 2.7.18, 64 bit)
+BEFORE = {
+    'CharField' : 3250,
+    'IntegerField' : 3335,
+    'ListField' : 3416,
+    'MultiOptionField' : 4870,
+}
+SHARED_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType)
+
+
+def private_size(obj, shared):
+    """
+    Returns the size of ``obj`` and of all objects reachable from it that are
+    not in ``shared`` (the objects reachable without any field instances).
+    """
+    seen = set(shared)
+    size = 0
+    pending = [obj]
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen or isinstance(obj, SHARED_TYPES):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        pending.extend(gc.get_referents(obj))
+    return size
+
+
+def shared_objects():
+    return set(id(obj) for obj in gc.get_objects()) | \
+           set(id(obj) for module in sys.modules.values() if module
+               for obj in vars(module).values())
+
+
+def measure(cls, kwargs):
+    """ Returns the bytes per field of ``cls`` instances """
+    gc.collect()
+    shared = shared_objects()
+    instances = [cls(**kwargs) for i in xrange(NUMBER)]
+    total = sum(private_size(field, shared) for field in instances)
+    return float(total) / NUMBER
+
+
+if __name__ == '__main__':
+    print '%-20s %14s %14s' % ('bytes/field', 'before', 'now')
+    for cls, kwargs in FIELD_TYPES:
+        print '%-20s %14d %14.0f' % (cls.__name__, BEFORE[cls.__name__],
+                                     measure(cls, kwargs))
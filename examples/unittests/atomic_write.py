@@ -0,0 +1,81 @@
+# Tests FileBasedBackend.write_file.
+import os
+import unittest
+import gpyconf
+from gpyconf.backends import filebased
+from gpyconf.backends._json import JSONBackend
+
+
+class AtomicWriteTestConf(gpyconf.Configuration):
+    foo = gpyconf.fields.IntegerField(default=42)
+
+
+class JSONAtomicWriteTestConf(AtomicWriteTestConf):
+    backend = JSONBackend
+
+
+class AtomicWriteTestCase(unittest.TestCase):
+    conf = AtomicWriteTestConf
+
+    def setUp(self):
+        self.conf_instance = self.conf()
+        self.backend = self.conf_instance.backend_instance
+        self.file = self.backend.file
+
+    def tearDown(self):
+        os.remove(self.file)
+
+    def assertNoTempFiles(self):
+        directory = os.path.dirname(os.path.abspath(self.file))
+        self.assertEqual([name for name in os.listdir(directory)
+                          if name.endswith('.tmp')], [])
+
+    def test_write(self):
+        self.conf_instance.foo = 1
+        self.conf_instance.save()
+        self.assertEqual(self.conf().foo, 1)
+        self.assertNoTempFiles()
+
+    def test_skip_identical(self):
+        self.conf_instance.foo = 1
+        self.conf_instance.save()
+        count = self.backend.write_count
+        self.backend.save()
+        self.assertEqual(self.backend.write_count, count)
+        # a new backend compares with the file's content
+        backend = self.conf().backend_instance
+        backend.save()
+        self.assertEqual(backend.write_count, 0)
+
+    def test_fsync(self):
+        for fsync in ('file', 'file+dir'):
+            self.backend.fsync = fsync
+            self.conf_instance.foo += 1
+            self.conf_instance.save()
+            self.assertEqual(self.conf().foo, self.conf_instance.foo)
+
+    def test_keeps_mode(self):
+        os.chmod(self.file, 0600)
+        self.conf_instance.foo = 1
+        self.conf_instance.save()
+        self.assertEqual(os.stat(self.file).st_mode & 0777, 0600)
+
+    def test_failed_write(self):
+        def fail(source, destination):
+            raise OSError("Replacing failed")
+        self.conf_instance.foo = 1
+        replace, filebased._replace = filebased._replace, fail
+        try:
+            self.assertRaises(OSError, self.conf_instance.save)
+        finally:
+            filebased._replace = replace
+        self.assertEqual(self.conf().foo, 42)
+        self.assertNoTempFiles()
+
+
+class JSONAtomicWriteTestCase(AtomicWriteTestCase):
+    conf = JSONAtomicWriteTestConf
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+# Round-trip tests run against all backends that don't need
+# third-party modules.
+import gc
+import os
+import shutil
+import glob
+import unittest
+import gpyconf
+from gpyconf.backends.configparser import ConfigParserBackend
+from gpyconf.backends._json import JSONBackend
+from gpyconf.backends.sqlite import SQLiteBackend
+from gpyconf.backends._dbm import DBMBackend
+from gpyconf.backends.journal import JournalBackend
+from gpyconf.backends.binary import MappedBackend
+from gpyconf.backends.sharded import ShardedBackend
+
+
+class RoundTripConf(gpyconf.Configuration):
+    integer = gpyconf.fields.IntegerField(default=42)
+    float = gpyconf.fields.FloatField(default=1.5, section='Numbers')
+    boolean = gpyconf.fields.BooleanField(default=False, section='Other')
+    char = gpyconf.fields.CharField()
+    list = gpyconf.fields.ListField(default=['a'])
+
+
+VALUES = {
+    'integer': 7,
+    'float': 2.25,
+    'boolean': True,
+    'char': 'some text',
+    'list': ['x', 'y'],
+}
+
+
+class RoundTripTestCase(unittest.TestCase):
+    backend = ConfigParserBackend
+
+    def conf(self, read=True):
+        return RoundTripConf(backend=self.backend, read=read)
+
+    def tearDown(self):
+        # (closes dbm databases, they are written when closed)
+        gc.collect()
+        backend = self.conf(read=False).backend_instance
+        if isinstance(backend, ShardedBackend):
+            shutil.rmtree(backend.directory)
+            return
+        for filename in glob.glob(backend.file + '*'):
+            os.remove(filename)
+
+    def assertValues(self, conf, values):
+        self.assertEqual(dict((name, getattr(conf, name)) for name in values),
+                         values)
+
+    def test_defaults(self):
+        conf = self.conf()
+        self.assertValues(conf, dict((name, field.default) for name, field
+                                     in RoundTripConf.fields.iteritems()))
+
+    def test_round_trip(self):
+        conf = self.conf()
+        conf.update(VALUES)
+        conf.save()
+        self.assertValues(self.conf(), VALUES)
+
+    def test_change(self):
+        conf = self.conf()
+        conf.update(VALUES)
+        conf.save()
+        conf.integer = 8
+        conf.save()
+        self.assertValues(self.conf(), dict(VALUES, integer=8))
+
+    def test_remove(self):
+        conf = self.conf()
+        conf.update(VALUES)
+        conf.save()
+        conf.fields.char.reset_value()
+        conf.save()
+        conf = self.conf()
+        self.assertEqual(conf.char, '')
+        self.assert_('char' not in conf.backend_instance.options)
+
+    def test_reset(self):
+        conf = self.conf()
+        conf.update(VALUES)
+        conf.save()
+        conf.reset()
+        self.assertEqual(self.conf().integer, 42)
+
+
+class JSONRoundTripTestCase(RoundTripTestCase):
+    backend = JSONBackend
+
+class SQLiteRoundTripTestCase(RoundTripTestCase):
+    backend = SQLiteBackend
+
+class DBMRoundTripTestCase(RoundTripTestCase):
+    backend = DBMBackend
+
+class JournalRoundTripTestCase(RoundTripTestCase):
+    backend = JournalBackend
+
+class MappedRoundTripTestCase(RoundTripTestCase):
+    backend = MappedBackend
+
+class ShardedRoundTripTestCase(RoundTripTestCase):
+    backend = ShardedBackend
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+# Tests batch updates and the `fields-changed` signal.
+import unittest
+import gpyconf
+from gpyconf.backends.dummy import DummyBackend
+from gpyconf._internal.exceptions import InvalidOptionError
+
+
+class BatchTestConf(gpyconf.Configuration):
+    backend = DummyBackend
+    a = gpyconf.fields.IntegerField(default=1)
+    b = gpyconf.fields.IntegerField(default=2)
+    c = gpyconf.fields.CharField()
+
+
+class BatchTestCase(unittest.TestCase):
+    def setUp(self):
+        self.conf = BatchTestConf(read=False)
+        self.single, self.batches = [], []
+        self.conf.connect('field-value-changed',
+                          lambda sender, *args: self.single.append(args))
+        self.conf.connect('fields-changed',
+                          lambda sender, names: self.batches.append(names))
+
+    def test_batch(self):
+        with self.conf.batch():
+            self.conf.c = 'foo'
+            self.conf.a = 10
+            self.conf.b = 3
+            self.conf.b = 2 # back to the old value
+            self.assertEqual(self.conf.a, 10)
+        self.assertEqual(self.single, [])
+        self.assertEqual(self.batches, [['a', 'c']])
+
+    def test_update(self):
+        self.conf.update({'a': 5}, c='bar')
+        self.assertEqual((self.conf.a, self.conf.c), (5, 'bar'))
+        self.assertEqual(self.batches, [['a', 'c']])
+        self.assertRaises(AttributeError, self.conf.update, nofield=1)
+
+    def test_rollback(self):
+        self.conf.a = 50
+        self.single = []
+        # `b` is invalid (max is 100)
+        self.assertRaises(InvalidOptionError, self.conf.update, a=10, b=1000)
+        self.assertEqual((self.conf.a, self.conf.b), (50, 2))
+        self.assertEqual(self.single, [])
+        self.assertEqual(self.batches, [])
+
+        try:
+            with self.conf.batch():
+                self.conf.a = 20
+                self.conf.b = 'not a number'
+        except InvalidOptionError:
+            pass
+        self.assertEqual((self.conf.a, self.conf.b), (50, 2))
+
+    def test_nested(self):
+        with self.conf.batch():
+            self.conf.a = 7
+            with self.conf.batch():
+                self.conf.b = 8
+            self.assertEqual(self.batches, [])
+        self.assertEqual(self.batches, [['a', 'b']])
+
+
+if __name__ == '__main__':
+    unittest.main()
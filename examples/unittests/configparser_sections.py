@@ -0,0 +1,103 @@
+# Tests storing fields' sections as INI sections.
+import os
+import unittest
+import gpyconf
+
+
+class SectionsTestConf(gpyconf.Configuration):
+    foo = gpyconf.fields.IntegerField(default=42)
+    bar = gpyconf.fields.CharField(section='Text')
+    baz = gpyconf.fields.CharField(section='Text')
+    flag = gpyconf.fields.BooleanField(section='Other')
+
+
+class ConfigParserSectionsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.file = SectionsTestConf(read=False).backend_instance.file
+
+    def tearDown(self):
+        os.remove(self.file)
+
+    def read_file(self):
+        with open(self.file) as fobj:
+            return fobj.read()
+
+    def read_sections(self):
+        return sorted(self.read_file().split('\n\n'))
+
+    def test_sections(self):
+        conf = SectionsTestConf()
+        conf.update(foo=1, bar='bar', flag=True)
+        conf.save()
+        self.assertEqual(self.read_sections(), ['', '[Other]\nflag = 1',
+            '[Text]\nbar = bar', '[default_section]\nfoo = 1'])
+        conf = SectionsTestConf()
+        self.assertEqual((conf.foo, conf.bar, conf.flag), (1, 'bar', True))
+
+    def test_read_by_section(self):
+        conf = SectionsTestConf()
+        conf.bar = 'bar'
+        conf.save()
+        conf = SectionsTestConf()
+        self.assertEqual(conf._pending_sections, set([None, 'Text', 'Other']))
+        self.assertEqual(conf.baz, '')
+        self.assertEqual(conf._pending_sections, set([None, 'Other']))
+        self.assertEqual(conf.bar, 'bar')
+
+    def test_read_section_after_set(self):
+        conf = SectionsTestConf()
+        backend = conf.backend_instance
+        backend.set_option('bar', u'set')
+        backend.set_option('foo', u'2')
+        self.assertEqual(backend.read_section('Text'), {'bar': u'set'})
+        self.assertEqual(backend.read_section(None), {'foo': u'2'})
+        backend.remove_option('bar')
+        self.assertEqual(backend.read_section('Text'), {})
+
+    def test_non_editable_field_in_section(self):
+        conf = SectionsTestConf()
+        conf.update(bar='bar', baz='baz')
+        conf.save()
+        field = SectionsTestConf.fields['bar']
+        field.editable = False
+        try:
+            conf = SectionsTestConf()
+            self.assertEqual(conf.baz, 'baz')
+            self.assertEqual(conf.bar, 'bar')
+        finally:
+            field.editable = True
+
+    def test_legacy_file(self):
+        with open(self.file, 'w') as fobj:
+            fobj.write('[default_section]\nfoo = 1\nbar = old\nunknown = x\n')
+        conf = SectionsTestConf()
+        self.assertEqual((conf.foo, conf.bar), (1, 'old'))
+        conf.bar = 'new'
+        conf.save()
+        self.assertEqual(self.read_file(),
+            '[default_section]\nfoo = 1\nunknown = x\n\n'
+            '[Text]\nbar = new\n\n')
+
+    def test_defaults_section(self):
+        with open(self.file, 'w') as fobj:
+            fobj.write('[DEFAULT]\nbar = default\n\n'
+                       '[Text]\nbaz = %(bar)s baz\n\n')
+        conf = SectionsTestConf()
+        self.assertEqual((conf.bar, conf.baz), ('default', 'default baz'))
+        conf.foo = 1
+        conf.save()
+        self.assertEqual(self.read_file(),
+            '[DEFAULT]\nbar = default\n\n[Text]\nbaz = %(bar)s baz\n\n'
+            '[default_section]\nfoo = 1\n\n')
+
+    def test_empty_sections_removed(self):
+        conf = SectionsTestConf()
+        conf.flag = True
+        conf.save()
+        conf.fields.flag.reset_value()
+        conf.save()
+        self.assertEqual(self.read_file(), '[default_section]\n\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
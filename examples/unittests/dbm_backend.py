@@ -0,0 +1,107 @@
+# Tests the anydbm based backend.
+import gc
+import os
+import glob
+import unittest
+import gpyconf
+from gpyconf.backends._dbm import DBMBackend, close_all
+
+
+class DBMTestConf(gpyconf.Configuration):
+    backend = DBMBackend
+    foo = gpyconf.fields.IntegerField(default=42)
+    bar = gpyconf.fields.CharField()
+    baz = gpyconf.fields.ListField(default=['a'])
+
+
+class DBMTestCase(unittest.TestCase):
+    def tearDown(self):
+        # (closes the databases, they are written when closed)
+        gc.collect()
+        for filename in glob.glob('dbmtest_conf.db*'):
+            os.remove(filename)
+
+    def test_save_and_read(self):
+        conf = DBMTestConf()
+        conf.foo = 7
+        conf.bar = u'\xe4\xf6\xfc'
+        conf.baz = ['x', 'y']
+        conf.save()
+        conf = DBMTestConf()
+        self.assertEqual((conf.foo, conf.bar, conf.baz),
+                         (7, u'\xe4\xf6\xfc', ['x', 'y']))
+
+    def test_tree(self):
+        conf = DBMTestConf()
+        conf.foo = 7
+        conf.save()
+        tree = conf.backend_instance.tree
+        self.assertEqual(dict(tree), {'foo': '7'})
+        self.assert_('foo' in tree and 'bar' not in tree)
+        self.assertEqual(tree.get('bar', 'default'), 'default')
+
+    def test_read_on_access(self):
+        conf = DBMTestConf()
+        conf.update(foo=7, bar='text')
+        conf.save()
+        looked_up = []
+        get_option = DBMBackend.get_option
+        def recording_get_option(backend, name, *args):
+            looked_up.append(name)
+            return get_option(backend, name, *args)
+        DBMBackend.get_option = recording_get_option
+        try:
+            conf = DBMTestConf()
+            self.assertEqual(looked_up, [])
+            self.assertEqual(conf.foo, 7)
+            self.assertEqual(looked_up, ['foo'])
+            self.assertEqual(conf.fields.bar.value, 'text')
+            conf.foo = 8
+            conf.save()
+            self.assertEqual(looked_up, ['foo', 'bar'])
+        finally:
+            DBMBackend.get_option = get_option
+        self.assertEqual((DBMTestConf().foo, DBMTestConf().baz), (8, ['a']))
+
+    def test_reload(self):
+        # (a new dumbdbm database writes its index when closed, so the
+        # database is created first)
+        writer = DBMTestConf()
+        writer.bar = 'text'
+        writer.save()
+        conf = DBMTestConf()
+        self.assertEqual(conf.foo, 42)
+        writer.foo = 9
+        writer.save()
+        conf.reload()
+        self.assertEqual(conf.foo, 9)
+
+    def test_close(self):
+        conf = DBMTestConf()
+        conf.foo = 7
+        conf.save(save=False)
+        backend = conf.backend_instance
+        close_all()
+        self.assertEqual(backend.db, None)
+        # (changes are written when closing)
+        self.assertEqual(DBMTestConf().foo, 7)
+        backend.read()
+        self.assertEqual(backend.get_option('foo'), '7')
+        backend.close()
+        self.assertEqual(backend.db, None)
+
+    def test_remove_and_reset(self):
+        conf = DBMTestConf()
+        conf.foo = 7
+        conf.bar = 'text'
+        conf.save()
+        conf.fields.foo.reset_value()
+        conf.save()
+        self.assertEqual(conf.backend_instance.options, ['bar'])
+        conf.reset()
+        self.assertEqual(conf.backend_instance.options, [])
+        self.assertEqual(DBMTestConf().bar, '')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,10 @@
 # Tests wether all fields handle default values correctly.
 
+import time
 import unittest
+from datetime import datetime
 import gpyconf
+from gpyconf.backends.dummy import DummyBackend
 
 class DefaultTestConf(gpyconf.Configuration):
     foo = gpyconf.fields.BooleanField(default=True)
@@ -40,5 +43,63 @@ class DefaultTest(unittest.TestCase):
             self.conf.reset()
             self.runTest(new=False)
 
+
+class CountingListField(gpyconf.fields.ListField):
+    calls = 0
+    def custom_default(self):
+        CountingListField.calls += 1
+        return ['x']
+
+class ResolvedDefaultsTestConf(gpyconf.Configuration):
+    backend = DummyBackend
+    list_ = CountingListField()
+    dict_ = gpyconf.fields.DictField(default={'a': 1})
+    nested = gpyconf.fields.DictField(keys=['a'], default={'a': [1]})
+    date = gpyconf.fields.DateTimeField()
+    fixed_date = gpyconf.fields.DateTimeField(default=datetime(2010, 1, 1))
+
+
+class ResolvedDefaultsTest(unittest.TestCase):
+    def test_resolved_once(self):
+        calls = CountingListField.calls
+        for i in xrange(3):
+            conf = ResolvedDefaultsTestConf(read=False)
+            self.assertEqual(conf.list_, ['x'])
+            conf.fields.list_.reset_value()
+        self.assertEqual(CountingListField.calls, calls)
+
+    def test_mutable_defaults_copied(self):
+        conf1 = ResolvedDefaultsTestConf(read=False)
+        conf2 = ResolvedDefaultsTestConf(read=False)
+        conf1.list_.append('y')
+        conf1.fields.dict_.value['b'] = 2
+        self.assertEqual(conf2.list_, ['x'])
+        self.assertEqual(conf2.dict_, {'a': 1})
+        self.assertEqual(ResolvedDefaultsTestConf.fields.list_.default, ['x'])
+        self.assertEqual(ResolvedDefaultsTestConf.fields.dict_.default, {'a': 1})
+
+    def test_nested_defaults_copied(self):
+        field = ResolvedDefaultsTestConf.fields.nested
+        conf1 = ResolvedDefaultsTestConf(read=False)
+        conf2 = ResolvedDefaultsTestConf(read=False)
+        conf1.nested['a'].append(9)
+        self.assertEqual(conf2.nested, {'a': [1]})
+        self.assertEqual(field.default, {'a': [1]})
+        field.get_default()['a'].append(9)
+        self.assertEqual(field.default, {'a': [1]})
+        # (values merged with the default)
+        conf1.nested = {}
+        conf1.nested['a'].append(9)
+        self.assertEqual(field.default, {'a': [1]})
+
+    def test_dynamic_default(self):
+        field = ResolvedDefaultsTestConf.fields.date
+        first = field.get_default()
+        time.sleep(1.1)
+        self.assert_(field.get_default() > first)
+        self.assertEqual(ResolvedDefaultsTestConf.fields.fixed_date.get_default(),
+                         datetime(2010, 1, 1))
+
+
 if __name__ == '__main__':
     unittest.main()
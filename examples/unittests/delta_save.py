@@ -0,0 +1,144 @@
+# Tests that only changed fields are passed to the backend when saving.
+import unittest
+import gpyconf
+from gpyconf.backends import Backend
+
+
+class RecordingBackend(Backend):
+    """ Backend that only implements `set_option` and `remove_option` """
+    def __init__(self, backref):
+        Backend.__init__(self, backref)
+        self.stored = {}
+        self.set_calls = []
+        self.saves = 0
+
+    def read(self):
+        pass
+
+    def save(self):
+        self.saves += 1
+
+    def set_option(self, name, value):
+        self.set_calls.append(name)
+        self.stored[name] = value
+
+    def remove_option(self, name):
+        self.stored.pop(name, None)
+
+    @property
+    def tree(self):
+        return self.stored
+
+
+class SetOnlyBackend(RecordingBackend):
+    """ Backend that can't remove options """
+    remove_option = Backend.remove_option
+
+
+class DeltaBackend(RecordingBackend):
+    def apply_changes(self, changed, removed):
+        self.deltas.append((changed, sorted(removed)))
+
+    def read(self):
+        self.deltas = []
+
+
+class DeltaTestConf(gpyconf.Configuration):
+    backend = RecordingBackend
+    a = gpyconf.fields.IntegerField(default=1)
+    b = gpyconf.fields.IntegerField(default=2)
+    c = gpyconf.fields.IntegerField(default=3)
+
+
+class MutableTestConf(gpyconf.Configuration):
+    backend = RecordingBackend
+    items = gpyconf.fields.ListField()
+    opts = gpyconf.fields.DictField()
+
+
+class DeltaSaveTestCase(unittest.TestCase):
+    def test_fallback_to_set_option(self):
+        conf = DeltaTestConf()
+        conf.b = 20
+        conf.save()
+        self.assertEqual(conf.backend_instance.set_calls, ['b'])
+        self.assertEqual(conf.backend_instance.stored, {'b': 20})
+        self.assertEqual(conf.backend_instance.saves, 1)
+
+        # nothing changed, nothing to store
+        conf.save()
+        self.assertEqual(conf.backend_instance.set_calls, ['b'])
+        self.assertEqual(conf.backend_instance.saves, 1)
+
+        conf.fields.b.reset_value()
+        conf.save()
+        self.assertEqual(conf.backend_instance.stored, {})
+
+    def test_fallback_without_remove_option(self):
+        conf = DeltaTestConf(backend=SetOnlyBackend)
+        conf.b = 20
+        conf.save()
+        conf.fields.b.reset_value()
+        conf.save()
+        self.assertEqual(conf.backend_instance.stored, {'b': 2})
+
+    def test_apply_changes(self):
+        conf = DeltaTestConf(backend=DeltaBackend)
+        conf.a = 10
+        conf.c = 30
+        conf.fields.b.reset_value()
+        conf.save()
+        self.assertEqual(conf.backend_instance.deltas,
+                         [({'a': 10, 'c': 30}, ['b'])])
+        self.assertEqual(conf.backend_instance.set_calls, [])
+
+    def test_only_changed_fields_validated(self):
+        conf = DeltaTestConf()
+        conf.a = 1000 # invalid (max is 100)
+        self.assertRaises(gpyconf.exceptions.InvalidOptionError, conf.save)
+        conf.a = 5
+        conf.save()
+        self.assertEqual(conf.backend_instance.stored, {'a': 5})
+
+    def test_read_values_are_clean(self):
+        conf = DeltaTestConf(read=False)
+        conf.backend_instance.stored = {'a': 7}
+        conf.read()
+        self.assertEqual(conf.a, 7)
+        conf.save()
+        self.assertEqual(conf.backend_instance.set_calls, [])
+
+    def test_changed_in_place(self):
+        conf = MutableTestConf()
+        conf.items.append('b')
+        conf.opts['k'] = 'v'
+        conf.save()
+        self.assertEqual(conf.backend_instance.stored,
+                         {'items': ['b'], 'opts': {'k': 'v'}})
+
+        # (the stored values are copies, so changes are found again)
+        conf.items.append('c')
+        conf.save()
+        self.assertEqual(conf.backend_instance.set_calls,
+                         ['items', 'opts', 'items'])
+        self.assertEqual(conf.backend_instance.stored['items'], ['b', 'c'])
+
+        # handing out values doesn't change them
+        conf.items, conf.opts
+        conf.save()
+        self.assertEqual(conf.backend_instance.saves, 2)
+
+    def test_read_values_changed_in_place(self):
+        conf = MutableTestConf(read=False)
+        conf.backend_instance.stored = {'items': ['a']}
+        conf.read()
+        conf.save()
+        self.assertEqual(conf.backend_instance.set_calls, [])
+        conf.items.append('b')
+        conf.save()
+        self.assertEqual(conf.backend_instance.set_calls, ['items'])
+        self.assertEqual(conf.backend_instance.stored['items'], ['a', 'b'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+# Tests signal dispatching (callback order, lazy callbacks, 'all' listeners).
+import unittest
+from gpyconf.events import EventRegister, InvalidEvent
+from gpyconf.mvc import MVCComponent
+
+
+class Component(MVCComponent):
+    __events__ = ('foo', 'bar')
+
+
+class DispatchTestCase(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.component = Component()
+
+    def callback(self, name):
+        return lambda *args: self.calls.append((name,) + args[1:])
+
+    def all_callback(self, name):
+        # 'all' callbacks get the event name before the sender
+        return lambda event, sender, *args: \
+            self.calls.append((name, event) + args)
+
+    def test_order(self):
+        connect = self.component.connect
+        connect('foo', self.callback('lazy'), lazy=True)
+        connect('foo', self.callback('first'))
+        connect('all', self.all_callback('all-lazy'), lazy=True)
+        connect('all', self.all_callback('all'))
+        connect('foo', self.callback('second'))
+        self.component.emit('foo', 42)
+        self.assertEqual(self.calls, [('first', 42), ('second', 42),
+            ('all', 'foo', 42), ('lazy', 42), ('all-lazy', 'foo', 42)])
+
+    def test_connect_after_emit(self):
+        self.component.connect('foo', self.callback('first'))
+        self.component.emit('foo', 1)
+        self.component.emit('bar', 1)
+        self.component.connect('foo', self.callback('second'))
+        self.component.connect('bar', self.callback('third'))
+        self.component.emit('foo', 2)
+        self.component.emit('bar', 3)
+        self.assertEqual(self.calls, [('first', 1), ('first', 2),
+                                      ('second', 2), ('third', 3)])
+
+    def test_strict(self):
+        self.component.connect('foo', self.callback('first'))
+        self.assertRaises(InvalidEvent, self.component.emit, 'baz')
+        self.assertRaises(InvalidEvent, self.component.connect, 'baz', None)
+        self.component.add_event('baz')
+        self.component.connect('baz', self.callback('baz'))
+        self.component.emit('baz')
+        self.assertEqual(self.calls, [('baz',)])
+
+    def test_strict_without_listeners(self):
+        # (checked against the cached set of the class' events)
+        self.component.emit('foo')
+        self.component.emit('log', 'message')
+        self.assertRaises(InvalidEvent, self.component.emit, 'baz')
+        self.assertEqual(Component._class_events(),
+                         frozenset(['foo', 'bar', 'log']))
+
+    def test_non_strict(self):
+        events = EventRegister()
+        events.emit('anything')
+        events.register_event('anything', self.calls.append)
+        events.emit('anything', 42)
+        self.assertEqual(self.calls, [42])
+
+    def test_disconnect(self):
+        first = self.component.connect('foo', self.callback('first'))
+        all_id = self.component.connect('all', self.all_callback('all'))
+        self.component.emit('foo', 1)
+        self.component.disconnect(first)
+        self.component.disconnect(all_id)
+        self.component.emit('foo', 2)
+        self.assertEqual(self.calls, [('first', 1), ('all', 'foo', 1)])
+        self.assertFalse(self.component.handler_is_connected(first))
+        self.assertRaises(KeyError, self.component.disconnect, first)
+
+    def test_block(self):
+        handler_id = self.component.connect('foo', self.callback('first'))
+        self.component.handler_block(handler_id)
+        self.component.emit('foo', 1)
+        self.component.handler_unblock(handler_id)
+        self.component.emit('foo', 2)
+        self.assertEqual(self.calls, [('first', 2)])
+
+    def test_weak(self):
+        class Listener(object):
+            def callback(listener, sender, value):
+                self.calls.append(value)
+        listener = Listener()
+        handler_id = self.component.connect('foo', listener.callback, weak=True)
+        self.component.emit('foo', 1)
+        del listener
+        self.assertFalse(self.component.handler_is_connected(handler_id))
+        self.component.emit('foo', 2)
+        self.assertEqual(self.calls, [1])
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+# Tests the process-wide cache of parsed configuration files.
+import os
+import unittest
+import gpyconf
+from gpyconf.backends.filebased import ParsedFileCache, parsed_file_cache
+from gpyconf.backends._json import JSONBackend
+
+
+class CacheTestConf(gpyconf.Configuration):
+    foo = gpyconf.fields.IntegerField(default=42)
+    bar = gpyconf.fields.ListField(default=[1, 2])
+
+
+class JSONCacheTestConf(CacheTestConf):
+    backend = JSONBackend
+
+
+class ParsedFileCacheTestCase(unittest.TestCase):
+    conf = CacheTestConf
+
+    def setUp(self):
+        conf = self.conf()
+        conf.foo = 1
+        conf.save()
+        self.file = conf.backend_instance.file
+        parsed_file_cache.clear()
+
+    def tearDown(self):
+        os.remove(self.file)
+
+    def test_hits(self):
+        for i in xrange(3):
+            self.assertEqual(self.conf().foo, 1)
+        self.assertEqual((parsed_file_cache.hits, parsed_file_cache.misses),
+                         (2, 1))
+
+    def test_copy_on_write(self):
+        conf = self.conf()
+        conf.foo = 2
+        conf.bar.append(3)
+        conf.save(save=False)
+        self.assertEqual((self.conf().foo, self.conf().bar), (1, [1, 2]))
+        self.assertEqual(parsed_file_cache.misses, 1)
+
+    def test_save_invalidates(self):
+        self.conf()
+        conf = self.conf()
+        conf.foo = 3
+        conf.save()
+        self.assertEqual(self.conf().foo, 3)
+        self.assertEqual((parsed_file_cache.hits, parsed_file_cache.misses),
+                         (1, 2))
+
+    def test_external_change(self):
+        self.conf()
+        conf = self.conf()
+        conf.foo = 99
+        conf.backend_instance.cache = None
+        conf.save()
+        self.assertEqual(self.conf().foo, 99)
+
+
+class JSONParsedFileCacheTestCase(ParsedFileCacheTestCase):
+    conf = JSONCacheTestConf
+
+
+class LRUTestCase(unittest.TestCase):
+    def test_eviction(self):
+        cache = ParsedFileCache(maxsize=2)
+        parse = lambda filename: filename
+        for filename in ('a', 'b', 'c'):
+            open(filename, 'w').close()
+        for filename in ('a', 'b', 'a', 'c', 'a', 'b'):
+            cache.get(filename, parse)
+        for filename in ('a', 'b', 'c'):
+            os.remove(filename)
+        # a, b, a (hit), c (evicts b), a (hit), b (evicts c)
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+
+
+if __name__ == '__main__':
+    unittest.main()
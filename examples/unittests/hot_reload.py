@@ -0,0 +1,130 @@
+# Tests reloading changed options and watching the backends' files.
+import gc
+import os
+import time
+import threading
+import unittest
+import gpyconf
+from gpyconf.backends.filebased import file_watcher
+from gpyconf.backends._json import JSONBackend
+from gpyconf.backends.python import PythonModuleBackend
+from gpyconf._internal.saver import write_behind_saver
+
+
+class HotReloadTestConf(gpyconf.Configuration):
+    foo = gpyconf.fields.IntegerField(default=42)
+    bar = gpyconf.fields.CharField(default='bar')
+    baz = gpyconf.fields.ListField(default=['x'])
+
+
+class JSONHotReloadTestConf(HotReloadTestConf):
+    backend = JSONBackend
+
+
+class PythonHotReloadTestConf(HotReloadTestConf):
+    backend = PythonModuleBackend
+
+
+class HotReloadTestCase(unittest.TestCase):
+    conf = HotReloadTestConf
+
+    def setUp(self):
+        writer = self.conf()
+        writer.foo = 1
+        writer.bar = 'a'
+        writer.save()
+        self.file = writer.backend_instance.file
+        self.conf_instance = self.conf(hot_reload=True)
+        # (sections not accessed yet are read when accessed, not reloaded)
+        for name in self.conf.fields:
+            getattr(self.conf_instance, name)
+        self.changes = []
+        self.conf_instance.connect('field-value-changed',
+            lambda sender, name, value: self.changes.append((name, value)))
+
+    def tearDown(self):
+        if self.conf_instance is not None:
+            file_watcher.unwatch(self.conf_instance)
+        os.remove(self.file)
+
+    def write(self, **values):
+        writer = self.conf()
+        writer.update(values)
+        writer.save()
+
+    def test_reload_changed_only(self):
+        self.write(foo=10, bar='a')
+        self.conf_instance.reload()
+        self.assertEqual(self.changes, [('foo', 10)])
+        self.assertEqual(self.conf_instance.bar, 'a')
+
+    def test_removed_option(self):
+        writer = self.conf()
+        writer.fields.bar.reset_value()
+        writer.save()
+        self.conf_instance.reload()
+        self.assertEqual(self.changes, [('bar', 'bar')])
+
+    def test_unsaved_changes_kept(self):
+        self.conf_instance.foo = 2
+        del self.changes[:]
+        self.write(foo=3, baz=['x', 'y'])
+        self.conf_instance.reload()
+        self.assertEqual(self.changes, [('baz', ['x', 'y'])])
+        self.assertEqual(self.conf_instance.foo, 2)
+        self.conf_instance.save()
+        self.assertEqual(self.conf().foo, 2)
+
+    def test_own_save(self):
+        self.conf_instance.bar = 'changed'
+        self.conf_instance.save()
+        del self.changes[:]
+        file_watcher.check()
+        self.assertEqual(self.changes, [])
+
+    def test_watcher(self):
+        self.assert_(file_watcher.is_watched(self.conf_instance))
+        self.write(foo=99)
+        file_watcher.check()
+        self.assertEqual(self.changes, [('foo', 99)])
+
+    def test_watcher_thread(self):
+        interval, file_watcher.interval = file_watcher.interval, 0.01
+        try:
+            self.write(bar='changed in the background')
+            for i in xrange(200):
+                if self.changes:
+                    break
+                time.sleep(0.01)
+        finally:
+            file_watcher.interval = interval
+        self.assertEqual(self.changes, [('bar', 'changed in the background')])
+
+    def test_reload_waits_for_save(self):
+        # (a reload from the watcher thread must not run while saving)
+        self.write(foo=5)
+        with write_behind_saver.write_lock:
+            thread = threading.Thread(target=self.conf_instance.reload)
+            thread.start()
+            thread.join(0.1)
+            self.assert_(thread.is_alive())
+            self.assertEqual(self.changes, [])
+        thread.join()
+        self.assertEqual(self.changes, [('foo', 5)])
+
+    def test_weak(self):
+        self.conf_instance = None
+        gc.collect()
+        self.assertEqual(len(file_watcher._watched), 0)
+
+
+class JSONHotReloadTestCase(HotReloadTestCase):
+    conf = JSONHotReloadTestConf
+
+
+class PythonHotReloadTestCase(HotReloadTestCase):
+    conf = PythonHotReloadTestConf
+
+
+if __name__ == '__main__':
+    unittest.main()
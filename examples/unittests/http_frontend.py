@@ -0,0 +1,157 @@
+# Tests the HTTP frontend using an in-process WSGI client.
+import json
+import httplib
+import threading
+import time
+import unittest
+from StringIO import StringIO
+from wsgiref.util import setup_testing_defaults
+import gpyconf
+from gpyconf.backends.dummy import DummyBackend
+from gpyconf.frontends.http import ConfigurationServer
+
+
+class HTTPTestConf(gpyconf.Configuration):
+    backend = DummyBackend
+    frontend = ConfigurationServer
+    foo = gpyconf.fields.IntegerField(default=42, label='Foo')
+    bar = gpyconf.fields.CharField(default='bar', section='Text', group='G')
+    secret = gpyconf.fields.CharField(hidden=True)
+    fixed = gpyconf.fields.CharField(editable=False)
+
+
+class Client(object):
+    """ Calls a WSGI application in-process """
+    def __init__(self, application):
+        self.application = application
+
+    def request(self, method, path, data=None, headers=()):
+        body = '' if data is None else json.dumps(data)
+        environ = {
+            'REQUEST_METHOD' : method,
+            'PATH_INFO' : path,
+            'CONTENT_LENGTH' : str(len(body)),
+            'wsgi.input' : StringIO(body),
+        }
+        environ.update(headers)
+        setup_testing_defaults(environ)
+        response = {}
+        def start_response(status, headers):
+            response['status'] = int(status.split()[0])
+            response['headers'] = dict(headers)
+        content = ''.join(self.application(environ, start_response))
+        data = json.loads(content) if content else None
+        return response['status'], response['headers'], data
+
+
+class HTTPFrontendTestCase(unittest.TestCase):
+    def setUp(self):
+        self.conf = HTTPTestConf()
+        self.server = self.conf.get_frontend()
+        self.client = Client(self.server.application)
+
+    def tearDown(self):
+        HTTPTestConf.fields['fixed'].editable = False
+
+    def test_schema(self):
+        status, headers, schema = self.client.request('GET', '/fields')
+        self.assertEqual(status, 200)
+        self.assertEqual([field['name'] for field in schema],
+                         ['foo', 'bar', 'secret', 'fixed'])
+        self.assertEqual(schema[0]['label'], 'Foo')
+        self.assertEqual(schema[0]['type'], 'IntegerField')
+        self.assertEqual((schema[1]['section'], schema[1]['group']),
+                         ('Text', 'G'))
+        self.assertTrue(schema[2]['hidden'])
+        self.assertFalse(schema[3]['editable'])
+
+    def test_values(self):
+        status, headers, values = self.client.request('GET', '/values')
+        self.assertEqual(status, 200)
+        self.assertEqual(values['foo'], 42)
+        self.assertEqual(values['bar'], 'bar')
+        self.assertFalse('secret' in values)
+
+    def test_conditional_get(self):
+        status, headers, values = self.client.request('GET', '/values')
+        etag = headers['ETag']
+        status, headers, values = self.client.request(
+            'GET', '/values', headers={'HTTP_IF_NONE_MATCH' : etag})
+        self.assertEqual(status, 304)
+        self.assertEqual(values, None)
+        self.conf.foo = 43
+        status, headers, values = self.client.request(
+            'GET', '/values', headers={'HTTP_IF_NONE_MATCH' : etag})
+        self.assertEqual(status, 200)
+        self.assertNotEqual(headers['ETag'], etag)
+        self.assertEqual(values['foo'], 43)
+
+    def test_conditional_get_schema(self):
+        etag = self.server.etag
+        HTTPTestConf.fields['fixed'].editable = True
+        status, headers, schema = self.client.request(
+            'GET', '/fields', headers={'HTTP_IF_NONE_MATCH' : etag})
+        self.assertEqual(status, 200)
+        self.assertTrue(schema[3]['editable'])
+
+    def test_patch(self):
+        changes = []
+        self.conf.connect('fields-changed',
+                          lambda sender, names: changes.append(names))
+        etag = self.server.etag
+        status, headers, values = self.client.request(
+            'PATCH', '/values', {'foo' : 7, 'bar' : 'baz'})
+        self.assertEqual(status, 200)
+        self.assertEqual((values['foo'], values['bar']), (7, 'baz'))
+        self.assertEqual((self.conf.foo, self.conf.bar), (7, 'baz'))
+        self.assertEqual(changes, [['foo', 'bar']])
+        self.assertNotEqual(headers['ETag'], etag)
+
+    def test_patch_invalid(self):
+        status, headers, data = self.client.request(
+            'PATCH', '/values', {'bar' : 'baz', 'foo' : 1000})
+        self.assertEqual(status, 400)
+        self.assertTrue('error' in data)
+        # (all or nothing)
+        self.assertEqual((self.conf.foo, self.conf.bar), (42, 'bar'))
+
+    def test_patch_forbidden(self):
+        for name in ('secret', 'fixed'):
+            status, headers, data = self.client.request(
+                'PATCH', '/values', {name : 'x'})
+            self.assertEqual(status, 403)
+        status, headers, data = self.client.request(
+            'PATCH', '/values', {'nonexistent' : 'x'})
+        self.assertEqual(status, 404)
+        status, headers, data = self.client.request('DELETE', '/values')
+        self.assertEqual(status, 405)
+
+    def test_save(self):
+        saved = []
+        self.conf.connect('pre-save', lambda sender: saved.append(True))
+        self.client.request('PATCH', '/values', {'foo' : 7})
+        status, headers, data = self.client.request('POST', '/save')
+        self.assertEqual(status, 200)
+        self.assertEqual(saved, [True])
+
+    def test_serve(self):
+        self.server.port = 0
+        thread = threading.Thread(target=self.server.run)
+        thread.start()
+        try:
+            while self.server.server is None:
+                time.sleep(0.01)
+            connection = httplib.HTTPConnection(
+                'localhost', self.server.server.server_port)
+            connection.request('GET', '/values')
+            response = connection.getresponse()
+            self.assertEqual(response.status, 200)
+            self.assertEqual(json.loads(response.read())['foo'], 42)
+            connection.close()
+        finally:
+            self.server.close()
+            thread.join()
+
+
+if __name__ == '__main__':
+    unittest.main()
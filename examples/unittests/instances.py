@@ -0,0 +1,60 @@
+# Tests that every configuration instance has its own field values.
+import unittest
+import gpyconf
+from gpyconf.backends.dummy import DummyBackend
+
+
+class InstancesTestConf(gpyconf.Configuration):
+    backend = DummyBackend
+    foo = gpyconf.fields.IntegerField(default=42)
+    bar = gpyconf.fields.ListField()
+
+
+class InstancesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.conf1 = InstancesTestConf(read=False)
+        self.conf2 = InstancesTestConf(read=False)
+
+    def test_values_are_per_instance(self):
+        self.conf1.foo = 1
+        self.assertEqual(self.conf1.foo, 1)
+        self.assertEqual(self.conf2.foo, 42)
+        self.assertEqual(self.conf1.fields.foo.value, 1)
+        self.assertEqual(self.conf2.fields['foo'].value, 42)
+
+        self.conf2.fields.foo.value = 2
+        self.assertEqual(self.conf1.foo, 1)
+        self.assertEqual(self.conf2.foo, 2)
+
+    def test_mutable_defaults_not_shared(self):
+        self.conf1.bar.append(1)
+        self.assertEqual(self.conf2.bar, [])
+
+    def test_fields_are_shared(self):
+        self.assert_(self.conf1.fields.foo.field is InstancesTestConf.fields.foo)
+        self.assert_(self.conf2.fields.foo.field is InstancesTestConf.fields.foo)
+
+    def test_only_owner_notified(self):
+        changes1, changes2 = [], []
+        self.conf1.connect('field-value-changed',
+                           lambda sender, *args: changes1.append(args))
+        self.conf2.connect('field-value-changed',
+                           lambda sender, *args: changes2.append(args))
+        self.conf1.foo = 43
+        self.conf1.foo = 43 # not changed, no emit
+        self.assertEqual(changes1, [('foo', 43)])
+        self.assertEqual(changes2, [])
+
+    def test_reset(self):
+        self.conf1.foo = 1
+        self.conf1.fields.foo.reset_value()
+        self.assertEqual(self.conf1.foo, 42)
+
+    def test_validation(self):
+        self.conf1.foo = 1000
+        self.assert_(not self.conf1.fields.foo.isvalid())
+        self.assert_(self.conf2.fields.foo.isvalid())
+
+
+if __name__ == '__main__':
+    unittest.main()
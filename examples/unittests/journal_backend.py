@@ -0,0 +1,87 @@
+# Tests the journal backend.
+import os
+import unittest
+import gpyconf
+from gpyconf.backends.journal import JournalBackend
+
+
+class JournalTestConf(gpyconf.Configuration):
+    backend = JournalBackend
+    counter = gpyconf.fields.IntegerField(default=0, max=100000)
+    last_used = gpyconf.fields.CharField()
+    baz = gpyconf.fields.ListField(default=['a'])
+
+
+class JournalTestCase(unittest.TestCase):
+    def setUp(self):
+        self.conf = JournalTestConf()
+        self.backend = self.conf.backend_instance
+        self.file = self.backend.file
+
+    def tearDown(self):
+        self.backend.wait()
+        os.remove(self.file)
+
+    def test_append(self):
+        self.conf.counter = 1
+        self.conf.last_used = 'foo'
+        self.conf.save()
+        size = os.path.getsize(self.file)
+        self.conf.counter = 2
+        self.conf.save()
+        with open(self.file) as fobj:
+            self.assertEqual(fobj.read()[size:], '["counter", 2]\n')
+        conf = JournalTestConf()
+        self.assertEqual((conf.counter, conf.last_used), (2, 'foo'))
+
+    def test_remove(self):
+        self.conf.baz = ['x']
+        self.conf.save()
+        self.conf.fields.baz.reset_value()
+        self.conf.save()
+        self.assertEqual(JournalTestConf().backend_instance.options, [])
+
+    def test_truncated_record(self):
+        self.conf.counter = 1
+        self.conf.save()
+        with open(self.file, 'ab') as fobj:
+            fobj.write('["counter", 12')
+        self.conf.counter = 3
+        self.conf.last_used = 'bar'
+        self.conf.save()
+        conf = JournalTestConf()
+        self.assertEqual((conf.counter, conf.last_used), (3, 'bar'))
+
+    def test_compaction(self):
+        self.backend.compact_size = 100
+        self.conf.last_used = 'foo'
+        for i in xrange(20):
+            self.conf.counter = i
+            self.conf.save()
+        self.assert_(self.backend.compaction_count > 0)
+        self.assert_(self.backend.records < 10)
+        conf = JournalTestConf()
+        self.assertEqual((conf.counter, conf.last_used), (19, 'foo'))
+
+    def test_background_compaction(self):
+        self.backend.compact_size = 100
+        self.backend.background_compaction = True
+        for i in xrange(50):
+            self.conf.counter = i
+            self.conf.save()
+        self.conf.last_used = 'not saved'
+        self.backend.wait()
+        self.backend.compact()
+        self.assert_(self.backend.compaction_count > 1)
+        conf = JournalTestConf()
+        self.assertEqual((conf.counter, conf.last_used), (49, ''))
+
+    def test_reset(self):
+        self.conf.counter = 5
+        self.conf.save()
+        self.conf.reset()
+        self.assertEqual(JournalTestConf().counter, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+# Tests lazy reading and that backend files are parsed only once.
+import os
+import unittest
+import gpyconf
+
+
+class LazyReadTestConf(gpyconf.Configuration):
+    foo = gpyconf.fields.IntegerField(default=42)
+    bar = gpyconf.fields.CharField()
+
+
+class LazyReadTestCase(unittest.TestCase):
+    def setUp(self):
+        conf = LazyReadTestConf()
+        self.file = conf.backend_instance.file
+        conf.foo = 43
+        conf.save()
+
+    def tearDown(self):
+        os.remove(self.file)
+
+    def test_read_once(self):
+        conf = LazyReadTestConf()
+        self.assertEqual(conf.backend_instance.read_count, 1)
+        self.assertEqual(conf.foo, 43)
+        conf.bar = 'baz'
+        conf.save()
+        self.assertEqual(conf.backend_instance.read_count, 1)
+
+    def test_lazy_read(self):
+        conf = LazyReadTestConf(lazy_read=True)
+        self.assertEqual(conf.backend_instance.read_count, 0)
+        self.assertEqual(conf.foo, 43)
+        self.assertEqual(conf.bar, '')
+        self.assertEqual(conf.fields.foo.value, 43)
+        self.assertEqual(conf.backend_instance.read_count, 1)
+
+    def test_lazy_set_reads_first(self):
+        conf = LazyReadTestConf(lazy_read=True)
+        conf.bar = 'baz'
+        self.assertEqual(conf.backend_instance.read_count, 1)
+        self.assertEqual(conf.bar, 'baz')
+        conf.save()
+        conf = LazyReadTestConf()
+        self.assertEqual((conf.foo, conf.bar), (43, 'baz'))
+
+    def test_no_disk_access(self):
+        os.remove(self.file)
+        conf = LazyReadTestConf(lazy_read=True)
+        self.assert_(not os.path.exists(self.file))
+        self.assertEqual(conf.foo, 42)
+        self.assert_(os.path.exists(self.file))
+
+    def test_unread_save_keeps_options(self):
+        conf = LazyReadTestConf(read=False)
+        conf.bar = 'baz'
+        conf.save()
+        conf = LazyReadTestConf()
+        self.assertEqual((conf.foo, conf.bar), (43, 'baz'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+# Tests that configuration instances don't stay alive through connections.
+import gc
+import unittest
+import weakref
+import gpyconf
+from gpyconf.backends.dummy import DummyBackend
+from gpyconf.mvc import MVCComponent
+
+NUMBER = 10000
+
+
+class Component(MVCComponent):
+    __events__ = ('foo',)
+
+
+class LeakTestConf(gpyconf.Configuration):
+    backend = DummyBackend
+    foo = gpyconf.fields.IntegerField(default=42)
+    bar = gpyconf.fields.CharField()
+
+    def on_foo(self, sender):
+        pass
+
+
+class LeakTestCase(unittest.TestCase):
+    def create_instances(self, number, component):
+        for i in xrange(number):
+            conf = LeakTestConf()
+            conf.foo = i
+            component.connect('foo', conf.on_foo, weak=True)
+        del conf
+        gc.collect()
+
+    def test_instances_are_collected(self):
+        conf = LeakTestConf()
+        ref = weakref.ref(conf)
+        conf.connect('field-value-changed', lambda *args: None)
+        del conf
+        gc.collect()
+        self.assertEqual(ref(), None)
+
+    def test_memory_stays_flat(self):
+        component = Component()
+        self.create_instances(100, component)
+        objects_before = len(gc.get_objects())
+        self.create_instances(NUMBER, component)
+        objects_after = len(gc.get_objects())
+        self.assertTrue(objects_after - objects_before < 100,
+                        (objects_before, objects_after))
+        self.assertEqual(component.events.handlers, {})
+        component.emit('foo')
+
+
+if __name__ == '__main__':
+    unittest.main()
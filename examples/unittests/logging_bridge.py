@@ -0,0 +1,96 @@
+# Tests lazy message formatting and passing messages to the logging module.
+from __future__ import absolute_import
+import logging
+import unittest
+import gpyconf
+from gpyconf._internal.logging import Logger, StdlibLogger, LEVELS
+
+
+class Counted(object):
+    formatted = 0
+
+    def __str__(self):
+        Counted.formatted += 1
+        return 'counted'
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class LoggingTestConf(gpyconf.Configuration):
+    foo = gpyconf.fields.IntegerField(default=42)
+
+
+class LazyFormattingTestCase(unittest.TestCase):
+    def setUp(self):
+        Counted.formatted = 0
+
+    def test_disabled(self):
+        logger = Logger('Test', 'warning', use_stdout=False, use_file=True)
+        logger.info("Value: %s", Counted())
+        logger.debug("Value: %s", Counted())
+        logger.log("Value: %s", LEVELS[1], Counted())
+        self.assertEqual(Counted.formatted, 0)
+        self.assert_(logger.isEnabledFor(LEVELS[3]))
+        self.assert_(not logger.isEnabledFor(LEVELS[0]))
+
+    def test_enabled(self):
+        logger = Logger('Test', 'info')
+        messages = []
+        logger._print = messages.append
+        logger.info("Value: %s", Counted())
+        logger.warning("100%")
+        self.assertEqual(Counted.formatted, 1)
+        self.assertEqual(map(str.split, messages),
+                         [['INFO', 'Value:', 'counted'],
+                          ['WARNING', '100%']])
+
+    def test_log_level_argument(self):
+        logger = Logger('Test', 'info')
+        messages = []
+        logger._print = messages.append
+        logger.log("Level given as tuple", LEVELS[2])
+        logger.log("Level given as name", 'info')
+        logger.log("Value: %s", 'error', 42)
+        self.assertEqual([message.split()[0] for message in messages],
+                         ['WARNING', 'INFO', 'ERROR'])
+        self.assertEqual(messages[2].split()[1:], ['Value:', '42'])
+        self.assertRaises(TypeError, logger.log, "No level")
+
+
+class StdlibLoggerTestCase(unittest.TestCase):
+    def setUp(self):
+        Counted.formatted = 0
+        self.handler = RecordingHandler()
+        self.stdlib_logger = logging.getLogger('gpyconf.LoggingTestConf')
+        self.stdlib_logger.addHandler(self.handler)
+        self.stdlib_logger.setLevel(logging.WARNING)
+
+    def tearDown(self):
+        self.stdlib_logger.removeHandler(self.handler)
+
+    def test_forward(self):
+        logger = StdlibLogger('LoggingTestConf')
+        logger.debug("Value: %s", Counted())
+        logger.error("Value: %s", 42)
+        self.assertEqual(Counted.formatted, 0)
+        self.assertEqual([(record.levelno, record.getMessage())
+                          for record in self.handler.records],
+                         [(logging.ERROR, 'Value: 42')])
+
+    def test_configuration(self):
+        conf = LoggingTestConf(stdlib_logging=True, read=False)
+        conf.backend_instance.warn("Something happened")
+        self.assertEqual([record.getMessage()
+                          for record in self.handler.records],
+                         ['Backend: Something happened'])
+
+
+if __name__ == '__main__':
+    unittest.main()
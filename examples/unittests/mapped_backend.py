@@ -0,0 +1,81 @@
+# Tests the memory-mapped binary backend.
+import os
+import unittest
+import gpyconf
+from gpyconf.backends.binary import MappedBackend, MAGIC
+
+FILE = 'mapped_test.bin'
+
+
+def backref():
+    return 'MappedTest'
+
+
+# (stored in FILE, named after the class)
+MappedTest = type('MappedTest', (gpyconf.Configuration,), dict(
+    [('backend', MappedBackend)] +
+    [('option%d' % i, gpyconf.fields.CharField()) for i in xrange(1000)]))
+
+
+class MappedBackendTestCase(unittest.TestCase):
+    def setUp(self):
+        backend = MappedBackend(backref, FILE)
+        backend.read()
+        for i in xrange(1000):
+            backend.set_option(u'option%d' % i, u'value %d' % i)
+        backend.set_option(u'\xe4', u'\xf6')
+        backend.save()
+
+    def tearDown(self):
+        os.remove(FILE)
+
+    def test_lookup(self):
+        backend = MappedBackend(backref, FILE)
+        backend.read()
+        for i in (0, 1, 500, 999):
+            self.assertEqual(backend.get_option(u'option%d' % i),
+                             u'value %d' % i)
+        self.assertEqual(backend.get_option(u'\xe4'), u'\xf6')
+        self.assertEqual(backend.get_option('missing', None), None)
+        self.assertEqual(len(backend.tree), 1001)
+
+    def test_configuration_reads_on_access(self):
+        looked_up = []
+        find = MappedBackend._find
+        def recording_find(backend, key):
+            looked_up.append(key)
+            return find(backend, key)
+        MappedBackend._find = recording_find
+        try:
+            conf = MappedTest()
+            self.assertEqual(conf.backend_instance.file, FILE)
+            self.assertEqual(looked_up, [])
+            self.assertEqual(conf.option500, u'value 500')
+            self.assertEqual(looked_up, ['option500'])
+        finally:
+            MappedBackend._find = find
+
+    def test_unsaved_changes(self):
+        backend = MappedBackend(backref, FILE)
+        backend.read()
+        backend.set_option('option1', u'changed')
+        backend.remove_option('option2')
+        self.assertEqual(backend.get_option('option1'), u'changed')
+        self.assert_('option2' not in backend.tree)
+        self.assertEqual(dict(backend.tree.iteritems())['option1'], u'changed')
+        backend.save()
+        backend = MappedBackend(backref, FILE)
+        backend.read()
+        self.assertEqual((backend.get_option('option1'),
+                          backend.get_option('option2', None),
+                          backend.get_option('option3')),
+                         (u'changed', None, u'value 3'))
+
+    def test_invalid_file(self):
+        with open(FILE, 'wb') as fobj:
+            fobj.write('[section]\n')
+        self.assertRaises(IOError, MappedBackend(backref, FILE).read)
+
+
+if __name__ == '__main__':
+    unittest.main()
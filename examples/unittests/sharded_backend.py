@@ -0,0 +1,90 @@
+# Tests the sharded backend and reading configurations section by section.
+import os
+import shutil
+import unittest
+import gpyconf
+from gpyconf.backends.sharded import ShardedBackend
+
+
+class ShardedTestConf(gpyconf.Configuration):
+    backend = ShardedBackend
+    foo = gpyconf.fields.IntegerField(default=42)
+    bar = gpyconf.fields.CharField(section='Text')
+    baz = gpyconf.fields.CharField(section='Text')
+    plugin = gpyconf.fields.ListField(default=['a'], section='Plugin x/y')
+
+
+class ShardedTestCase(unittest.TestCase):
+    def setUp(self):
+        conf = ShardedTestConf()
+        self.directory = conf.backend_instance.directory
+        conf.update(foo=1, bar='bar', baz='baz', plugin=['b'])
+        conf.save()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_files(self):
+        self.assertEqual(sorted(os.listdir(self.directory)),
+                         ['@default.json', 'Plugin%20x%2Fy.json', 'Text.json'])
+
+    def test_file_names_unique(self):
+        backend = ShardedTestConf().backend_instance
+        sections = [None, 'default', '@default', 'a b', 'a_b', 'a%20b',
+                    u'\xe4', '%C3%A4']
+        files = [backend.shard_file(section) for section in sections]
+        self.assertEqual(len(set(files)), len(sections))
+
+    def test_read_on_access(self):
+        conf = ShardedTestConf()
+        shards = conf.backend_instance.shards
+        self.assertEqual(shards, {})
+        self.assertEqual(conf.bar, 'bar')
+        self.assertEqual(shards.keys(), ['Text'])
+        self.assertEqual(conf.fields.baz.value, 'baz')
+        self.assertEqual(shards.keys(), ['Text'])
+        self.assertEqual((conf.foo, conf.plugin), (1, ['b']))
+        self.assertEqual(sorted(shards), [None, 'Plugin x/y', 'Text'])
+
+    def test_save_dirty_shards_only(self):
+        conf = ShardedTestConf()
+        conf.bar = 'changed'
+        conf.save()
+        self.assertEqual(conf.backend_instance.shards.keys(), ['Text'])
+        self.assertEqual(conf.backend_instance.shards['Text'].write_count, 1)
+        conf = ShardedTestConf()
+        self.assertEqual((conf.foo, conf.bar, conf.baz, conf.plugin),
+                         (1, 'changed', 'baz', ['b']))
+
+    def test_reset_value_unread(self):
+        conf = ShardedTestConf()
+        conf.fields.foo.reset_value()
+        conf.save()
+        self.assertEqual(ShardedTestConf().foo, 42)
+
+    def test_batch(self):
+        conf = ShardedTestConf()
+        changes = []
+        conf.connect('fields-changed',
+                     lambda sender, names: changes.append(names))
+        with conf.batch():
+            conf.bar = 'a'
+            conf.foo = 2
+        self.assertEqual(changes, [['foo', 'bar']])
+
+    def test_lazy_read(self):
+        conf = ShardedTestConf(lazy_read=True)
+        self.assertEqual(conf.backend_instance.shards, {})
+        self.assertEqual(conf.plugin, ['b'])
+        self.assertEqual(conf.backend_instance.shards.keys(), ['Plugin x/y'])
+
+    def test_reset(self):
+        conf = ShardedTestConf()
+        conf.reset()
+        self.assertEqual((conf.foo, conf.bar), (42, ''))
+        conf = ShardedTestConf()
+        self.assertEqual((conf.foo, conf.bar), (42, ''))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+# Tests the compact (slotted, lazily allocated) field layout.
+import unittest
+import gpyconf
+from gpyconf.events import InvalidEvent
+
+
+class CustomField(gpyconf.fields.CharField):
+    default = 'custom'
+
+    def on_initialized(self, sender, kwargs):
+        self.extra = kwargs.pop('extra', None)
+
+
+class SmallField(gpyconf.fields.IntegerField):
+    __slots__ = ()
+    max = 10
+
+
+class SmallerField(SmallField):
+    min = 5
+
+
+class SlotsTestCase(unittest.TestCase):
+    def test_no_dict(self):
+        for field in (gpyconf.fields.CharField(), gpyconf.fields.FontField(),
+                      gpyconf.fields.IntegerField(min=3)):
+            self.assertRaises(AttributeError, getattr, field, '__dict__')
+
+    def test_lazy_event_register(self):
+        field = gpyconf.fields.IntegerField()
+        self.assertRaises(AttributeError, getattr, field, '_event_register')
+        field.emit('log', 'nobody listens', level='info')
+        self.assertRaises(InvalidEvent, field.emit, 'no-such-signal')
+
+        messages = []
+        field.connect('log', lambda sender, msg, level: messages.append(msg))
+        field.emit('log', 'hello', level='info')
+        self.assertEqual(messages, ['hello'])
+
+    def test_class_defaults(self):
+        self.assertEqual(gpyconf.fields.CharField().blank, True)
+        self.assertEqual(gpyconf.fields.CharField(blank=False).blank, False)
+        self.assertEqual(gpyconf.fields.IntegerField().min, 0)
+        self.assertEqual(gpyconf.fields.IntegerField(min=3).default, 3)
+
+    def test_class_level_slot_values(self):
+        self.assertEqual((SmallField().min, SmallField().max), (0, 10))
+        self.assertEqual(SmallField(max=20).max, 20)
+        field = SmallerField()
+        self.assertEqual((field.min, field.max, field.default), (5, 10, 5))
+        self.assertFalse(field.isvalid(11))
+
+    def test_unslotted_subclass(self):
+        field = CustomField(extra=42)
+        self.assertEqual((field.default, field.extra), ('custom', 42))
+        self.assertEqual(CustomField(default='foo').default, 'foo')
+
+
+if __name__ == '__main__':
+    unittest.main()
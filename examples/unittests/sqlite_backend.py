@@ -0,0 +1,94 @@
+# Tests the SQLite backend.
+import os
+import unittest
+import gpyconf
+from gpyconf.backends.sqlite import SQLiteBackend, ConnectionPool
+
+DATABASE = 'sqlite_test.sqlite'
+
+
+class SQLiteTestConf(gpyconf.Configuration):
+    backend = SQLiteBackend.with_arguments(filename=DATABASE)
+    foo = gpyconf.fields.IntegerField(default=42, section='Numbers')
+    bar = gpyconf.fields.CharField(group='Text')
+    baz = gpyconf.fields.ListField(default=['a'])
+
+
+class OtherSQLiteTestConf(gpyconf.Configuration):
+    backend = SQLiteBackend.with_arguments(filename=DATABASE)
+    foo = gpyconf.fields.IntegerField(default=1)
+
+
+class SQLiteTestCase(unittest.TestCase):
+    def tearDown(self):
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(DATABASE + suffix):
+                os.remove(DATABASE + suffix)
+
+    def rows(self, conf):
+        return conf.backend_instance.connection.execute(
+            'SELECT configuration, name, section, grp, value FROM options '
+            'ORDER BY configuration, name').fetchall()
+
+    def test_save_and_read(self):
+        conf = SQLiteTestConf()
+        conf.foo = 7
+        conf.bar = 'text'
+        conf.baz = ['x', 'y']
+        conf.save()
+        conf = SQLiteTestConf()
+        self.assertEqual((conf.foo, conf.bar, conf.baz), (7, 'text', ['x', 'y']))
+        self.assertEqual(self.rows(conf)[:2], [
+            ('SQLiteTestConf', 'bar', None, 'Text', 'text'),
+            ('SQLiteTestConf', 'baz', None, None, conf.backend_instance
+                                                    .get_option('baz'))])
+        self.assertEqual(self.rows(conf)[2][:4],
+                         ('SQLiteTestConf', 'foo', 'Numbers', None))
+
+    def test_only_changes_written(self):
+        conf = SQLiteTestConf()
+        conf.foo = 7
+        conf.bar = 'text'
+        conf.save()
+        connection = conf.backend_instance.connection
+        changes = connection.total_changes
+        conf.foo = 8
+        conf.save()
+        self.assertEqual(connection.total_changes - changes, 1)
+        conf.fields.bar.reset_value()
+        conf.save()
+        conf = SQLiteTestConf()
+        self.assertEqual((conf.foo, conf.bar), (8, ''))
+
+    def test_shared_database(self):
+        pool = ConnectionPool()
+        class PooledConf(SQLiteTestConf):
+            backend = SQLiteBackend.with_arguments(filename=DATABASE,
+                                                   pool=pool)
+        class OtherPooledConf(OtherSQLiteTestConf):
+            backend = PooledConf.backend
+        conf, other = PooledConf(), OtherPooledConf()
+        self.assert_(conf.backend_instance.connection is
+                     other.backend_instance.connection)
+        conf.foo = 3
+        other.foo = 2
+        conf.save()
+        other.save()
+        self.assertEqual((PooledConf().foo, OtherPooledConf().foo), (3, 2))
+        pool.close()
+
+    def test_reset(self):
+        conf = SQLiteTestConf()
+        conf.foo = 7
+        conf.save()
+        other = OtherSQLiteTestConf()
+        other.foo = 2
+        other.save()
+        conf.reset()
+        self.assertEqual(conf.foo, 42)
+        self.assertEqual((SQLiteTestConf().foo, OtherSQLiteTestConf().foo),
+                         (42, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+# Tests saving in the background (Configuration.save_delay).
+import os
+import unittest
+import gpyconf
+
+
+class WriteBehindTestConf(gpyconf.Configuration):
+    foo = gpyconf.fields.IntegerField(default=42)
+    bar = gpyconf.fields.CharField()
+
+
+class WriteBehindTestCase(unittest.TestCase):
+    def setUp(self):
+        self.conf = WriteBehindTestConf(save_delay=50)
+        self.file = self.conf.backend_instance.file
+        self.writes = []
+        self.conf.connect('pre-save', lambda sender: self.writes.append(1))
+
+    def tearDown(self):
+        self.conf.flush()
+        os.remove(self.file)
+
+    def test_coalesce(self):
+        for i in xrange(100):
+            self.conf.foo = i
+            self.conf.save()
+        self.conf.wait()
+        self.assert_(1 <= len(self.writes) < 10, len(self.writes))
+        self.assertEqual(WriteBehindTestConf().foo, 99)
+
+    def test_flush(self):
+        self.conf.bar = 'baz'
+        self.conf.save()
+        self.conf.flush()
+        self.assertEqual(len(self.writes), 1)
+        self.assertEqual(WriteBehindTestConf().bar, 'baz')
+        self.conf.wait()
+        self.assertEqual(len(self.writes), 1)
+
+    def test_reload_keeps_pending_write(self):
+        conf = WriteBehindTestConf(save_delay=5000)
+        conf.foo = 10
+        conf.save()
+        other = WriteBehindTestConf()
+        other.bar = 'other'
+        other.save()
+        conf.reload()
+        self.assertEqual((conf.foo, conf.bar), (10, 'other'))
+        conf.flush()
+        stored = WriteBehindTestConf()
+        self.assertEqual((stored.foo, stored.bar), (10, 'other'))
+
+    def test_validation(self):
+        self.conf.foo = 1
+        self.conf.fields.foo.field.max = 0
+        try:
+            self.assertRaises(gpyconf.exceptions.InvalidOptionError,
+                              self.conf.save)
+        finally:
+            self.conf.fields.foo.field.max = 100
+        self.conf.wait()
+        self.assertEqual(self.writes, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
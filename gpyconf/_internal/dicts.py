@@ -112,6 +112,98 @@ class dotaccessdict(dict):
 
 
 class FieldsDict(ordereddict, dotaccessdict):
+    pass
+
+
+class BoundFieldsDict(DictMixin, object):
+    """
+    Read-only view on a :class:`FieldsDict` returning its fields bound
+    to ``instance`` (``bind(field, instance)``). Bound fields are created
+    on access, so creating the view is cheap.
+    """
+    __slots__ = ('_fields', '_instance', '_bind')
+
+    def __init__(self, fields, instance, bind):
+        self._fields = fields
+        self._instance = instance
+        self._bind = bind
+
+    def __getitem__(self, name):
+        return self._bind(self._fields[name], self._instance)
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __contains__(self, name):
+        return name in self._fields
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def keys(self):
+        return self._fields.keys()
+
+    def iteritems(self):
+        bind, instance = self._bind, self._instance
+        for name, field in self._fields.iteritems():
+            yield name, bind(field, instance)
+
     @property
     def name_value_dict(self):
         return dict(((name, field.value) for name, field in self.iteritems()))
+
+
+class CopyOnWriteDict(DictMixin, object):
+    """
+    Dictionary view on a (possibly shared) dictionary ``data``. ``data`` is
+    copied the first time the view is modified, so ``data`` itself is never
+    changed through the view.
+    """
+    __slots__ = ('_data', '_copied')
+
+    def __init__(self, data):
+        self._data = data
+        self._copied = False
+
+    def _writable(self):
+        if not self._copied:
+            self._data = self._data.copy()
+            self._copied = True
+        return self._data
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __setitem__(self, key, value):
+        self._writable()[key] = value
+
+    def __delitem__(self, key):
+        del self._writable()[key]
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def keys(self):
+        return self._data.keys()
+
+    def iteritems(self):
+        return self._data.iteritems()
+
+    def clear(self):
+        self._data = {}
+        self._copied = True
+
+    def copy(self):
+        return self._data.copy()
@@ -3,8 +3,9 @@
 
 # gpyconf's logging system.
 
-from __future__ import print_function
+from __future__ import print_function, absolute_import
 import os
+import logging as stdlib_logging
 from operator import itemgetter
 from textwrap import wrap as wordwrap
 
@@ -16,6 +17,31 @@ LEVELS = (
     (3, 'ERROR'),
 )
 
+# gpyconf level name -> stdlib logging level
+STDLIB_LEVELS = {
+    'INFO': stdlib_logging.INFO,
+    'DEBUG': stdlib_logging.DEBUG,
+    'WARNING': stdlib_logging.WARNING,
+    'ERROR': stdlib_logging.ERROR,
+}
+
+
+def get_level(level):
+    """
+    Returns the level tuple (see :data:`LEVELS`) for ``level``, given as
+    such a tuple, as index or as (case insensitive) name
+    """
+    if level in LEVELS:
+        return level
+    try:
+        return LEVELS[level]
+    except (TypeError, IndexError):
+        level_names = map(itemgetter(1), LEVELS)
+        try:
+            return LEVELS[level_names.index(level.upper())]
+        except (ValueError, AttributeError):
+            raise TypeError("Invalid `level` parameter given")
+
 DEFAULT_LOGFILE = os.path.expanduser('~/.%(classname)s_gypconf.log')
 DEFAULT_FORMAT = 'gpyconf::%(level)s: %(message)s'
 DEFAULT_VERBOSE_FORMAT = 'gpyconf(%%(classname)s)%s' % DEFAULT_FORMAT[7:]
@@ -62,19 +88,7 @@ class Logger(object):
 
     @level.setter
     def level(self, level):
-        if level in LEVELS:
-            self._level = level
-            # level given as tuple of (index, name)
-        else:
-            try:
-                self._level = LEVELS[level]
-                # level given as index
-            except (TypeError, IndexError):
-                level_names = map(itemgetter(1), LEVELS)
-                try:
-                    self._level = LEVELS[level_names.index(level.upper())]
-                except (ValueError, AttributeError):
-                    raise TypeError("Invalid `level` parameter given")
+        self._level = get_level(level)
 
     def _print(self, *args, **kwargs):
         if self.use_stdout:
@@ -82,23 +96,85 @@ class Logger(object):
         if self.use_file:
             print(file=self.file, *args, **kwargs)
 
-    def info(self, *args, **kwargs):
-        self.log(level=LEVELS[0], *args, **kwargs)
+    def isEnabledFor(self, level):
+        """
+        Returns :const:`True` if messages of ``level`` (a level tuple from
+        :data:`LEVELS`) would be logged
+        """
+        return level[0] >= self._level[0]
+
+    # Messages are %-formatted with the positional arguments only if they
+    # are logged, so pass arguments instead of formatting them yourself:
+    # logger.info("Converting '%s'", name)
+    def info(self, message, *args, **kwargs):
+        if self._level[0] <= 0:
+            self._log(LEVELS[0], message, args, **kwargs)
 
-    def debug(self, *args, **kwargs):
-        self.log(level=LEVELS[1], *args, **kwargs)
+    def debug(self, message, *args, **kwargs):
+        if self._level[0] <= 1:
+            self._log(LEVELS[1], message, args, **kwargs)
 
-    def warning(self, *args, **kwargs):
-        self.log(level=LEVELS[2], *args, **kwargs)
+    def warning(self, message, *args, **kwargs):
+        if self._level[0] <= 2:
+            self._log(LEVELS[2], message, args, **kwargs)
 
-    def error(self, *args, **kwargs):
-        self.log(level=LEVELS[3], *args, **kwargs)
+    def error(self, message, *args, **kwargs):
+        self._log(LEVELS[3], message, args, **kwargs)
 
-    def log(self, message, level=None, field=None):
+    def log(self, message, level=None, *args, **kwargs):
         if level is None:
             raise TypeError('Buuh!')
-        if level[0] < self.level[0]:
-            # lower level, throw the message away
-            return
+        level = get_level(level)
+        if self.isEnabledFor(level):
+            self._log(level, message, args, **kwargs)
+
+    def _log(self, level, message, args, field=None):
+        if args:
+            message = message % args
         self._print(self.formatter.format(level, message, field=field,
                                           classname=self.classname))
+
+
+class StdlibLogger(Logger):
+    """
+    :class:`Logger` passing the messages to the standard library's
+    :mod:`logging` module, using the logger named
+    ``gpyconf.<classname>``. Its level and handlers decide what is logged
+    (the ``level`` passed is set as that logger's level if given).
+    """
+    def __init__(self, classname, level=None, **kwargs):
+        self.classname = classname
+        self.logger = stdlib_logging.getLogger('gpyconf.%s' % classname)
+        if level is not None:
+            self.level = level
+
+    @property
+    def level(self):
+        return self._level
+
+    @level.setter
+    def level(self, level):
+        Logger.level.fset(self, level)
+        self.logger.setLevel(STDLIB_LEVELS[self._level[1]])
+
+    def isEnabledFor(self, level):
+        return self.logger.isEnabledFor(STDLIB_LEVELS[level[1]])
+
+    def info(self, message, *args, **kwargs):
+        self.log(message, LEVELS[0], *args, **kwargs)
+
+    def debug(self, message, *args, **kwargs):
+        self.log(message, LEVELS[1], *args, **kwargs)
+
+    def warning(self, message, *args, **kwargs):
+        self.log(message, LEVELS[2], *args, **kwargs)
+
+    def error(self, message, *args, **kwargs):
+        self.log(message, LEVELS[3], *args, **kwargs)
+
+    def _log(self, level, message, args, field=None):
+        if field is not None:
+            message = "%s '%s': %s" % (field._class_name, field.field_var,
+                                       message)
+        # (formatted by the logging module, only if it is emitted)
+        self.logger.log(STDLIB_LEVELS[level[1]], message, *args)
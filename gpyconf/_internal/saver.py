@@ -0,0 +1,108 @@
+# %FILEHEADER%
+# The write-behind saver used by configurations with a `save_delay`.
+
+import atexit
+from time import time
+from threading import Condition, RLock, Thread
+
+
+class WriteBehindSaver(object):
+    """
+    Makes configurations' backends store their values in a background
+    thread. Configurations scheduled again before they were written are
+    written only once, so each configuration is written at most every
+    ``delay`` seconds.
+    """
+    def __init__(self):
+        #: Held while the backends' values are changed, written or reloaded
+        self.write_lock = RLock()
+        self._condition = Condition()
+        # configuration -> time it is due to be written
+        self._pending = {}
+        self._writing = set()
+        self._stopped = False
+        self._thread = None
+
+    def schedule(self, configuration, delay):
+        """ Writes ``configuration`` in ``delay`` seconds """
+        with self._condition:
+            if configuration in self._pending:
+                return
+            self._pending[configuration] = time() + delay
+            if self._thread is None:
+                self._stopped = False
+                self._thread = Thread(target=self._run,
+                                      name='gpyconf-write-behind')
+                self._thread.daemon = True
+                self._thread.start()
+            self._condition.notify_all()
+
+    def flush(self, configuration):
+        """ Writes ``configuration`` now if a write is pending """
+        with self._condition:
+            while configuration in self._writing:
+                self._condition.wait()
+            pending = self._pending.pop(configuration, None) is not None
+        if pending:
+            try:
+                self._write(configuration)
+            finally:
+                with self._condition:
+                    self._condition.notify_all()
+
+    def wait(self, configuration):
+        """ Blocks until the pending write of ``configuration`` is done """
+        with self._condition:
+            while configuration in self._pending or \
+                  configuration in self._writing:
+                self._condition.wait()
+
+    def flush_all(self):
+        """
+        Writes all pending configurations and stops the thread
+        (called on interpreter exit).
+        """
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        with self._condition:
+            pending, self._pending = self._pending, {}
+        for configuration in pending:
+            self._write(configuration)
+
+    def _write(self, configuration):
+        with self.write_lock:
+            configuration._save()
+
+    def _run(self):
+        condition = self._condition
+        with condition:
+            while not self._stopped:
+                if not self._pending:
+                    condition.wait()
+                    continue
+                configuration, due = min(self._pending.iteritems(),
+                                         key=lambda item: item[1])
+                delay = due - time()
+                if delay > 0:
+                    condition.wait(delay)
+                    continue
+                del self._pending[configuration]
+                self._writing.add(configuration)
+                condition.release()
+                try:
+                    self._write(configuration)
+                except Exception, e:
+                    configuration.logger.error("Saving failed: %s", e)
+                finally:
+                    condition.acquire()
+                    self._writing.discard(configuration)
+                    condition.notify_all()
+            self._thread = None
+
+#: The :class:`WriteBehindSaver` used by all configurations
+write_behind_saver = WriteBehindSaver()
+atexit.register(write_behind_saver.flush_all)
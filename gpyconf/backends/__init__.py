@@ -22,6 +22,16 @@ class Backend(MVCComponent):
     #: (defaults to :const:`False`).
     compatibility_mode = False
 
+    #: :const:`True` if the options are read section by section, when a
+    #: field of that section is accessed first (see :meth:`read_section`)
+    lazy_sections = False
+    #: :const:`True` if the options are read one by one (using
+    #: :meth:`get_option`), when their field is accessed first
+    lazy_options = False
+    #: Files to watch for changes if the configuration is
+    #: :attr:`hot reloaded <gpyconf.Configuration.hot_reload>`
+    watched_files = ()
+
     __events__ = ('saved', 'read')
 
     def __init__(self, backref):
@@ -32,6 +42,14 @@ class Backend(MVCComponent):
         """ Reads the configuration from the storage (file, database, ...) """
         raise NotImplementedError()
 
+    def read_section(self, section):
+        """
+        Returns a dictionary of the options of fields in ``section``
+        (:const:`None` for fields without a section). Only used if
+        :attr:`lazy_sections` is set.
+        """
+        raise NotImplementedError()
+
     def save(self):
         """ Saves the configuration to the storage """
         raise NotImplementedError()
@@ -42,6 +60,35 @@ class Backend(MVCComponent):
         """
         raise NotImplementedError()
 
+    def remove_option(self, name):
+        """
+        Removes option ``name`` (if stored) so that the field's default value
+        is used the next time the configuration is read.
+        """
+        raise NotImplementedError()
+
+    def apply_changes(self, changed, removed):
+        """
+        Applies the options changed since the last read or save.
+        ``changed`` is a dictionary mapping option names to their new values,
+        ``removed`` is a dictionary mapping the names of the options to remove
+        to their fields' default values (to store instead if the backend
+        can't remove options).
+
+        Backends that can store single options cheaper than all options
+        may override this method; the default implementation calls
+        :meth:`set_option` and :meth:`remove_option` for each option (or
+        :meth:`set_option` with the default value if :meth:`remove_option`
+        is not implemented).
+        """
+        for name, value in changed.iteritems():
+            self.set_option(name, value)
+        for name, default in removed.iteritems():
+            try:
+                self.remove_option(name)
+            except NotImplementedError:
+                self.set_option(name, default)
+
     def get_option(self, option, default=NONE):
         """
         Returns the value of ``option``.
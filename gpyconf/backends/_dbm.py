@@ -0,0 +1,149 @@
+# %FILEHEADER%
+"""
+Backend storing options in a key-value database of the :mod:`anydbm` family
+"""
+import atexit
+import anydbm
+import weakref
+from UserDict import DictMixin
+from .._internal.saver import write_behind_saver
+from .._internal.utils import filename_from_classname
+from . import Backend, NONE, MissingOption
+
+# backends with an open database
+_open_backends = weakref.WeakSet()
+
+
+class DBMTree(DictMixin):
+    """
+    Read-only mapping view on a :class:`DBMBackend`'s database, decoding
+    values when they are accessed.
+    """
+    def __init__(self, backend):
+        self.backend = backend
+
+    def __getitem__(self, name):
+        try:
+            return self.backend.db[name.encode('utf-8')].decode('utf-8')
+        except KeyError:
+            raise KeyError(name)
+
+    def __contains__(self, name):
+        return name.encode('utf-8') in self.backend.db
+
+    def __len__(self):
+        return len(self.backend.db)
+
+    def __iter__(self):
+        return (key.decode('utf-8') for key in self.backend.db.keys())
+
+    def iteritems(self):
+        db = self.backend.db
+        for key in db.keys():
+            yield key.decode('utf-8'), db[key].decode('utf-8')
+
+    def keys(self):
+        return list(self)
+
+
+class DBMBackend(Backend):
+    """
+    Backend for configurations with lots of options. Unlike file based
+    backends, it doesn't parse the whole store when reading: options are
+    looked up when they are needed and each changed option is written on
+    its own. Whichever :mod:`anydbm` implementation is available is used.
+
+    .. note::
+
+        Only :mod:`gdbm`, :mod:`dbhash` and :mod:`dbm` open databases
+        without loading all keys, so use one of them for large stores.
+        :mod:`dumbdbm`, the fallback if none of them is available, loads its
+        whole index when the database is opened. With it, creating a
+        configuration and reading ten options took 16, 149 and 1257 ms for
+        1000, 10000 and 100000 options (nearly all of it opening the
+        database), compared to 18, 237 and 4449 ms with the
+        :class:`ConfigParserBackend
+        <gpyconf.backends.configparser.ConfigParserBackend>` (measured
+        using ``examples/benchmarks/dbm_backend.py``). :mod:`dumbdbm` also
+        doesn't support several writers, each writes its whole index when
+        closing the database.
+
+    The database is opened when the backend is read and closed when it's
+    read again (to see changes made by others), on :meth:`close` and at
+    exit.
+
+    Configurations read each option when its field is accessed first
+    (see :attr:`lazy_options <gpyconf.backends.Backend.lazy_options>`).
+    """
+    compatibility_mode = True
+    lazy_options = True
+
+    def __init__(self, backref, filename=None):
+        Backend.__init__(self, backref)
+        self.file = filename or filename_from_classname(backref(), 'db')
+        self.db = None
+
+    @property
+    def watched_files(self):
+        # (dumbdbm stores the values in a file of its own)
+        return (self.file, self.file + '.dat')
+
+    def read(self):
+        # (implementations like dumbdbm keep the index in memory, so the
+        # database is opened again to see changes made meanwhile)
+        self.close()
+        self.db = anydbm.open(self.file, 'c')
+        _open_backends.add(self)
+
+    def close(self):
+        """ Closes the database, writing changes not synced yet """
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+            _open_backends.discard(self)
+
+    def save(self):
+        if hasattr(self.db, 'sync'):
+            self.db.sync()
+
+    def set_option(self, name, value):
+        self.db[name.encode('utf-8')] = value.encode('utf-8')
+
+    def remove_option(self, name):
+        key = name.encode('utf-8')
+        if key in self.db:
+            del self.db[key]
+
+    def get_option(self, name, default=NONE):
+        try:
+            return self.db[name.encode('utf-8')].decode('utf-8')
+        except KeyError:
+            if default is not NONE:
+                return default
+            else:
+                raise MissingOption(name)
+
+    def reset_all(self):
+        self.read()
+        # (not all implementations support the 'n' flag for opening)
+        for key in self.db.keys():
+            del self.db[key]
+        self.save()
+
+    @property
+    def options(self):
+        return [key.decode('utf-8') for key in self.db.keys()]
+
+    @property
+    def tree(self):
+        return DBMTree(self)
+
+
+def close_all():
+    """ Closes the databases of all :class:`DBMBackend` objects """
+    # (not while options are written in the background)
+    with write_behind_saver.write_lock:
+        for backend in list(_open_backends):
+            backend.close()
+
+atexit.register(close_all)
@@ -2,6 +2,7 @@
 """
 The json backend docstring
 """
+from .._internal.dicts import CopyOnWriteDict
 from .filebased import FileBasedBackend
 from . import NONE, MissingOption
 try:
@@ -16,20 +17,27 @@ class JSONBackend(FileBasedBackend):
     """
     initial_file_content = '{}'
 
-    def __init__(self, backref):
-        FileBasedBackend.__init__(self, backref, extension='json')
+    def __init__(self, backref, filename=None):
+        FileBasedBackend.__init__(self, backref, 'json', filename)
+
+    @staticmethod
+    def parse(filename):
+        with open(filename) as fobj:
+            return json.load(fobj) or {}
 
     def read(self):
-        with open(self.file) as fobj:
-            self.json_tree = json.load(fobj) or {}
+        FileBasedBackend.read(self)
+        self.json_tree = CopyOnWriteDict(self.parse_file(self.parse))
 
     def save(self):
-        with open(self.file, 'w') as fobj:
-            json.dump(self.tree, fobj, indent=4)
+        self.write_file(json.dumps(self.json_tree.copy(), indent=4))
 
     def set_option(self, name, value):
         self.json_tree[name] = value
 
+    def remove_option(self, name):
+        self.json_tree.pop(name, None)
+
     def get_option(self, name, default=NONE):
         try:
             return self.json_tree[self.section][name]
@@ -1,5 +1,7 @@
 # %FILEHEADER%
 
+import os
+from tempfile import mkstemp
 from ..filebased import FileBasedBackend
 from .. import NONE, MissingOption
 
@@ -15,14 +17,29 @@ class XMLBackend(dict, FileBasedBackend):
         FileBasedBackend.__init__(self, backref, extension, filename)
 
     def read(self):
+        FileBasedBackend.read(self)
         try:
-            return unserialize_file(self.file)
+            # (this backend is a dictionary itself, so the cached tree
+            # is copied here)
+            tree = self.parse_file(unserialize_file)
         except XMLSyntaxError, err:
             self.log('Could not parse XML configuration file: %s' % err,
                      level='error')
+        else:
+            self.clear()
+            self.update(tree or {})
 
     def save(self):
-        serialize_to_file(self, self.file, root_tag=self.ROOT_ELEMENT)
+        # xmlserialize only writes to files, so serialize to a scratch
+        # file and pass its content to write_file
+        fd, scratch = mkstemp(suffix='.xml')
+        os.close(fd)
+        try:
+            serialize_to_file(self, scratch, root_tag=self.ROOT_ELEMENT)
+            with open(scratch, 'rb') as fobj:
+                self.write_file(fobj.read())
+        finally:
+            os.remove(scratch)
 
     def get_option(self, item):
         try:
@@ -31,6 +48,9 @@ class XMLBackend(dict, FileBasedBackend):
             raise MissingOption(item)
     set_option = dict.__setitem__
 
+    def remove_option(self, item):
+        self.pop(item, None)
+
     options = property(lambda self:self.keys())
     tree = property(lambda self:self)
 
@@ -0,0 +1,191 @@
+# %FILEHEADER%
+"""
+Backend storing options in a memory-mapped, indexed binary file
+"""
+import mmap
+from struct import Struct
+from UserDict import DictMixin
+from .filebased import FileBasedBackend
+from . import NONE, MissingOption
+
+MAGIC = 'GPYCONF\x01'
+# number of options
+COUNT = Struct('<I')
+# key offset, key length, value offset, value length
+ENTRY = Struct('<IIII')
+HEADER_SIZE = len(MAGIC) + COUNT.size
+
+
+class MappedTree(DictMixin):
+    """
+    Read-only mapping view on a :class:`MappedBackend`'s options,
+    decoding values when they are accessed.
+    """
+    def __init__(self, backend):
+        self.backend = backend
+
+    def __getitem__(self, name):
+        value = self.backend.get_option(name, None)
+        if value is None:
+            raise KeyError(name)
+        return value
+
+    def __contains__(self, name):
+        return self.backend.get_option(name, None) is not None
+
+    def __iter__(self):
+        return iter(self.backend.options)
+
+    def __len__(self):
+        return len(self.backend.options)
+
+    def keys(self):
+        return self.backend.options
+
+    def iteritems(self):
+        # (walks the table instead of searching every option)
+        return self.backend._iteritems()
+
+
+class MappedBackend(FileBasedBackend):
+    """
+    Backend for big configurations that are read more often than written.
+    The file starts with a table of all options sorted by name, holding the
+    offsets of the options' names and values. It is memory-mapped, so
+    opening it doesn't depend on its size, and an option's value is only
+    decoded when it is asked for (using a binary search in the table).
+
+    Saving rewrites the file; the values of unchanged options are copied
+    without decoding them.
+
+    Configurations read each option when its field is accessed first
+    (see :attr:`lazy_options <gpyconf.backends.Backend.lazy_options>`).
+    """
+    compatibility_mode = True
+    lazy_options = True
+    initial_file_content = MAGIC + COUNT.pack(0)
+
+    def __init__(self, backref, filename=None):
+        FileBasedBackend.__init__(self, backref, 'bin', filename)
+        self._map = None
+        self._count = 0
+        # name -> value (NONE for removed options) of the unsaved changes
+        self._changes = {}
+
+    def read(self):
+        FileBasedBackend.read(self)
+        self._close()
+        with open(self.file, 'rb') as fobj:
+            self._map = mmap.mmap(fobj.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(MAGIC)] != MAGIC:
+            self._close()
+            raise IOError("Not a gpyconf binary file: %s" % self.file)
+        self._count = COUNT.unpack_from(self._map, len(MAGIC))[0]
+        self._changes.clear()
+
+    def _close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+            self._count = 0
+
+    def _entries(self):
+        for index in xrange(self._count):
+            yield ENTRY.unpack_from(self._map, HEADER_SIZE + index*ENTRY.size)
+
+    def _find(self, key):
+        """ Returns the value of ``key`` (undecoded) or :const:`None` """
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            key_offset, key_length, value_offset, value_length = \
+                ENTRY.unpack_from(self._map, HEADER_SIZE + middle*ENTRY.size)
+            found = self._map[key_offset:key_offset+key_length]
+            if found < key:
+                low = middle + 1
+            elif found > key:
+                high = middle
+            else:
+                return self._map[value_offset:value_offset+value_length]
+        return None
+
+    def save(self):
+        if not self._changes:
+            return
+        items = {}
+        for key_offset, key_length, value_offset, value_length in \
+                self._entries():
+            items[self._map[key_offset:key_offset+key_length]] = \
+                self._map[value_offset:value_offset+value_length]
+        for name, value in self._changes.iteritems():
+            key = name.encode('utf-8')
+            if value is NONE:
+                items.pop(key, None)
+            else:
+                items[key] = value.encode('utf-8')
+
+        keys = sorted(items)
+        table, data = [], []
+        offset = HEADER_SIZE + len(keys)*ENTRY.size
+        for key in keys:
+            value = items[key]
+            table.append(ENTRY.pack(offset, len(key),
+                                    offset + len(key), len(value)))
+            data.append(key)
+            data.append(value)
+            offset += len(key) + len(value)
+
+        # (mapped files can't be replaced on all platforms)
+        self._close()
+        self.write_file(''.join([MAGIC, COUNT.pack(len(keys))] + table + data))
+        self.read()
+
+    def set_option(self, name, value):
+        self._changes[name] = value
+
+    def remove_option(self, name):
+        self._changes[name] = NONE
+
+    def get_option(self, name, default=NONE):
+        value = self._changes.get(name)
+        if value is None:
+            value = self._find(name.encode('utf-8'))
+            if value is not None:
+                value = value.decode('utf-8')
+        if value is None or value is NONE:
+            if default is not NONE:
+                return default
+            else:
+                raise MissingOption(name)
+        return value
+
+    def reset_all(self):
+        self._close()
+        FileBasedBackend.reset_all(self)
+
+    def _iteritems(self):
+        for key_offset, key_length, value_offset, value_length in \
+                self._entries():
+            name = self._map[key_offset:key_offset+key_length].decode('utf-8')
+            if name not in self._changes:
+                yield name, self._map[value_offset:value_offset+value_length] \
+                                .decode('utf-8')
+        for name, value in self._changes.iteritems():
+            if value is not NONE:
+                yield name, value
+
+    @property
+    def options(self):
+        names = set(self._map[key_offset:key_offset+key_length].decode('utf-8')
+                    for key_offset, key_length, value_offset, value_length
+                    in self._entries())
+        for name, value in self._changes.iteritems():
+            if value is NONE:
+                names.discard(name)
+            else:
+                names.add(name)
+        return list(names)
+
+    @property
+    def tree(self):
+        return MappedTree(self)
@@ -1,6 +1,8 @@
 # %FILEHEADER%
 
-from ConfigParser import SafeConfigParser, NoOptionError
+from StringIO import StringIO
+from ConfigParser import RawConfigParser, SafeConfigParser, NoOptionError, \
+     DEFAULTSECT
 from .filebased import FileBasedBackend
 from . import NONE, MissingOption
 
@@ -8,28 +10,114 @@ class ConfigParserBackend(FileBasedBackend):
     """
     Wrapper class for :class:`ConfigParser.ConfigParser`.
     This is the default backend.
+
+    Options are stored in the INI section named like their field's
+    :attr:`section <gpyconf.fields.Field.section>`; options of fields
+    without section are stored in :attr:`section`. Options found in
+    another section (e.g. in files written before fields got a section)
+    are read from there and moved when they are set.
+
+    The file is parsed as a whole when it is read; configurations convert
+    and apply the options section by section (see :attr:`lazy_sections
+    <gpyconf.backends.Backend.lazy_sections>`).
     """
+    #: The section storing the options of fields without section
     section = 'default_section'
     compatibility_mode = True
+    lazy_sections = True
 
     def __init__(self, backref):
         FileBasedBackend.__init__(self, backref, 'ini')
         self.parser = SafeConfigParser()
         if not self.parser.has_section(self.section):
             self.parser.add_section(self.section)
-        self.read()
+        # option name -> INI section it is stored in
+        self._index = {}
+        # INI section -> names of the options that belong to it
+        self._members = {}
+
+    def _fields(self):
+        return getattr(type(self.backref()), 'fields', {})
+
+    def _section_of(self, name):
+        """ Returns the INI section option ``name`` belongs to """
+        field = self._fields().get(name)
+        if field is None or field.section is None:
+            return self.section
+        return field.section
+
+    def _index_options(self):
+        self._index.clear()
+        for section in self.parser.sections():
+            for name in self.parser.options(section):
+                if name in self._index and section != self._section_of(name):
+                    # the option's own section wins
+                    continue
+                self._index[name] = section
+        fields = self._fields()
+        self._members.clear()
+        for name, section in self._index.iteritems():
+            if name in fields:
+                # (options without field stay in their section)
+                section = self._section_of(name)
+            self._members.setdefault(section, []).append(name)
+
+    @staticmethod
+    def parse(filename):
+        # (returns plain data, the parser itself is changed by the backends)
+        parser = RawConfigParser()
+        with open(filename) as fobj:
+            parser.readfp(fobj)
+        defaults = parser.defaults()
+        # (`items` includes the defaults)
+        sections = [(section, [(name, value) for name, value
+                               in parser.items(section)
+                               if defaults.get(name, NONE) != value])
+                    for section in parser.sections()]
+        return defaults.items(), sections
 
     def read(self):
-        with open(self.file) as fobj:
-            self.parser.readfp(fobj)
+        FileBasedBackend.read(self)
+        defaults, sections = self.parse_file(self.parse)
+        self.parser = SafeConfigParser()
+        # (RawConfigParser.set doesn't check the interpolation syntax,
+        # values are checked when they are get)
+        for name, value in defaults:
+            RawConfigParser.set(self.parser, DEFAULTSECT, name, value)
+        for section, options in sections:
+            self.parser.add_section(section)
+            for name, value in options:
+                RawConfigParser.set(self.parser, section, name, value)
+        if not self.parser.has_section(self.section):
+            self.parser.add_section(self.section)
+        self._index_options()
+
+    def read_section(self, section):
+        if section is None:
+            section = self.section
+        return dict((name, self.get_option(name))
+                    for name in self._members.get(section, ()))
 
     def save(self):
-        with open(self.file, 'wb') as fobj:
-            self.parser.write(fobj)
+        for section in self.parser.sections():
+            if section != self.section and not self.parser.options(section):
+                self.parser.remove_section(section)
+        fobj = StringIO()
+        self.parser.write(fobj)
+        self.write_file(fobj.getvalue())
 
     def set_option(self, name, value):
+        section = self._section_of(name)
+        stored_in = self._index.get(name)
+        if stored_in is not None and stored_in != section:
+            self.parser.remove_option(stored_in, name)
+        if not self.parser.has_section(section):
+            self.parser.add_section(section)
+        if stored_in is None:
+            self._members.setdefault(section, []).append(name)
+        self._index[name] = section
         try:
-            self.parser.set(self.section, name, value)
+            self.parser.set(section, name, value)
         except TypeError, e:
             if "option values must be strings" in e:
                 raise TypeError("Option values must be strings, not %s" \
@@ -37,9 +125,17 @@ class ConfigParserBackend(FileBasedBackend):
             else:
                 raise TypeError(e)
 
+    def remove_option(self, name):
+        section = self._index.pop(name, None)
+        if section is not None:
+            self.parser.remove_option(section, name)
+            if name in self._fields():
+                section = self._section_of(name)
+            self._members[section].remove(name)
+
     def get_option(self, name, default=NONE):
         try:
-            return self.parser.get(self.section, name)
+            return self.parser.get(self._index.get(name, self.section), name)
         except NoOptionError:
             if default is not NONE:
                 return default
@@ -48,7 +144,7 @@ class ConfigParserBackend(FileBasedBackend):
 
     @property
     def options(self):
-        return self.parser.options(self.section)
+        return self._index.keys()
 
     def reset_all(self):
         FileBasedBackend.reset_all(self)
@@ -24,6 +24,9 @@ class DummyBackend(Backend):
     def set_option(self, name, value):
         print("Set option %s to %s" % (name, value))
 
+    def remove_option(self, name):
+        print("Remove option %s" % name)
+
     def get_option(self, name, default=NONE):
         print ("Get option %s" % name)
         try:
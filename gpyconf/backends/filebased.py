@@ -1,31 +1,340 @@
 # %FILEHEADER%
 
 import os
+import atexit
+import weakref
+from hashlib import sha1
+from uuid import uuid4
+from threading import Event, Lock, Thread
+from .._internal.dicts import ordereddict
 from .._internal.utils import create_empty_file, filename_from_classname
 from . import Backend
 
+
+def file_signature(filename):
+    """
+    Returns the ``(inode, size, modification time in ns)`` tuple of
+    ``filename``. Raises :exc:`OSError` if the file doesn't exist.
+    """
+    stat = os.stat(filename)
+    # Python 2 has no st_mtime_ns
+    mtime = getattr(stat, 'st_mtime_ns', None)
+    if mtime is None:
+        mtime = int(stat.st_mtime * 1000000000)
+    return (stat.st_ino, stat.st_size, mtime)
+
+
+class ParsedFileCache(object):
+    """
+    Process-wide cache of parsed configuration files, shared by all file
+    based backends. Entries are keyed on the parse function and on the
+    file's path, inode, size and modification time, so changed files are
+    parsed again. The least recently used entries are dropped if there
+    are more than :attr:`maxsize` entries.
+
+    Cached trees are shared between all readers of a file; they must not
+    be modified (backends wrap them in copy-on-write views).
+    """
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        #: Number of lookups answered from the cache
+        self.hits = 0
+        #: Number of lookups that had to parse the file
+        self.misses = 0
+        self._entries = ordereddict()
+        # (parse, path) -> key of the current entry
+        self._current = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def _key(parse, filename):
+        path = os.path.abspath(filename)
+        return (parse, path) + file_signature(path)
+
+    def get(self, filename, parse):
+        """
+        Returns ``parse(filename)``, parsing the file only if it isn't
+        cached in its current state.
+        """
+        key = self._key(parse, filename)
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                tree = self._entries[key] = self._entries.pop(key)
+                return tree
+            self.misses += 1
+        tree = parse(filename)
+        with self._lock:
+            outdated = self._current.get(key[:2])
+            if outdated is not None:
+                self._entries.pop(outdated, None)
+            if self.maxsize > 0:
+                self._current[key[:2]] = key
+                self._entries[key] = tree
+                while len(self._entries) > self.maxsize:
+                    evicted, _ = self._entries.popitem(last=False)
+                    if self._current.get(evicted[:2]) == evicted:
+                        del self._current[evicted[:2]]
+        return tree
+
+    def discard(self, filename):
+        """ Removes all entries for ``filename`` """
+        path = os.path.abspath(filename)
+        with self._lock:
+            for parse_path, key in self._current.items():
+                if parse_path[1] == path:
+                    del self._current[parse_path]
+                    self._entries.pop(key, None)
+
+    def clear(self):
+        """ Removes all entries and resets the hit/miss counters """
+        with self._lock:
+            self._entries.clear()
+            self._current.clear()
+            self.hits = self.misses = 0
+
+try:
+    _replace = os.replace
+except AttributeError:
+    # Python 2; atomic on POSIX systems
+    def _replace(source, destination):
+        if os.name == 'nt' and os.path.exists(destination):
+            os.remove(destination)
+        os.rename(source, destination)
+
+def _fsync_directory(path):
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        # not supported on this platform
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+#: The :class:`ParsedFileCache` used by all file based backends
+parsed_file_cache = ParsedFileCache()
+
+
+class FileWatcher(object):
+    """
+    Watches the files of configurations' backends (see
+    :attr:`Backend.watched_files <gpyconf.backends.Backend.watched_files>`)
+    and calls :meth:`Configuration.reload <gpyconf.Configuration.reload>`
+    for every configuration whose files changed.
+
+    All files are polled by a single daemon thread every :attr:`interval`
+    seconds; it is started when the first configuration is watched and
+    exits when there are no configurations left. Configurations are
+    referenced weakly, so watching doesn't keep them alive.
+    """
+    def __init__(self, interval=1.0):
+        #: Seconds between two checks
+        self.interval = interval
+        # configuration -> {path: signature}
+        self._watched = weakref.WeakKeyDictionary()
+        self._lock = Lock()
+        self._stopped = Event()
+        self._thread = None
+
+    @staticmethod
+    def _signature(filename):
+        try:
+            return file_signature(filename)
+        except OSError:
+            return None
+
+    def watch(self, configuration):
+        """ Starts watching ``configuration``'s files """
+        signatures = dict(
+            (path, self._signature(path))
+            for path in configuration.backend_instance.watched_files)
+        with self._lock:
+            self._watched[configuration] = signatures
+            if self._thread is None:
+                self._stopped.clear()
+                self._thread = Thread(target=self._run,
+                                      name='gpyconf-file-watcher')
+                self._thread.daemon = True
+                self._thread.start()
+
+    def unwatch(self, configuration):
+        """ Stops watching ``configuration``'s files """
+        with self._lock:
+            self._watched.pop(configuration, None)
+
+    def is_watched(self, configuration):
+        with self._lock:
+            return configuration in self._watched
+
+    def check(self):
+        """
+        Checks all watched files once and reloads the configurations
+        whose files changed. Called by the watcher thread.
+        """
+        with self._lock:
+            watched = self._watched.items()
+        for configuration, signatures in watched:
+            changed = False
+            for path in configuration.backend_instance.watched_files:
+                signature = self._signature(path)
+                if signatures.get(path, signature) != signature:
+                    changed = True
+                signatures[path] = signature
+            if changed:
+                try:
+                    configuration.reload()
+                except Exception, e:
+                    configuration.logger.error("Reloading failed: %s", e)
+
+    def stop(self):
+        """
+        Stops the watcher thread (called on interpreter exit). Watching
+        another configuration starts it again.
+        """
+        thread = self._thread
+        self._stopped.set()
+        if thread is not None:
+            thread.join()
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            with self._lock:
+                if not self._watched:
+                    self._thread = None
+                    return
+            self.check()
+        with self._lock:
+            self._thread = None
+
+#: The :class:`FileWatcher` used by configurations with
+#: :attr:`hot_reload <gpyconf.Configuration.hot_reload>` set
+file_watcher = FileWatcher()
+atexit.register(file_watcher.stop)
+
+
 class FileBasedBackend(Backend):
     """
     Abstract base class for file based backends
     (backends that use files as storage for configuration options).
+
+    Initializing a file based backend does not access the file; it is
+    created (if :attr:`create_new` is set) or opened when it is read.
+
+    Subclasses write the file using :meth:`write_file`.
     """
+    #: :const:`True` if the file should be created if it doesn't exist
     create_new = True
     initial_file_content = ''
+    #: How often the file was read
+    read_count = 0
+    #: The :class:`ParsedFileCache` to share parsed files through
+    #: (:const:`None` to parse the file on every read)
+    cache = parsed_file_cache
+    #: When to call :func:`os.fsync` after writing the file: ``'never'``,
+    #: ``'file'`` (the file) or ``'file+dir'`` (the file and its directory,
+    #: so the renaming is durable, too). Defaults to ``'never'``.
+    fsync = 'never'
+    #: How often the file was written
+    write_count = 0
+    # (signature, digest) of the file as last written or compared
+    _on_disk = None
 
     def __init__(self, backref, extension='', filename=None):
         Backend.__init__(self, backref)
         self.file = filename or filename_from_classname(backref(), extension)
 
+    def read(self):
+        """
+        Creates the file if it doesn't exist yet. Subclasses have to call this
+        method before reading the file.
+        """
         if not os.path.exists(self.file):
             if self.create_new:
                 self._create_file()
             else:
                 raise IOError("No such file: %s" % self.file)
+        self.read_count += 1
+
+    @property
+    def watched_files(self):
+        return (self.file,)
+
+    def parse_file(self, parse):
+        """
+        Returns ``parse(self.file)``. The result is shared with all other
+        backends reading the unchanged file through the :attr:`cache`,
+        so it must not be modified.
+        """
+        if self.cache is None:
+            return parse(self.file)
+        return self.cache.get(self.file, parse)
+
+    def write_file(self, data):
+        """
+        Replaces the file's content with ``data``. Returns :const:`False`
+        without writing if the file already contains ``data``.
+
+        ``data`` is written to a temporary file in the same directory which
+        then replaces the file, so the file is never left half-written.
+        See :attr:`fsync` for making the write durable.
+        """
+        if isinstance(data, unicode):
+            data = data.encode('utf-8')
+        digest = sha1(data).digest()
+        if self._is_on_disk(digest):
+            return False
+
+        directory = os.path.dirname(os.path.abspath(self.file))
+        temp = os.path.join(directory, '.%s.%s.tmp' % (
+            os.path.basename(self.file), uuid4().hex))
+        fd = os.open(temp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0666)
+        try:
+            with os.fdopen(fd, 'wb') as fobj:
+                fobj.write(data)
+                fobj.flush()
+                if self.fsync != 'never':
+                    os.fsync(fobj.fileno())
+            if os.path.exists(self.file):
+                os.chmod(temp, os.stat(self.file).st_mode & 07777)
+            _replace(temp, self.file)
+        except:
+            if os.path.exists(temp):
+                os.remove(temp)
+            raise
+        if self.fsync == 'file+dir':
+            _fsync_directory(directory)
+
+        self.write_count += 1
+        self.file_written()
+        self._on_disk = (file_signature(self.file), digest)
+        return True
+
+    def _is_on_disk(self, digest):
+        try:
+            signature = file_signature(self.file)
+        except OSError:
+            return False
+        if self._on_disk is not None and self._on_disk[0] == signature:
+            # unchanged since it was last written or compared
+            return self._on_disk[1] == digest
+        with open(self.file, 'rb') as fobj:
+            self._on_disk = (signature, sha1(fobj.read()).digest())
+        return self._on_disk[1] == digest
+
+    def file_written(self):
+        """
+        Has to be called after the file was written to
+        (:meth:`write_file` does so).
+        """
+        if self.cache is not None:
+            self.cache.discard(self.file)
 
     def reset_all(self):
         self._create_file()
         self.read()
 
     def _create_file(self):
-        with open(self.file, 'w') as fobj:
-            fobj.write(self.initial_file_content)
+        self.write_file(self.initial_file_content)
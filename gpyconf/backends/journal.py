@@ -0,0 +1,164 @@
+# %FILEHEADER%
+"""
+Backend appending changed options to a journal file
+"""
+import os
+from threading import Lock, Thread
+from .._internal.dicts import CopyOnWriteDict, ordereddict
+from .filebased import FileBasedBackend
+from . import NONE, MissingOption
+try:
+    import json
+except ImportError:
+    import simplejson as json
+
+
+class JournalBackend(FileBasedBackend):
+    """
+    Backend for frequently saved options (counters, "last used" values).
+    Saving appends one JSON record per changed option to the file, so it
+    costs the same no matter how many options there are; reading replays
+    the records. Records are ``[name, value]`` for set options and
+    ``[name]`` for removed ones.
+
+    Once the file has more than :attr:`compact_ratio` times as many records
+    as there are options and is larger than :attr:`compact_size` bytes, it
+    is compacted (replaced by a file containing one record per option).
+    If :attr:`background_compaction` is set, that is done in a thread.
+    """
+    initial_file_content = ''
+    #: Minimal size of the file (in bytes) to compact it
+    compact_size = 64 * 1024
+    #: Minimal number of records per option to compact the file
+    compact_ratio = 4
+    #: :const:`True` if files should be compacted in a background thread
+    #: (defaults to :const:`False`)
+    background_compaction = False
+    #: How often the file was compacted
+    compaction_count = 0
+
+    def __init__(self, backref, filename=None):
+        FileBasedBackend.__init__(self, backref, 'journal', filename)
+        self.json_tree = {}
+        # number of records in the file
+        self.records = 0
+        # name -> value (NONE for removed options) of the unsaved changes
+        self._pending = ordereddict()
+        self._lock = Lock()
+        self._compaction = None
+
+    @staticmethod
+    def parse(filename):
+        tree = {}
+        records = 0
+        with open(filename, 'rb') as fobj:
+            for line in fobj:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # (e.g. cut off by a crash while appending)
+                    continue
+                if len(record) == 2:
+                    tree[record[0]] = record[1]
+                else:
+                    tree.pop(record[0], None)
+                records += 1
+        return tree, records
+
+    def read(self):
+        self.wait()
+        FileBasedBackend.read(self)
+        tree, records = self.parse_file(self.parse)
+        with self._lock:
+            self.json_tree = CopyOnWriteDict(tree)
+            self.records = records
+            self._pending.clear()
+
+    def save(self):
+        with self._lock:
+            if not self._pending:
+                return
+            lines = []
+            for name, value in self._pending.iteritems():
+                record = [name] if value is NONE else [name, value]
+                lines.append(json.dumps(record) + '\n')
+            with open(self.file, 'ab') as fobj:
+                if os.path.getsize(self.file) and \
+                   not self._ends_with_newline():
+                    # don't continue a record cut off by a crash
+                    fobj.write('\n')
+                fobj.write(''.join(lines))
+                fobj.flush()
+                if self.fsync != 'never':
+                    os.fsync(fobj.fileno())
+            self.file_written()
+            self.records += len(lines)
+            self._pending.clear()
+            compact = self._needs_compaction()
+        if compact:
+            if self.background_compaction:
+                if self._compaction is None or not self._compaction.is_alive():
+                    self._compaction = Thread(target=self.compact,
+                                              name='gpyconf-compaction')
+                    self._compaction.daemon = True
+                    self._compaction.start()
+            else:
+                self.compact()
+
+    def _ends_with_newline(self):
+        with open(self.file, 'rb') as fobj:
+            fobj.seek(-1, os.SEEK_END)
+            return fobj.read(1) == '\n'
+
+    def _needs_compaction(self):
+        return self.records > self.compact_ratio * max(len(self.json_tree), 1) \
+            and os.path.getsize(self.file) > self.compact_size
+
+    def compact(self):
+        """ Replaces the file by one containing one record per option """
+        with self._lock:
+            # (the options set but not saved yet must not be written,
+            # so the file is replayed instead of dumping the tree)
+            tree, records = self.parse_file(self.parse)
+            self.write_file(''.join(json.dumps([name, value]) + '\n'
+                                    for name, value in tree.iteritems()))
+            self.records = len(tree)
+            self.compaction_count += 1
+
+    def wait(self):
+        """ Blocks until a running background compaction is finished """
+        compaction = self._compaction
+        if compaction is not None:
+            compaction.join()
+
+    def set_option(self, name, value):
+        with self._lock:
+            self.json_tree[name] = self._pending[name] = value
+
+    def remove_option(self, name):
+        with self._lock:
+            self.json_tree.pop(name, None)
+            self._pending[name] = NONE
+
+    def get_option(self, name, default=NONE):
+        try:
+            return self.json_tree[name]
+        except KeyError:
+            if default is not NONE:
+                return default
+            else:
+                raise MissingOption(name)
+
+    def reset_all(self):
+        self.wait()
+        with self._lock:
+            self._pending.clear()
+        FileBasedBackend.reset_all(self)
+
+    @property
+    def tree(self):
+        return self.json_tree
+
+    @property
+    def options(self):
+        return self.json_tree.keys()
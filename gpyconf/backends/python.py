@@ -3,6 +3,7 @@
 
 # A backend dumping values to pure-python-code
 import __builtin__
+from .._internal.dicts import CopyOnWriteDict
 from .filebased import FileBasedBackend
 from . import NONE, MissingOption
 from pprint import pformat, isreadable
@@ -26,13 +27,18 @@ class PythonModuleBackend(FileBasedBackend):
         FileBasedBackend.__init__(self, backref, 'py', filename)
         self.module = PythonModule(self.file)
 
+    @staticmethod
+    def parse(filename):
+        # (not imported, that would return the module cached in sys.modules)
+        return PythonModule.from_file(filename).attributes
+
     def read(self):
-        self.module = PythonModule.from_module(__import__(self.file.rstrip('.py')))
+        FileBasedBackend.read(self)
+        self.module = PythonModule(self.file, CopyOnWriteDict(
+            self.parse_file(self.parse)))
 
     def save(self):
-        print self.file
-        with open(self.file, 'w') as fobj:
-            fobj.write(self.module.to_code())
+        self.write_file(self.module.to_code())
 
     def set_option(self, name, value):
         if not isreadable(value):
@@ -45,6 +51,9 @@ class PythonModuleBackend(FileBasedBackend):
             self.emit('log', "The option '%s' overwrites the builtin of the "
                              "same name" % name, level='warning')
 
+    def remove_option(self, name):
+        self.module.attributes.pop(name, None)
+
     def get_option(self, name, default=NONE):
         try:
             return self.module.attributes[name]
@@ -121,3 +130,15 @@ class PythonModule(object):
                             if not k.startswith('_')))
         return cls(module.__file__, attributes=module_dict, *kwargs)
 
+    @classmethod
+    def from_file(cls, filename, *kwargs):
+        """
+        Create a new :class:`PythonModule` with all attributes gained from
+        executing the module file ``filename`` (without importing it).
+        """
+        namespace = {'__file__' : filename}
+        execfile(filename, namespace)
+        module_dict = dict(((k, namespace[k]) for k in namespace['__all__']
+                            if not k.startswith('_')))
+        return cls(filename, attributes=module_dict, *kwargs)
+
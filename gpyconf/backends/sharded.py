@@ -0,0 +1,131 @@
+# %FILEHEADER%
+"""
+Backend storing each section's options in a file of its own
+"""
+import os
+import re
+from .._internal.utils import filename_from_classname
+from ._json import JSONBackend
+from . import Backend, NONE, MissingOption
+
+
+def _escape(match):
+    return '%%%02X' % ord(match.group())
+
+
+class ShardedBackend(Backend):
+    """
+    Stores the options of each :attr:`Field.section
+    <gpyconf.fields.Field.section>` in a file (shard) of its own, all in one
+    directory. A shard is read when a field of its section is accessed
+    first, and saving only writes the shards with changed options.
+
+    The shards are stored using :attr:`shard_backend`; fields without a
+    section are stored in the :attr:`default_shard`. In the shards' file
+    names, every character of a section except letters, digits, ``_``, ``.``
+    and ``-`` is escaped as ``%XX`` (per UTF-8 byte), so that different
+    sections never share a file.
+    """
+    lazy_sections = True
+    #: The file based backend used to store a shard
+    shard_backend = JSONBackend
+    #: Extension of the shards' files
+    shard_extension = 'json'
+    #: Name of the shard storing the options of fields without section
+    #: (``@`` is always escaped in sections, so no section is stored there)
+    default_shard = '@default'
+
+    def __init__(self, backref, directory=None):
+        Backend.__init__(self, backref)
+        self.directory = directory or filename_from_classname(backref(), 'd')
+        self.compatibility_mode = self.shard_backend.compatibility_mode
+        # section -> shard backend
+        self.shards = {}
+        # sections with options changed since the last save
+        self._dirty = set()
+
+    @property
+    def watched_files(self):
+        return tuple(shard.file for shard in self.shards.values())
+
+    def _sections(self):
+        return set(field.section for field
+                   in self.backref().__class__.fields.itervalues())
+
+    def _section_of(self, name):
+        field = self.backref().__class__.fields.get(name)
+        if field is None:
+            return None
+        return field.section
+
+    def shard_file(self, section):
+        """ Returns the path of the file storing ``section`` """
+        if section is None:
+            name = self.default_shard
+        else:
+            if isinstance(section, unicode):
+                section = section.encode('utf-8')
+            name = re.sub(r'[^\w.-]', _escape, section)
+        return os.path.join(self.directory,
+                            '%s.%s' % (name, self.shard_extension))
+
+    def _shard(self, section):
+        shard = self.shards.get(section)
+        if shard is None:
+            shard = self.shard_backend(self.backref,
+                                       filename=self.shard_file(section))
+            shard.read()
+            self.shards[section] = shard
+        return shard
+
+    def read(self):
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+        # (shards are read again when they are needed)
+        self.shards.clear()
+        self._dirty.clear()
+
+    def read_section(self, section):
+        return self._shard(section).tree
+
+    def save(self):
+        for section in self._dirty:
+            self.shards[section].save()
+        self._dirty.clear()
+
+    def set_option(self, name, value):
+        section = self._section_of(name)
+        self._shard(section).set_option(name, value)
+        self._dirty.add(section)
+
+    def remove_option(self, name):
+        section = self._section_of(name)
+        self._shard(section).remove_option(name)
+        self._dirty.add(section)
+
+    def get_option(self, name, default=NONE):
+        try:
+            return self._shard(self._section_of(name)).tree[name]
+        except KeyError:
+            if default is not NONE:
+                return default
+            else:
+                raise MissingOption(name)
+
+    def reset_all(self):
+        for section in self._sections():
+            filename = self.shard_file(section)
+            if os.path.exists(filename):
+                os.remove(filename)
+        self.read()
+
+    @property
+    def options(self):
+        return self.tree.keys()
+
+    @property
+    def tree(self):
+        tree = {}
+        for section in self._sections():
+            tree.update(self.read_section(section))
+        return tree
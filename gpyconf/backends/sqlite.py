@@ -0,0 +1,168 @@
+# %FILEHEADER%
+"""
+Backend storing options in a `SQLite <http://sqlite.org>`_ database
+"""
+import sqlite3
+from threading import Lock
+from .._internal.utils import filename_from_classname
+from . import Backend, NONE, MissingOption
+
+
+class ConnectionPool(object):
+    """
+    Shares one connection per database file between all backends using
+    this pool. Connections are opened in WAL mode, so other processes can
+    read the database while it is written to.
+    """
+    def __init__(self):
+        # filename -> (connection, lock)
+        self._connections = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def connect(filename):
+        """ Returns a new ``(connection, lock)`` pair for ``filename`` """
+        # the connection may be used by the write-behind saver's thread,
+        # the lock serializes its use
+        connection = sqlite3.connect(filename, check_same_thread=False)
+        connection.execute('PRAGMA journal_mode=WAL')
+        return connection, Lock()
+
+    def get(self, filename):
+        """ Returns the shared ``(connection, lock)`` pair for ``filename`` """
+        with self._lock:
+            if filename not in self._connections:
+                self._connections[filename] = self.connect(filename)
+            return self._connections[filename]
+
+    def close(self):
+        """ Closes all connections """
+        with self._lock:
+            for connection, lock in self._connections.itervalues():
+                with lock:
+                    connection.close()
+            self._connections.clear()
+
+#: A :class:`ConnectionPool` configurations in the same database can share
+connection_pool = ConnectionPool()
+
+
+class SQLiteBackend(Backend):
+    """
+    Stores each option in a row of its own, together with its field's
+    :attr:`section` and :attr:`group`. Several configurations can use the
+    same database, their options are told apart by the configuration's
+    class name::
+
+        class MyConfiguration(Configuration):
+            backend = SQLiteBackend.with_arguments(filename='app.sqlite')
+
+    Saving only writes the options changed since the last save, all in one
+    transaction. Each backend has a connection of its own unless
+    :attr:`pool` is set.
+    """
+    compatibility_mode = True
+    #: Name of the table to store the options in
+    table = 'options'
+    #: The :class:`ConnectionPool` to get the connection from
+    #: (:const:`None` to open a connection for this backend only)
+    pool = None
+
+    def __init__(self, backref, filename=None, pool=None):
+        Backend.__init__(self, backref)
+        self.file = filename or filename_from_classname(backref(), 'sqlite')
+        self.configuration = backref()._class_name
+        if pool is not None:
+            self.pool = pool
+        self.connection = None
+        self._options = {}
+        # name -> value (None for removed options) of the unsaved changes
+        self._changes = {}
+
+    @property
+    def watched_files(self):
+        # writes go to the write-ahead log first
+        return (self.file, self.file + '-wal')
+
+    def _connect(self):
+        if self.connection is None:
+            if self.pool is None:
+                self.connection, self._lock = ConnectionPool.connect(self.file)
+            else:
+                self.connection, self._lock = self.pool.get(self.file)
+            with self._lock:
+                with self.connection:
+                    self.connection.execute(
+                        'CREATE TABLE IF NOT EXISTS %s (configuration TEXT, '
+                        'name TEXT, section TEXT, grp TEXT, value TEXT, '
+                        'PRIMARY KEY (configuration, name))' % self.table)
+        return self.connection
+
+    def read(self):
+        connection = self._connect()
+        with self._lock:
+            rows = connection.execute(
+                'SELECT name, value FROM %s WHERE configuration = ?'
+                % self.table, (self.configuration,)).fetchall()
+        self._options = dict(rows)
+        self._changes.clear()
+
+    def save(self):
+        if not self._changes:
+            return
+        fields = self.backref().__class__.fields
+        upserts, deletes = [], []
+        for name, value in self._changes.iteritems():
+            if value is None:
+                deletes.append((self.configuration, name))
+            else:
+                field = fields.get(name)
+                section = group = None
+                if field is not None:
+                    section, group = field.section, field.group
+                upserts.append((self.configuration, name, section, group,
+                                value))
+        connection = self._connect()
+        with self._lock:
+            with connection:
+                connection.executemany(
+                    'INSERT OR REPLACE INTO %s (configuration, name, section, '
+                    'grp, value) VALUES (?, ?, ?, ?, ?)' % self.table, upserts)
+                connection.executemany(
+                    'DELETE FROM %s WHERE configuration = ? AND name = ?'
+                    % self.table, deletes)
+        self._changes.clear()
+
+    def set_option(self, name, value):
+        self._options[name] = self._changes[name] = value
+
+    def remove_option(self, name):
+        self._options.pop(name, None)
+        self._changes[name] = None
+
+    def get_option(self, name, default=NONE):
+        try:
+            return self._options[name]
+        except KeyError:
+            if default is not NONE:
+                return default
+            else:
+                raise MissingOption(name)
+
+    def reset_all(self):
+        connection = self._connect()
+        with self._lock:
+            with connection:
+                connection.execute(
+                    'DELETE FROM %s WHERE configuration = ?' % self.table,
+                    (self.configuration,))
+        self._options.clear()
+        self._changes.clear()
+
+    @property
+    def options(self):
+        return self._options.keys()
+
+    @property
+    def tree(self):
+        return self._options
@@ -1,7 +1,7 @@
 import time
 from gi.repository import Gtk as gtk, Gdk as gdk, GObject as gobject
 from gpyconf.fields import CharField
-from gpyconf.frontends.gtk.widgets import Widget, WIDGET_MAP
+from gpyconf.frontends.gtk.widgets import Widget, register_widget
 
 
 class _HotkeyString(unicode):
@@ -11,6 +11,8 @@ class _HotkeyString(unicode):
         return self
 
 class HotkeyField(CharField):
+    __slots__ = ('action',)
+
     def __init__(self, action=None, *args, **kwargs):
         CharField.__init__(self, *args, **kwargs)
         self.action = action
@@ -18,8 +20,8 @@ class HotkeyField(CharField):
     def to_python(self, value):
         return _HotkeyString(value)
 
-    def __valid__(self):
-        return gtk.accelerator_valid(*(gtk.accelerator_parse(self.value)))
+    def __valid__(self, value):
+        return gtk.accelerator_valid(*(gtk.accelerator_parse(value)))
 
 class HotkeyButton(gtk.Button):
 
@@ -99,6 +101,4 @@ class HotkeyWidget(Widget):
 
 
 # automagically register all the widgets for the new fields
-WIDGET_MAP.update({
-    'HotkeyField' : HotkeyWidget
-})
+register_widget('HotkeyField', HotkeyWidget)
@@ -1,8 +1,12 @@
 # %FILEHEADER%
 
+import weakref
 from collections import defaultdict
 from functools import partial
-from types import FunctionType
+from itertools import count
+from types import FunctionType, MethodType
+
+_handler_ids = count(1)
 
 class InvalidEvent(Exception):
     """
@@ -16,6 +20,45 @@ class InvalidEvent(Exception):
         return self.event
 
 
+class Handler(object):
+    """
+    A callback registered at an :class:`EventRegister`. ``call`` is what is
+    actually called on emit; for weak handlers it's a wrapper that only holds
+    weak references to the callback (or to the method's instance).
+    """
+    __slots__ = ('id', 'event', 'call', 'lazy', 'blocked')
+
+    def __init__(self, event, callback, lazy=False, weak=False, on_dead=None):
+        self.id = next(_handler_ids)
+        self.event = event
+        self.lazy = lazy
+        self.blocked = False
+        if weak:
+            self.call = self._weak_call(callback, on_dead)
+        else:
+            self.call = callback
+
+    def _weak_call(self, callback, on_dead):
+        handler_id = self.id
+        def dead(ref):
+            if on_dead is not None:
+                on_dead(handler_id)
+        if isinstance(callback, MethodType) and callback.im_self is not None:
+            func = callback.im_func
+            ref = weakref.ref(callback.im_self, dead)
+            def call(*args, **kwargs):
+                obj = ref()
+                if obj is not None:
+                    return func(obj, *args, **kwargs)
+        else:
+            ref = weakref.ref(callback, dead)
+            def call(*args, **kwargs):
+                func = ref()
+                if func is not None:
+                    return func(*args, **kwargs)
+        return call
+
+
 class EventRegister(object):
     """
     Very simple event handler. Listening functions can register themselves
@@ -73,6 +116,34 @@ class EventRegister(object):
     First callback
     Second callback
     Last callback
+
+    Registering returns a handler id that can be used to block or to remove
+    that callback again:
+    >>> events = EventRegister()
+    >>> def callback():
+    ...     print "Called"
+    >>> handler_id = events.register_event('foo', callback)
+    >>> events.block_handler(handler_id)
+    >>> events.emit('foo')
+    >>> events.unblock_handler(handler_id)
+    >>> events.emit('foo')
+    Called
+    >>> events.remove_handler(handler_id)
+    >>> events.emit('foo')
+
+    Weak callbacks do not keep the callback (or, for methods, the method's
+    instance) alive and are removed as soon as it is garbage collected:
+    >>> class Listener(object):
+    ...     def callback(self):
+    ...         print "Listener called"
+    >>> listener = Listener()
+    >>> handler_id = events.register_event('foo', listener.callback, weak=True)
+    >>> events.emit('foo')
+    Listener called
+    >>> del listener
+    >>> events.emit('foo')
+    >>> events.has_handler(handler_id)
+    False
     """
     strict = False
     initialized = False
@@ -80,9 +151,12 @@ class EventRegister(object):
     def __init__(self):
         if hasattr(self, '__events__'):
             self.strict = True
-            self.__events__ = list(self.__events__)
+            self.__events__ = set(self.__events__)
         self.events = defaultdict(list)
         self.all_events_listener = []
+        self.handlers = {}
+        # event -> (eager callbacks, lazy callbacks), built on first emit
+        self._dispatch_tables = {}
 
     def __getattr__(self, event):
         if event == '__events__':
@@ -99,7 +173,7 @@ class EventRegister(object):
                 return wrapper
         return register_event
 
-    def register_event(self, event, callback, lazy=False):
+    def register_event(self, event, callback, lazy=False, weak=False):
         """
         Register ``callback`` for ``event``. This is similar to ::
 
@@ -108,14 +182,83 @@ class EventRegister(object):
                 ...
 
         where ``myevent`` is the value of the ``event`` attribute.
+
+        If ``weak`` is true, only a weak reference to ``callback`` (or, if it
+        is a bound method, to its instance) is kept and the callback is
+        removed once that object was garbage collected.
+
+        Returns the handler id of the callback.
         """
-        callback.__dict__['lazy'] = lazy
         if event == 'all':
-            self.all_events_listener.append(callback)
+            listeners = self.all_events_listener
         elif self.strict and event not in self.__events__:
             raise InvalidEvent(event)
         else:
-            self.events[event].append(callback)
+            listeners = self.events[event]
+        on_dead = None
+        if weak:
+            on_dead = partial(self._remove_dead_handler, weakref.ref(self))
+        handler = Handler(event, callback, lazy, weak, on_dead)
+        listeners.append(handler)
+        self.handlers[handler.id] = handler
+        self._dispatch_tables.clear()
+        return handler.id
+
+    def remove_handler(self, handler_id):
+        """
+        Remove the callback with id ``handler_id``. Raises :exc:`KeyError`
+        if there's no such handler.
+        """
+        handler = self.handlers.pop(handler_id)
+        if handler.event == 'all':
+            self.all_events_listener.remove(handler)
+        else:
+            self.events[handler.event].remove(handler)
+            if not self.events[handler.event]:
+                del self.events[handler.event]
+        self._dispatch_tables.clear()
+
+    def block_handler(self, handler_id):
+        """
+        Block the callback with id ``handler_id``: It won't be called until
+        it's unblocked using :meth:`unblock_handler`.
+        """
+        self.handlers[handler_id].blocked = True
+        self._dispatch_tables.clear()
+
+    def unblock_handler(self, handler_id):
+        """ Undo :meth:`block_handler` """
+        self.handlers[handler_id].blocked = False
+        self._dispatch_tables.clear()
+
+    def has_handler(self, handler_id):
+        """ Returns whether a callback with id ``handler_id`` is registered """
+        return handler_id in self.handlers
+
+    @staticmethod
+    def _remove_dead_handler(register_ref, handler_id):
+        """ Removes a weak handler whose callback was garbage collected """
+        register = register_ref()
+        if register is not None and handler_id in register.handlers:
+            register.remove_handler(handler_id)
+
+    def _build_dispatch_table(self, event):
+        """
+        Builds the ``(eager, lazy)`` callback tuples for ``event``. Called the
+        first time ``event`` is emitted after callbacks were (un)registered.
+        """
+        if self.strict and event not in self.__events__:
+            raise InvalidEvent(event)
+        eager, lazy = [], []
+        for handler in self.events.get(event, ()):
+            if not handler.blocked:
+                (lazy if handler.lazy else eager).append(handler.call)
+        for handler in self.all_events_listener:
+            if not handler.blocked:
+                (lazy if handler.lazy else eager).append(
+                    partial(handler.call, event))
+        table = self._dispatch_tables[event] = (tuple(eager), tuple(lazy))
+        return table
 
     def emit(self, event, *args, **kwargs):
         """
@@ -126,26 +269,14 @@ class EventRegister(object):
         Raises :exc:`InvalidEvent` if mode is strict and ``event`` is not
         defined in :attr:`__events__`.
         """
-        if self.strict and event not in self.__events__:
-            raise InvalidEvent(event)
-
-        lazy_callbacks = []
-
-        if event in self.events:
-            for func in self.events[event]:
-                if func.__dict__['lazy']:
-                    lazy_callbacks.append(func)
-                else:
-                    func(*args, **kwargs)
-
+        try:
+            eager, lazy = self._dispatch_tables[event]
+        except KeyError:
+            eager, lazy = self._build_dispatch_table(event)
 
-        for func in self.all_events_listener:
-            if func.lazy:
-                lazy_callbacks.append(partial(event, func))
-            else:
-                func(event, *args, **kwargs)
-
-        for func in lazy_callbacks:
+        for func in eager:
+            func(*args, **kwargs)
+        for func in lazy:
             func(*args, **kwargs)
 
 
@@ -175,34 +306,94 @@ class GSignals(object):
     Connected callbacks always have to take a ``sender`` as first argument
     (this is for GSignals compatibility reasons).
 
-    :attr:`events` attribute: The :class:`GEventRegister`.
+    :attr:`events` attribute: The :class:`GEventRegister`. It is created
+    when it's first needed (e.g. when connecting to a signal), so objects
+    nobody listens to don't carry an event register.
     """
+    # (subclasses using __slots__ need an `_event_register` slot)
+    __slots__ = ()
+    __events__ = ()
     __gsignals__ = None
+    #: Events allowed in addition to :attr:`__events__`
+    __base_events__ = ()
 
     def __init__(self):
-        events = self.__events__
-        if self.__gsignals__ is None:
-            self.__gsignals__ = {}
-        else:
-            events += self.__gsignals__.keys()
-            # throw away gsignals parameter definitions (this is gobject-C-stuff)
-        self.events = GEventRegister(events)
+        pass
+
+    @classmethod
+    def _class_events(cls):
+        """
+        Returns (and caches) the :class:`frozenset` of events allowed for
+        ``cls``
+        """
+        events = cls.__dict__.get('_class_event_set')
+        if events is None:
+            events = list(cls.__events__) + list(cls.__base_events__)
+            if cls.__gsignals__ is not None:
+                # throw away gsignals parameter definitions (this is gobject-C-stuff)
+                events += cls.__gsignals__.keys()
+            events = cls._class_event_set = frozenset(events)
+        return events
+
+    @property
+    def events(self):
+        try:
+            return self._event_register
+        except AttributeError:
+            self._event_register = GEventRegister(self._class_events())
+            return self._event_register
+
+    def connect(self, signal, callback, lazy=False, weak=False):
+        """
+        Connect ``callback`` to ``signal`` and return the handler id.
 
-    def connect(self, signal, callback, lazy=False):
-        """ Connect ``callback`` to ``signal`` """
-        self.events.register_event(signal, callback, lazy)
+        If ``weak`` is true, the connection doesn't keep ``callback`` (or,
+        if it is a bound method, its instance) alive; the callback is
+        disconnected automatically once it was garbage collected.
+        """
+        return self.events.register_event(signal, callback, lazy, weak)
+
+    def disconnect(self, handler_id):
+        """ Disconnect the callback with id ``handler_id`` """
+        self.events.remove_handler(handler_id)
+
+    def handler_block(self, handler_id):
+        """
+        Block the callback with id ``handler_id`` (it won't be called when
+        its signal is emitted until it's unblocked again)
+        """
+        self.events.block_handler(handler_id)
+
+    def handler_unblock(self, handler_id):
+        """ Unblock the callback with id ``handler_id`` """
+        self.events.unblock_handler(handler_id)
+
+    def handler_is_connected(self, handler_id):
+        """ Returns whether a callback with id ``handler_id`` is connected """
+        try:
+            events = self._event_register
+        except AttributeError:
+            return False
+        return events.has_handler(handler_id)
 
     def emit(self, signal, *args, **kwargs):
         """ Emit ``signal`` """
-        self.events.emit(signal, self, *args, **kwargs)
+        try:
+            events = self._event_register
+        except AttributeError:
+            # nobody connected yet
+            if signal not in self._class_events():
+                raise InvalidEvent(signal)
+        else:
+            events.emit(signal, self, *args, **kwargs)
 
     def add_events(self, events):
         """ Add a list of events to the allowed events """
-        self.events.__events__ += list(events)
+        self.events.__events__.update(events)
 
     def add_event(self, event):
         """ Add a event to the allowed events """
-        self.events.__events__ += [event]
+        self.events.__events__.add(event)
 
 
 if __name__ == '__main__':
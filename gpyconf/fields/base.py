@@ -3,10 +3,33 @@
 
 # Contains the base classes for gpyconf fields.
 
+from itertools import count
 from ..mvc import MVCComponent
 from .._internal.exceptions import InvalidOptionError
 
-__all__= ('Field',)
+__all__= ('Field', 'BoundField')
+
+# we want the fields exactly in the order we defined them,
+# so we'll need a creation counter because the fields are
+# handled by ConfigurationMeta using dicts (which aren't sorted)
+_creation_counter = count()
+
+# attributes stored in Field slots that have class-level default values
+# (subclasses may give class-level values to any slotted attribute)
+SLOT_DEFAULTS = ('default', 'blank', 'dynamic_default')
+
+
+def _slots(bases, dct):
+    """ Returns the names of all slots of a class with ``bases`` and ``dct`` """
+    slots = set()
+    for base in bases:
+        for klass in base.__mro__:
+            names = getattr(klass, '__slots__', ())
+            slots.update((names,) if isinstance(names, basestring) else names)
+    names = dct.get('__slots__', ())
+    slots.update((names,) if isinstance(names, basestring) else names)
+    return slots
+
 
 class Field(MVCComponent):
     """
@@ -18,7 +41,9 @@ class Field(MVCComponent):
         Second label (not used by all frontends)
     :param default:
         Default field's value. If ``default`` is :const:`None`, the field's
-        pre-defined default value is used for default.
+        pre-defined default value is used for default. Fields that compute
+        their pre-defined default (using a :meth:`custom_default` method) do
+        that once on initialization, unless :attr:`dynamic_default` is set.
     :param blank:
         :const:`True` if blank value should be allowed when saving.
         Defaults to ``False`` for most fields, but there are fields (e.g.
@@ -48,28 +73,53 @@ class Field(MVCComponent):
         processed by that field. If there are remaining (unused)
         arguments after that call, a :exc:`TypeError` is raised.
 
+    Fields only describe a configuration option; they don't hold a value.
+    Values are stored per :class:`gpyconf.Configuration` instance, use the
+    instance's :attr:`fields` attribute to get :class:`BoundField`
+    objects that combine the field with that instance's value.
     """
     class __metaclass__(type):
         def __new__(cls, name, bases, dct):
             dct.setdefault('abstract', False)
+            # slotted attributes can't have class-level values,
+            # so those are moved to `_class_defaults`
+            class_defaults = {}
+            for base in reversed(bases):
+                class_defaults.update(getattr(base, '_class_defaults', ()))
+            for attribute in _slots(bases, dct):
+                if attribute in dct:
+                    class_defaults[attribute] = dct.pop(attribute)
+            dct['_class_defaults'] = class_defaults
             return type.__new__(cls, name, bases, dct)
+
+    # Fields are created in large numbers, so they don't have a __dict__.
+    # Subclasses should define __slots__ for their attributes, too.
+    __slots__ = ('_event_register', 'label', 'label2', '_editable', 'hidden',
+                 'section', 'group', 'field_var', 'creation_counter',
+                 'is_initialized') + SLOT_DEFAULTS
     abstract = True
-    creation_counter = 0
     default = None
+    blank = False
+    #: :const:`True` if the field's :meth:`custom_default` should be called
+    #: every time the default value is needed (e.g. for "now" timestamps)
+    dynamic_default = False
+    #: :const:`True` if values of this field are mutable objects. Mutable
+    #: default values are (deeply) copied (:meth:`copy_value`) before handed
+    #: out, so changing a value in place never changes the default.
+    mutable = False
     __events__ = (
         'initialized',
         'init-widget',
-        'value-changed',
-        'reset-value',
         'set-editable'
     )
 
-    is_initialized = False
-
     def __init__(self, label=None, section=None, default=None, blank=None,
                  editable=True, hidden=False, group=None, label2=None, **kwargs):
         MVCComponent.__init__(self)
+        self.is_initialized = False
         self.update_counter()
+        for attribute, value in self._class_defaults.iteritems():
+            setattr(self, attribute, value)
 
         self.label = label
         self.label2 = label2
@@ -77,11 +127,13 @@ class Field(MVCComponent):
         self.hidden = hidden
         self.section = section
         self.group = group
+        self.field_var = None
 
         if blank is not None:
             self.blank = blank
 
-        self.connect('initialized', self.on_initialized)
+        # (called directly, connecting would allocate an event register)
+        self.on_initialized(self, kwargs)
         self.emit('initialized', kwargs)
         self._external_on_initialized(kwargs) # quick n dirty for cream
         if kwargs:
@@ -99,15 +151,19 @@ class Field(MVCComponent):
                     % (self._class_name, ', '.join(kwargs.iterkeys()))
                 )
 
+        # resolve the default once
+        if hasattr(self, 'custom_default'):
+            self.default = self.custom_default()
         if default is not None:
-            self._user_set_default = self.to_python(default)
-        self._value = self.default
+            self.default = self.to_python(default)
+            self.dynamic_default = False
         self.is_initialized = True
         # we're done (yes, rlly!)
 
     def on_initialized(self, sender, kwargs):
         """
-        Called after initialization (connected to the `initialized` signal).
+        Called after initialization (before the `initialized` signal is
+        emitted).
         Fields that take additional keyword arguments have to handle their
         stuff here.
 
@@ -124,55 +180,37 @@ class Field(MVCComponent):
         pass
 
     def update_counter(self):
-        # we want the fields exactly in the order we defined them,
-        # so we'll need a creation counter because the fields are
-        # handled by ConfigurationMeta using dicts (which aren't sorted)
-        self.creation_counter = Field.creation_counter
-        Field.creation_counter += 1
-
-    def __getattribute__(self, attribute):
-        if attribute == 'default':
-            if hasattr(self, '_user_set_default'):
-                return self._user_set_default
-            elif hasattr(self, 'custom_default'):
-                return self.custom_default()
-        return object.__getattribute__(self, attribute)
-
-    def __setattr__(self, attribute, value):
-        if attribute == 'default':
-            self._user_set_default = value
-        else:
-            super(Field, self).__setattr__(attribute, value)
+        self.creation_counter = next(_creation_counter)
 
-    def get_value(self):
-        """ Returns the (pythonic) value of the widget """
-        return self._value
-
-    def set_value(self, value):
+    def get_default(self):
         """
-        Validates ``value`` (using the :meth:`to_python` method) and
-        stores it.
-
-        Emits the :signal:`value-changed` signal if the field's value changed.
+        Returns the default value (a new one for fields with a
+        :attr:`dynamic_default`, a copy for :attr:`mutable` fields)
         """
-        if not self.editable:
-            raise AttributeError("Can't change value of non-editable field %r"
-                % self._class_name)
-        value = self.to_python(value)
-        emit = value != self.value
-        self._value = value
-        if emit:
-            self.emit('value-changed', self, value)
-        return value
-
-    #: The field's current value.
-    # Property for :meth:`get_value` and :meth:`set_value`
-    value = property(get_value, set_value)
+        default = self._get_default()
+        if self.mutable and default is self.default:
+            return self.copy_value(default)
+        return default
+
+    def _get_default(self):
+        # like `get_default`, but returns the shared default of mutable
+        # fields (configurations copy it when it's handed out first)
+        if self.dynamic_default:
+            return self.custom_default()
+        return self.default
+
+    def copy_value(self, value):
+        """
+        Returns a deep copy of ``value`` (only called for :attr:`mutable`
+        fields), so that nested objects aren't shared either
+        """
+        from copy import deepcopy
+        return deepcopy(value)
 
-    def isvalid(self):
+    def isvalid(self, value):
         """
-        Returns :const:`True` if the current value is a valid one
-        (returns :const:`False` if the current value is an invalid one).
+        Returns :const:`True` if ``value`` is a valid one
+        (returns :const:`False` if ``value`` is an invalid one).
 
         .. note::
 
@@ -180,17 +218,17 @@ class Field(MVCComponent):
             this method, overwrite the :meth:`__valid__` method instead.
 
         """
-        return self.__valid__()
+        return self.__valid__(value)
 
-    def __valid__(self):
+    def __valid__(self, value):
         """
         (Only for interesting if you're developing your own field)
 
-        Returns :const:`True` if the current field value is valid.
+        Returns :const:`True` if ``value`` is valid.
         You can do time-consuming checks like validating an email address
         or an URL here.
 
-        Returns :const:`False` if the current value is invalid.
+        Returns :const:`False` if ``value`` is invalid.
         """
         return True
 
@@ -208,12 +246,12 @@ class Field(MVCComponent):
         }
         raise InvalidOptionError(self, message, *args, **kwargs)
 
-    def __blank__(self):
-        return self.value is None
+    def __blank__(self, value):
+        return value is None
 
-    def isblank(self):
+    def isblank(self, value):
         """
-        Returns :const:`True` if this value is blank (empty).
+        Returns :const:`True` if ``value`` is blank (empty).
 
         .. note::
 
@@ -222,12 +260,7 @@ class Field(MVCComponent):
             instead.
 
         """
-        return self.__blank__()
-
-    def reset_value(self):
-        """ Reset to the field's default value """
-        self.value = self.default
-        self.emit('reset-value')
+        return self.__blank__(value)
 
     def to_python(self, value):
         """
@@ -268,12 +301,6 @@ class Field(MVCComponent):
         """
         return value
 
-    def setfromconf(self, value):
-        """
-        Set the field's value to ``value`` piped through :meth:`conf_to_python`
-        """
-        self.value = self.conf_to_python(value)
-
     def get_editable(self):
         return self._editable
 
@@ -284,3 +311,57 @@ class Field(MVCComponent):
 
     #: :const:`True` if this field is editable
     editable = property(get_editable, set_editable)
+
+
+class BoundField(object):
+    """
+    A :class:`Field` bound to a :class:`gpyconf.Configuration` instance.
+
+    Attribute access is forwarded to the field, the :attr:`value` is that
+    of the configuration instance the field is bound to.
+    """
+    __slots__ = ('field', 'configuration')
+
+    def __init__(self, field, configuration):
+        self.field = field
+        self.configuration = configuration
+
+    def __getattr__(self, attribute):
+        return getattr(self.field, attribute)
+
+    def __repr__(self):
+        return '<Bound %s %r>' % (self.field._class_name, self.field.field_var)
+
+    def get_value(self):
+        """ Returns the (pythonic) value of the field """
+        return self.configuration._get_value(self.field.field_var)
+
+    def set_value(self, value):
+        """
+        Validates ``value`` (using the field's :meth:`Field.to_python`
+        method) and stores it in the configuration instance.
+        """
+        return self.configuration._set_value(self.field.field_var, value)
+
+    #: The field's current value.
+    # Property for :meth:`get_value` and :meth:`set_value`
+    value = property(get_value, set_value)
+
+    def isvalid(self):
+        """ Returns :const:`True` if the current value is a valid one """
+        return self.field.isvalid(self.value)
+
+    def isblank(self):
+        """ Returns :const:`True` if the current value is blank (empty) """
+        return self.field.isblank(self.value)
+
+    def reset_value(self):
+        """ Reset to the field's default value """
+        self.configuration._reset_value(self.field.field_var)
+
+    def setfromconf(self, value):
+        """
+        Set the field's value to ``value`` piped through
+        :meth:`Field.conf_to_python`
+        """
+        self.value = self.field.conf_to_python(value)
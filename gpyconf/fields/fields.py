@@ -14,6 +14,7 @@ from .mutable import *
 
 class BooleanField(Field):
     """ A field representing the :class:`bool` datatype """
+    __slots__ = ()
     allowed_types = 'boolean compatibles (True, False, 1, 0)'
     default = False
 
@@ -60,6 +61,7 @@ class MultiOptionField(Field):
             (42, 'Select me for the answer to Life, the Universe, and Everything')
         ))
     """
+    __slots__ = ('options', 'values')
     # TODO: Rewrite this Field and make it use real dictionaries.
     def custom_default(self):
         return self.values[0]
@@ -107,6 +109,7 @@ class NumberField(Field):
     :param max:
         The maxmimal value allowed, defaults to 100.
     """
+    __slots__ = ('min', 'max')
     abstract = True
     min = 0
     max = 100
@@ -114,10 +117,13 @@ class NumberField(Field):
     def custom_default(self):
         return self.min
 
+    def allowed_types(self):
+        return '%s values between %s and %s' % (self.num_type.__name__,
+                                                self.min, self.max)
+
     def on_initialized(self, sender, kwargs):
-        for key in ('min', 'max'):
-            if key in kwargs:
-                setattr(self, key, kwargs.pop(key))
+        self.min = kwargs.pop('min', self.min)
+        self.max = kwargs.pop('max', self.max)
 
     def python_to_conf(self, value):
         return unicode(value)
@@ -131,24 +137,27 @@ class NumberField(Field):
         except (TypeError, ValueError):
             self.validation_error(value)
 
-    def __valid__(self):
-        return not (self.min > self.value or self.value > self.max)
+    def __valid__(self, value):
+        return not (self.min > value or value > self.max)
 
 class IntegerField(NumberField):
+    __slots__ = ()
     num_type = int
 
 class FloatField(IntegerField):
+    __slots__ = ()
     num_type = float
 
 
 class CharField(Field):
     """ A simple on-line-input field """
+    __slots__ = ()
     allowed_types = 'unicode-strings'
     default = ''
     blank = True
 
-    def __blank__(self):
-        return self.value == ''
+    def __blank__(self, value):
+        return value == ''
 
     def to_python(self, value):
         return unicode(value)
@@ -157,6 +166,7 @@ class PasswordField(CharField):
     """
     A simple password field. Saves values as a base64 encoded unicode-string.
     """
+    __slots__ = ()
 
     def python_to_conf(self, value):
         # we want at least some basic password covering
@@ -171,15 +181,17 @@ class PasswordField(CharField):
             # which will be catched by get_value
 
 class IPAddressField(CharField):
-    def __valid__(self):
+    __slots__ = ()
+
+    def __valid__(self, value):
         import socket
         try:
             # try ipv4
-            socket.inet_pton(socket.AF_INET, self.value)
+            socket.inet_pton(socket.AF_INET, value)
         except socket.error:
             try:
                 # try ipv6
-                socket.inet_pton(socket.AF_INET6, self.value)
+                socket.inet_pton(socket.AF_INET6, value)
             except socket.error:
                 # both failed
                 return False
@@ -193,12 +205,13 @@ class URIField(CharField):
     An URI follows the following scheme::
         scheme://scheme specific part
     """
+    __slots__ = ()
     _scheme = '[a-z][a-z\.\-:\d]*://.*'
     allowed_types = "unicode strings following the URI scheme (%r)" % _scheme
 
-    def __valid__(self):
+    def __valid__(self, value):
         from re import match
-        return match(self._scheme, self.value)
+        return match(self._scheme, value)
 
 class URLField(CharField):
     """
@@ -209,6 +222,7 @@ class URLField(CharField):
     :class:`urlparse.ParseResult` or :class:`unicode` may be used to update
     this field's value.
     """
+    __slots__ = ()
     allowed_types = 'unicode-strings and urlparse.ParseResults'
 
     def custom_default(self):
@@ -236,6 +250,8 @@ class FileField(URLField):
     (something like ``http://`` or ``file://``) are handled as if they had
     the ``file://`` scheme.
     """
+    __slots__ = ()
+
     def custom_default(self):
         from urlparse import urlparse
         return urlparse('file:///')
@@ -249,16 +265,22 @@ class FileField(URLField):
 
 class EmailAddressField(CharField):
     """ A field for email addresses """
+    __slots__ = ()
     allowed_types = 'unicode-strings following the email address scheme'
 
 class TextField(CharField):
     """ A field for (multi-line) text input """
-    pass
+    __slots__ = ()
 
 
 class DateTimeField(Field):
-    """ A field for date/time input """
+    """
+    A field for date/time input. The default value is the time the default
+    is needed (e.g. when the configuration is initialized).
+    """
+    __slots__ = ()
     allowed_types = 'datetime.datetime instances'
+    dynamic_default = True
 
     def custom_default(self):
         from datetime import datetime
@@ -278,13 +300,14 @@ class DateTimeField(Field):
         # we throw away the microsecond thing - it's irrelevant
         # and causes problems with conversion using `time.mktime`
 
-    def __valid__(self):
+    def __valid__(self, value):
         from datetime import datetime
-        return isinstance(self.value, datetime)
+        return isinstance(value, datetime)
 
 
 class ColorField(Field):
     """ A field for color selections """
+    __slots__ = ()
     _changed_signal = 'color-set'
     allowed_types = 'hexadecimal color strings (#RRGGBB) or ' \
                     'a tuple of integers (r, g, b)'
@@ -319,6 +342,8 @@ class FontField(DictField):
     empty, the `color` key then defaults to `#000000` (black) and the
     `bold` and `italic` and `underlined` default to :const:`False`
     """
+    __slots__ = ()
+
     def custom_default(self):
         return {'name' : 'Sans', 'size' : 10, 'color' : '#000000',
                 'italic' : False, 'bold' : False, 'underlined' : False}
@@ -5,6 +5,9 @@ __all__ = ('ListField', 'DictField')
 
 class ListField(Field):
     # TODO: Docs
+    __slots__ = ('length', 'item_type')
+    mutable = True
+
     def custom_default(self):
         return list()
 
@@ -31,16 +34,19 @@ class ListField(Field):
         from .._internal.serializers import unserialize_list
         return unserialize_list(value, self.item_type)
 
-    def __valid__(self):
-        if self.length is not None and self.length != len(self.value):
+    def __valid__(self, value):
+        if self.length is not None and self.length != len(value):
             return False
         if self.item_type is not None:
-            return all(isinstance(item, self.item_type) for item in self.value)
+            return all(isinstance(item, self.item_type) for item in value)
         return True
 
 
 class DictField(Field):
     # TODO: Docs
+    __slots__ = ('keys', 'merge_default', 'statically_typed')
+    mutable = True
+
     def custom_default(self):
         return dict()
 
@@ -55,7 +61,9 @@ class DictField(Field):
         self.statically_typed = isinstance(self.keys, dict)
 
     def _keys_setfromdefault(self):
-        self.keys = dict((k, type(v)) for k, v in self.default.iteritems())
+        # called on initialization, before the default is resolved
+        self.keys = dict((k, type(v)) for k, v in
+                         self.custom_default().iteritems())
 
     def type_of(self, key):
         if not self.statically_typed:
@@ -75,7 +83,8 @@ class DictField(Field):
             if not self.merge_default:
                 return to_dict(value)
             else:
-                return dict(self.default, **to_dict(value))
+                # (don't share the default's values)
+                return dict(self.copy_value(self.default), **to_dict(value))
         except TypeError:
             self.validation_error(value)
 
@@ -91,13 +100,13 @@ class DictField(Field):
         from .._internal.serializers import serialize_dict
         return serialize_dict(value)
 
-    def __valid__(self):
+    def __valid__(self, value):
         if not self.keys: return True # no validation, so always True
 
-        if set(self.keys) != set(self.value): return False # different keys
+        if set(self.keys) != set(value): return False # different keys
         if not self.statically_typed: return True
 
-        for k, v in self.value.iteritems():
+        for k, v in value.iteritems():
             if not isinstance(v, self.keys[k]):
                 return False
         return True
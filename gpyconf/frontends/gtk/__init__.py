@@ -5,18 +5,21 @@ gpyconf GTK+ frontend
 
 Every :class:`Field <gpyconf.fields.base.Field>` is mapped to a :class:`Widget`,
 which handles interaction between GTK widgets and gpyconf fields.
-That mapping is defined in :attr:`widget.WIDGET_MAP`.
+That mapping is defined in :attr:`widget.WIDGET_MAP`; fields without a widget
+of their own use the widget of the nearest base class that has one.
 
-Sections are separated using tabs.
+Sections are separated using tabs. A section's widgets are built when its tab
+is shown first.
 
-Custom widgets to be added to the mapping have to be inherited from the
-:class:`Widget` base class and have to implement all documented methods.
+Custom widgets to be added to the mapping (using :func:`widgets.register_widget`)
+have to be inherited from the :class:`Widget` base class and have to implement
+all documented methods.
 """
 from gi.repository import Gtk as gtk
 
 from gpyconf.frontends import Frontend
 from gpyconf._internal.exceptions import InvalidOptionError
-from widgets import get_widget_for_field
+from widgets import get_widget_for_field, get_widget_class
 from .utils import *
 
 class ConfigurationOption(object):
@@ -27,8 +30,7 @@ class ConfigurationOption(object):
         self.label = label
         self.post_label = post_label
 
-        self.interface = gtk.Builder()
-        self.interface.add_from_file(joindir(__file__, 'interface/option.ui'))
+        self.interface = load_interface('option')
 
         self.label_container = self.interface.get_object('label_container')
         self.post_label_container = self.interface.get_object('post_label_container')
@@ -53,8 +55,7 @@ class ConfigurationGroup(object):
 
         self.title = title
 
-        self.interface = gtk.Builder()
-        self.interface.add_from_file(joindir(__file__, 'interface/group.ui'))
+        self.interface = load_interface('group')
 
         self.group = self.interface.get_object('group')
         self.table = self.interface.get_object('table')
@@ -86,11 +87,9 @@ class ConfigurationGroup(object):
             self.table.attach(option.widget_container, 0, 2, row, row+1, xoptions=gtk.Align.FILL)
 
 
-    def add_field(self, field):
+    def add_field(self, field, widget):
 
-        opt = ConfigurationOption(field.widget.widget,
-                                  field.widget.label,
-                                  field.widget.label2)
+        opt = ConfigurationOption(widget.widget, widget.label, widget.label2)
         self.options[field.field_var] = opt
         self.append_option(opt)
 
@@ -103,8 +102,7 @@ class ConfigurationSection(object):
 
         self.title = title
 
-        self.interface = gtk.Builder()
-        self.interface.add_from_file(joindir(__file__, 'interface/section.ui'))
+        self.interface = load_interface('section')
 
         self.section = self.interface.get_object('section')
         self.layout = self.interface.get_object('layout')
@@ -114,12 +112,12 @@ class ConfigurationSection(object):
         self.section.pack_start(option.group, True, False, 0)
 
 
-    def add_field(self, field):
+    def add_field(self, field, widget):
         group = self.groups.get(field.group)
         if group is None:
             self.groups[field.group] = group = ConfigurationGroup(title=field.group)
             self.layout.pack_start(group.group, False, False, 5)
-        group.add_field(field)
+        group.add_field(field, widget)
 
 
 class ConfigurationDialog(Frontend):
@@ -128,11 +126,18 @@ class ConfigurationDialog(Frontend):
 
         Frontend.__init__(self)
 
+        self.fields = fields
         self.sections = {}
         self.widgets = {}
+        # section -> notebook page
+        self.pages = {}
+        # section -> (field, widget class) pairs to build when the section's
+        # page is shown first
+        self._pending = {}
+        # name of the field whose widget's value is being committed
+        self._committing = None
 
-        self.interface = gtk.Builder()
-        self.interface.add_from_file(joindir(__file__, 'interface/dialog.ui'))
+        self.interface = load_interface('dialog')
 
         self.dialog = self.interface.get_object('dialog')
         self.layout = self.interface.get_object('layout')
@@ -141,15 +146,25 @@ class ConfigurationDialog(Frontend):
         if title:
             self.dialog.set_title(title)
 
+        # don't let the configuration keep closed dialogs alive
+        backref().connect('field-value-changed', self.on_field_value_changed,
+                          weak=True)
+        backref().connect('fields-changed', self.on_fields_changed, weak=True)
+
         for name, field in fields.iteritems():
             if field.hidden: continue
             self.add_field(field, ignore_missing_widgets)
 
+        # only build the visible section now, the others follow when
+        # their page is switched to
+        self.content.connect('switch-page', self.on_switch_page)
+        self.on_switch_page(self.content, None, self.content.get_current_page())
+
 
     def add_field(self, field, ignore_missing_widgets):
 
         try:
-            field.widget = get_widget_for_field(field)
+            widget_class = get_widget_class(field)
         except NotImplementedError:
             # TODO: Eliminate.
             if ignore_missing_widgets:
@@ -157,37 +172,91 @@ class ConfigurationDialog(Frontend):
             else:
                 raise
 
+        if field.section not in self.pages:
+            self.add_page(field.section)
+
         section = self.sections.get(field.section)
         if section is None:
-            self.sections[field.section] = section = ConfigurationSection()
-            if field.section:
-                self.content.append_page(section.section, gtk.Label(field.section))
-            else:
-                self.content.insert_page(section.section, gtk.Label("General"), position=0)
-            self.content.set_current_page(0)
+            self._pending[field.section].append((field, widget_class))
+        else:
+            self.add_widget(section, field, widget_class)
+
+
+    def add_page(self, name):
+
+        self.pages[name] = page = gtk.VBox()
+        self._pending[name] = []
+        page.show()
+        if name:
+            self.content.append_page(page, gtk.Label(name))
+        else:
+            self.content.insert_page(page, gtk.Label("General"), position=0)
+        self.content.set_current_page(0)
 
         if self.content.get_n_pages() > 1:
             self.content.set_show_tabs(True)
             self.content.set_show_border(True)
 
-        section.add_field(field)
 
-        field.connect('value-changed', self.on_field_value_changed)
-        field.widget.connect('log', self.on_widget_log)
-        field.widget.connect('value-changed', self.on_widget_value_changed)
+    def build_section(self, name):
+        """
+        Builds the widgets of section ``name`` (if that wasn't done before).
+        """
+        fields = self._pending.pop(name, None)
+        if fields is None:
+            return
+        self.sections[name] = section = ConfigurationSection()
+        page = self.pages[name]
+        page.pack_start(section.section, True, True, 0)
+        for field, widget_class in fields:
+            self.add_widget(section, field, widget_class)
+        page.show_all()
+
+
+    def add_widget(self, section, field, widget_class):
+
+        # (the widget gets the field's current value, so changes made before
+        # the section was built are not lost)
+        widget = widget_class(field)
+        section.add_field(field, widget)
+
+        widget.connect('log', self.on_widget_log)
+        widget.connect('value-changed', self.on_widget_value_changed)
 
         if not field.editable:
-            field.widget.widget.set_sensitive(False)
+            widget.widget.set_sensitive(False)
+
+        self.widgets[field.field_var] = widget
 
-        self.widgets[field.field_var] = field.widget
 
+    def on_switch_page(self, notebook, page, page_num):
+        page = notebook.get_nth_page(page_num)
+        for name, section_page in self.pages.iteritems():
+            if section_page == page:
+                self.build_section(name)
+                break
 
-    def on_field_value_changed(self, sender, field_instance, new_value):
-        self.widgets[field_instance.field_var].value = new_value
+
+    def on_field_value_changed(self, sender, field_name, new_value):
+        if field_name == self._committing:
+            # (don't set the value the widget just reported)
+            return
+        widget = self.widgets.get(field_name)
+        if widget is not None:
+            widget.value = new_value
+
+
+    def on_fields_changed(self, sender, field_names):
+        for name in field_names:
+            self.on_field_value_changed(sender, name, self.fields[name].value)
 
 
     def on_widget_value_changed(self, sender, new_value):
-        self.emit('field-value-changed', sender.field_var, new_value)
+        self._committing = sender.field_var
+        try:
+            self.emit('field-value-changed', sender.field_var, new_value)
+        finally:
+            self._committing = None
 
 
     def on_widget_log(self, sender, msg, level='info'):
@@ -203,6 +272,8 @@ class ConfigurationDialog(Frontend):
 
     def close(self, save=False):
 
+        for widget in self.widgets.itervalues():
+            widget.commit()
         self.emit('close')
         if save:
             try:
@@ -29,3 +29,21 @@ def to_rgb(srgb_tuple):
 
 def joindir(file, *parts):
     return os.path.join(os.path.abspath(os.path.dirname(file)), *parts)
+
+# file name -> content of the interface definitions read so far
+_interfaces = {}
+
+def load_interface(name):
+    """
+    Returns a :class:`gtk.Builder` with the objects defined in the
+    ``interface/<name>.ui`` file. Every file is only read once; later
+    calls build from the cached definition.
+    """
+    from gi.repository import Gtk as gtk
+    definition = _interfaces.get(name)
+    if definition is None:
+        with open(joindir(__file__, 'interface', name + '.ui')) as fobj:
+            definition = _interfaces[name] = fobj.read()
+    interface = gtk.Builder()
+    interface.add_from_string(definition)
+    return interface
@@ -1,24 +1,109 @@
 # %FILEHEADER%
-from gi.repository import Gtk as gtk
+from gi.repository import Gtk as gtk, GLib
 from gpyconf.mvc import MVCComponent
+from gpyconf.fields.base import BoundField
 
 from .utils import *
 
-def get_widget_for_field(field, mapping=None):
+class WidgetMap(dict):
+    """
+    Maps field class names to :class:`Widget` classes.
+
+    Widgets are looked up along the field class' MRO, so subclasses of a
+    mapped field get its widget unless they have one of their own. The
+    result is memorized per field class (and forgotten when the mapping
+    changes).
+    """
+    def __init__(self, *args, **kwargs):
+        dict.__init__(self, *args, **kwargs)
+        # field class -> widget class (or None)
+        self._resolved = {}
+
+    def resolve(self, field_class):
+        """
+        Returns the widget class for ``field_class`` or :const:`None`
+        """
+        try:
+            return self._resolved[field_class]
+        except KeyError:
+            widget = self._resolved[field_class] = \
+                _resolve(self, field_class)
+            return widget
+
+    def _changed(method):
+        def wrapper(self, *args, **kwargs):
+            self._resolved.clear()
+            return method(self, *args, **kwargs)
+        wrapper.__name__ = method.__name__
+        return wrapper
+
+    __setitem__ = _changed(dict.__setitem__)
+    __delitem__ = _changed(dict.__delitem__)
+    update = _changed(dict.update)
+    setdefault = _changed(dict.setdefault)
+    pop = _changed(dict.pop)
+    popitem = _changed(dict.popitem)
+    clear = _changed(dict.clear)
+    del _changed
+
+
+def _resolve(mapping, field_class):
+    for cls in field_class.__mro__:
+        widget = mapping.get(cls.__name__)
+        if widget is not None:
+            return widget
+    return None
+
+def register_widget(field_class, widget_class=None):
+    """
+    Registers ``widget_class`` as the :class:`Widget` for ``field_class``
+    (a :class:`Field <gpyconf.fields.base.Field>` subclass or its name) and
+    its subclasses. Without ``widget_class``, returns a class decorator::
+
+        @register_widget(HotkeyField)
+        class HotkeyWidget(Widget):
+            ...
     """
-    Looks up for a corresponding :class:`Widget` in ``mapping``
-    (Uses the module-default :attr:`WIDGET_MAP` if ``mapping`` is :const:`None`).
-    Raises :exc:`KeyError` if no such widget is defined.
+    if not isinstance(field_class, basestring):
+        field_class = field_class.__name__
+    if widget_class is None:
+        def decorator(widget_class):
+            WIDGET_MAP[field_class] = widget_class
+            return widget_class
+        return decorator
+    WIDGET_MAP[field_class] = widget_class
+    return widget_class
+
+def get_widget_class(field, mapping=None):
+    """
+    Looks up for a corresponding :class:`Widget` class in ``mapping``
+    (Uses the module-default :attr:`WIDGET_MAP` if ``mapping`` is :const:`None`),
+    along the MRO of the field's class.
+    Raises :exc:`NotImplementedError` if no such widget is defined.
     """
     if mapping is None:
         mapping = WIDGET_MAP
-    if field._class_name in mapping:
-        return mapping[field._class_name](field)
+    if isinstance(field, BoundField):
+        field_class = field.field.__class__
+    else:
+        field_class = field.__class__
+    if isinstance(mapping, WidgetMap):
+        widget = mapping.resolve(field_class)
     else:
+        widget = _resolve(mapping, field_class)
+    if widget is None:
         raise NotImplementedError("No widget defined for '%s' field. "
-            "You could extend the `gpyconf.frontends._gtk.WIDGET_MAP` dict "
-            "with your own implementation of a widget for this field "
-            "(inherit from `gpyconf.frontends._gtk.Widget`)." % field)
+            "You could register your own implementation of a widget for "
+            "this field using `gpyconf.frontends.gtk.widgets.register_widget` "
+            "(inherit from `gpyconf.frontends.gtk.widgets.Widget`)." % field)
+    return widget
+
+def get_widget_for_field(field, mapping=None):
+    """
+    Returns an instance of the :class:`Widget` defined for ``field``
+    (see :func:`get_widget_class`).
+    """
+    return get_widget_class(field, mapping)(field)
 
 
 class Widget(MVCComponent):
@@ -29,15 +114,27 @@ class Widget(MVCComponent):
     """
     __events__ = ('value-changed',)
     _changed_signal = 'changed'
+    #: Milliseconds to wait for further changes of the :class:`gtk.Widget`
+    #: before emitting :signal:`value-changed` (:const:`0` to emit it on
+    #: every change). Pending changes are also committed when the widget
+    #: loses the focus.
+    commit_delay = 0
 
     def __init__(self, field):
         MVCComponent.__init__(self)
 
+        # id of the timeout committing a change
+        self._commit_source = None
+        # set while the value is set programmatically
+        self._updating = False
+
         self.widget = self.gtk_widget()
         self.field_var = field.field_var
         self.label = field.label
         self.label2 = field.label2
         self.widget.connect(self._changed_signal, self.on_value_changed)
+        if self.commit_delay:
+            self.widget.connect('focus-out-event', self.on_focus_out)
         self.initialize()
         self.value = field.value
 
@@ -52,13 +149,44 @@ class Widget(MVCComponent):
         """
         Value of the :class:`gtk.Widget` changed (mostly through the end user).
 
-        Emits :signal:`value-changed` with :attr:`value` as parameter.
+        Commits the change (see :meth:`commit`), after :attr:`commit_delay`
+        if that's set.
+        """
+        if self._updating:
+            return
+        if not self.commit_delay:
+            self._emit_value()
+            return
+        if self._commit_source is not None:
+            GLib.source_remove(self._commit_source)
+        self._commit_source = GLib.timeout_add(self.commit_delay,
+                                               self._on_commit_timeout)
+
+    def on_focus_out(self, sender, event):
+        self.commit()
+        return False
+
+    def _on_commit_timeout(self):
+        self._commit_source = None
+        self._emit_value()
+        return False
+
+    def commit(self):
+        """
+        Emits :signal:`value-changed` with :attr:`value` as parameter if a
+        change is waiting for :attr:`commit_delay` to pass.
         """
-        self.emit('value-changed', self.value)
-        log_msg = "Value of %s '%s' changed to '%s'" % (self._class_name,
-                                                        self.field_var,
-                                                        self.value)
-        self.emit('log', log_msg, level='info')
+        if self._commit_source is not None:
+            GLib.source_remove(self._commit_source)
+            self._commit_source = None
+            self._emit_value()
+
+    def _emit_value(self):
+        value = self.value
+        self.emit('value-changed', value)
+        self.emit('log', "Value of %s '%s' changed to '%s'"
+                         % (self._class_name, self.field_var, value),
+                  level='info')
 
     def get_value(self):
         """
@@ -96,7 +224,16 @@ class Widget(MVCComponent):
         return value
 
     def _set_value(self, value):
-        self.set_value(self.to_gtk(value))
+        # (a value set programmatically replaces pending changes and is not
+        # reported back)
+        if self._commit_source is not None:
+            GLib.source_remove(self._commit_source)
+            self._commit_source = None
+        self._updating = True
+        try:
+            self.set_value(self.to_gtk(value))
+        finally:
+            self._updating = False
 
     def _get_value(self):
         return self.to_python(self.get_value())
@@ -141,6 +278,7 @@ class IntegerWidget(NumberWidget):
 class CharWidget(Widget):
     gtk_widget = gtk.Entry
     prop = 'text'
+    commit_delay = 300
 
     def to_python(self, value):
         return unicode(value)
@@ -217,7 +355,7 @@ class TextWidget(CharWidget):
     pass
 
 
-WIDGET_MAP = {
+WIDGET_MAP = WidgetMap({
     'BooleanField'      : BooleanWidget,
     'CharField'         : CharWidget,
     'PasswordField'     : PasswordWidget,
@@ -233,4 +371,4 @@ WIDGET_MAP = {
     'DateTimeField'     : DateTimeWidget,
     'FontField'         : FontWidget,
     'TextField'         : TextWidget
-}
+})
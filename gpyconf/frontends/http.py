@@ -0,0 +1,228 @@
+# %FILEHEADER%
+"""
+gpyconf HTTP frontend
+---------------------
+
+A headless frontend serving the configuration as JSON over HTTP (using
+:mod:`wsgiref`), e.g. for servers or dashboards:
+
++--------+-------------+---------------------------------------------------+
+| Method | Path        | Description                                       |
++========+=============+===================================================+
+| GET    | ``/fields`` | The fields' schema (label, section, group, type,  |
+|        |             | editable, hidden)                                 |
++--------+-------------+---------------------------------------------------+
+| GET    | ``/values`` | The current values of the fields not hidden       |
++--------+-------------+---------------------------------------------------+
+| PATCH  | ``/values`` | Sets the values passed as JSON object (all or     |
+|        |             | none of them)                                     |
++--------+-------------+---------------------------------------------------+
+| POST   | ``/save``   | Saves the configuration                           |
++--------+-------------+---------------------------------------------------+
+
+GET responses carry an ``ETag`` derived from a counter that is incremented
+whenever a value (or a field's editability) changes, so clients polling with
+``If-None-Match`` get a ``304 Not Modified`` until something changed.
+
+Values that are no JSON datatypes are passed in their
+:meth:`python_to_conf <gpyconf.fields.base.Field.python_to_conf>` form.
+"""
+import os
+from wsgiref.simple_server import make_server
+try:
+    import json
+except ImportError:
+    import simplejson as json
+
+from . import Frontend
+from .._internal.exceptions import InvalidOptionError
+
+JSON_TYPES = (basestring, int, long, float, bool, list, tuple, dict,
+              type(None))
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        Exception.__init__(self, message)
+        self.status = status
+
+
+class ConfigurationServer(Frontend):
+    """
+    Serves the configuration on :attr:`host`::attr:`port`;
+    :meth:`application` is the WSGI application doing that.
+    """
+    #: Host name to listen on
+    host = 'localhost'
+    #: Port to listen on
+    port = 8080
+
+    def __init__(self, backref, fields, host=None, port=None):
+
+        Frontend.__init__(self)
+
+        self.backref = backref
+        self.fields = fields
+        if host is not None:
+            self.host = host
+        if port is not None:
+            self.port = port
+        self.server = None
+        #: Incremented whenever the served data changes
+        self.version = 0
+        # (distinguishes the versions of different server instances)
+        self._etag_prefix = os.urandom(4).encode('hex')
+
+        # don't let the configuration keep closed servers alive
+        backref().connect('field-value-changed', self.on_field_value_changed,
+                          weak=True)
+        backref().connect('fields-changed', self.on_fields_changed, weak=True)
+        for field in fields.itervalues():
+            field.connect('set-editable', self.on_field_set_editable,
+                          weak=True)
+
+
+    def on_field_value_changed(self, sender, field_name, new_value):
+        self.version += 1
+
+
+    def on_fields_changed(self, sender, field_names):
+        self.version += 1
+
+
+    def on_field_set_editable(self, sender, editable):
+        self.version += 1
+
+
+    @property
+    def etag(self):
+        return '"%s-%d"' % (self._etag_prefix, self.version)
+
+
+    def get_schema(self):
+        return [{
+            'name' : name,
+            'label' : field.label,
+            'section' : field.section,
+            'group' : field.group,
+            'type' : field._class_name,
+            'editable' : field.editable,
+            'hidden' : field.hidden
+        } for name, field in self.fields.iteritems()]
+
+
+    def get_values(self):
+        values = {}
+        for name, field in self.fields.iteritems():
+            if field.hidden:
+                continue
+            value = field.value
+            if not isinstance(value, JSON_TYPES):
+                value = field.python_to_conf(value)
+            values[name] = value
+        return values
+
+
+    def set_values(self, values):
+        """
+        Emits :signal:`field-value-changed` for every item of ``values``
+        within a :meth:`batch <gpyconf.Configuration.batch>`, so that all or
+        none of the values are set.
+        """
+        for name in values:
+            field = self.fields.get(name)
+            if field is None:
+                raise HTTPError('404 Not Found', "No field '%s'" % name)
+            if field.hidden or not field.editable:
+                raise HTTPError('403 Forbidden',
+                                "Field '%s' is not editable" % name)
+        with self.backref().batch():
+            for name, value in values.iteritems():
+                field = self.fields[name]
+                if isinstance(value, basestring) and \
+                   not isinstance(field.value, JSON_TYPES):
+                    value = field.conf_to_python(value)
+                self.emit('field-value-changed', name, value)
+
+
+    def application(self, environ, start_response):
+        """ The WSGI application """
+        method = environ['REQUEST_METHOD']
+        path = environ.get('PATH_INFO', '/').rstrip('/')
+        headers = [('Content-Type', 'application/json')]
+        try:
+            if method in ('GET', 'HEAD') and path in ('/fields', '/values'):
+                # (taken before the data, so it's never newer than that)
+                etag = self.etag
+                if environ.get('HTTP_IF_NONE_MATCH') == etag:
+                    start_response('304 Not Modified', [('ETag', etag)])
+                    return []
+                if path == '/fields':
+                    data = self.get_schema()
+                else:
+                    data = self.get_values()
+                headers.append(('ETag', etag))
+            elif method == 'PATCH' and path == '/values':
+                try:
+                    values = json.loads(self._read_body(environ))
+                except ValueError:
+                    raise HTTPError('400 Bad Request', "Invalid JSON")
+                if not isinstance(values, dict):
+                    raise HTTPError('400 Bad Request', "Expected an object")
+                try:
+                    self.set_values(values)
+                except InvalidOptionError, error:
+                    raise HTTPError('400 Bad Request', str(error))
+                data = self.get_values()
+                headers.append(('ETag', self.etag))
+            elif method == 'POST' and path == '/save':
+                try:
+                    self.emit('save')
+                except InvalidOptionError, error:
+                    raise HTTPError('400 Bad Request', str(error))
+                data = {}
+            elif path in ('/fields', '/values', '/save'):
+                raise HTTPError('405 Method Not Allowed',
+                                "%s not allowed" % method)
+            else:
+                raise HTTPError('404 Not Found', "No resource '%s'" % path)
+        except HTTPError, error:
+            status, data = error.status, {'error' : str(error)}
+        else:
+            status = '200 OK'
+        body = json.dumps(data)
+        headers.append(('Content-Length', str(len(body))))
+        start_response(status, headers)
+        if method == 'HEAD':
+            return []
+        return [body]
+
+
+    def _read_body(self, environ):
+        try:
+            length = int(environ.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            length = 0
+        return environ['wsgi.input'].read(length)
+
+
+    def run(self):
+        """ Serves requests until :meth:`close` is called """
+        self.server = make_server(self.host, self.port, self.application)
+        try:
+            self.server.serve_forever()
+        finally:
+            self.server.server_close()
+            self.server = None
+
+
+    def close(self, save=False):
+
+        self.emit('close')
+        if save:
+            self.emit('save')
+        if self.server is not None:
+            # (blocks until serve_forever returns, so call it from another
+            # thread than the serving one)
+            self.server.shutdown()
+        self.emit('closed')
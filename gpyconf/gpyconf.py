@@ -16,11 +16,16 @@
     -----------------
 """
 import weakref
+from contextlib import contextmanager
 from . import fields, backends, frontends
 from .mvc import MVCComponent
+from .fields.base import BoundField
+from .backends.filebased import file_watcher
 from ._internal import logging, dicts
 from ._internal import exceptions
-from ._internal.exceptions import InvalidOptionError
+from ._internal.utils import NONE
+from ._internal.saver import write_behind_saver
+from ._internal.exceptions import InvalidOptionError, MissingOption
 
 __all__ = ('fields', 'backends', 'frontends', 'exceptions', 'Configuration')
 
@@ -46,6 +51,49 @@ class DefaultFrontend(Proxy):
         self._proxy_obj = gtk.ConfigurationDialog(*args, **kwargs)
 
 
+class FieldDescriptor(object):
+    """
+    Data descriptor giving direct access to a field's value
+    (installed by :class:`ConfigurationMeta` for every field).
+    Accessing it on the class returns the field itself.
+    """
+    __slots__ = ('field', 'name', 'index')
+
+    def __init__(self, field, name, index):
+        self.field = field
+        self.name = name
+        self.index = index
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self.field
+        if instance._read_pending:
+            instance._read_field(self.name)
+        return instance._values[self.index]
+
+    def __set__(self, instance, value):
+        instance._set_value(self.name, value)
+
+
+class MutableFieldDescriptor(FieldDescriptor):
+    """
+    :class:`FieldDescriptor` for :attr:`mutable <gpyconf.fields.Field.mutable>`
+    fields. The field's default value is shared by all instances, so it is
+    copied the first time it is handed out.
+    """
+    __slots__ = ()
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self.field
+        if instance._read_pending:
+            instance._read_field(self.name)
+        value = instance._values[self.index]
+        if value is self.field.default:
+            instance._values[self.index] = value = self.field.copy_value(value)
+        return value
+
+
 class ConfigurationMeta(type):
     """ Metaclass for the :class:`Configuration` class """
     def __new__(cls, cls_name, cls_bases, cls_dict):
@@ -73,6 +121,19 @@ class ConfigurationMeta(type):
             class_fields[name] = field
             field.field_var = name
 
+        # position of each field's value in the instances' value rows
+        cls_dict['_field_index'] = field_index = dict()
+        # (name, index) pairs of the mutable fields
+        cls_dict['_mutable_fields'] = mutable_fields = list()
+        for index, (name, field) in enumerate(class_fields.iteritems()):
+            field_index[name] = index
+            if field.mutable:
+                mutable_fields.append((name, index))
+            if name not in cls_dict:
+                descriptor = MutableFieldDescriptor if field.mutable \
+                             else FieldDescriptor
+                cls_dict[name] = descriptor(field, name, index)
+
         return super_new(cls, cls_name, cls_bases, cls_dict)
 
 
@@ -100,16 +161,61 @@ class Configuration(MVCComponent):
     The signature for a callback connecting to :signal:`field-value-changed` is
     the following::
 
-        def callback(sender_instance, field_instance, new_field_value):
+        def callback(sender_instance, field_name, new_field_value):
+            ...
+
+    The field instances defined in the class body are shared by all instances
+    and only describe the options. Each instance stores its values in a row
+    of its own, so changing a value only notifies the instance it belongs to.
+    On instances, the :attr:`fields` attribute maps field names to
+    :class:`BoundField <gpyconf.fields.base.BoundField>` objects.
+
+    Values changed within a :meth:`batch` (or using :meth:`update`) don't
+    emit :signal:`field-value-changed`; instead, :signal:`fields-changed` is
+    emitted once with a list of the changed fields' names::
+
+        def callback(sender_instance, field_names):
             ...
+
+    If :attr:`hot_reload` is set, the backend's files are watched and the
+    options changed in them are applied using :meth:`reload`.
+
+    If :attr:`save_delay` is set, :meth:`save` doesn't wait for the backend
+    to store the values; this is done in a background thread at most every
+    :attr:`save_delay` milliseconds (and when the interpreter exits). Use
+    :meth:`flush` or :meth:`wait` if the values have to be stored right away.
     """
     __metaclass__ = ConfigurationMeta
     fields = dict()
+    _field_index = dict()
+    _mutable_fields = ()
 
     frontend_instance = None
     initially_read = False
+    #: If :const:`True`, the values are read from the backend on first access
+    #: instead of on initialization (defaults to :const:`False`).
+    lazy_read = False
+    _read_pending = False
+    # sections not read yet if the backend reads lazily by section
+    _pending_sections = None
+    # fields not read yet if the backend reads lazily by option
+    _pending_options = None
+    #: If :const:`True`, the backend's files are watched for changes
+    #: (see :meth:`reload`; defaults to :const:`False`).
+    hot_reload = False
+    # the options read from the backend (only kept for hot reloading)
+    _tree = None
+    #: If not :const:`None`, the backend stores the values in the background,
+    #: at most every :attr:`save_delay` milliseconds (see :meth:`save`;
+    #: defaults to :const:`None`).
+    save_delay = None
+    _batch = None
     logger = None
     logging_level = 'warning'
+    #: If :const:`True`, log messages are passed to the standard library's
+    #: :mod:`logging` module (logger ``gpyconf.<class name>``), whose
+    #: configuration then decides what is logged (defaults to :const:`False`).
+    stdlib_logging = False
 
     #: The :doc:`backend <backends>` to use
     backend = DefaultBackend
@@ -118,6 +224,7 @@ class Configuration(MVCComponent):
 
     __events__ = (
         'field-value-changed',
+        'fields-changed',
         'frontend-initialized',
         'pre-read',
         'pre-save',
@@ -127,100 +234,315 @@ class Configuration(MVCComponent):
 
     def __init__(self, read=True, **kwargs):
         MVCComponent.__init__(self)
+        fields = self.__class__.fields
+        self._read_pending = False
+        self._values = [field._get_default() for field in fields.itervalues()]
+        # names of fields changed/reset since the last read or save
+        self._changed = set()
+        self._removed = set()
+        # name -> copy of the stored value of mutable fields, to find values
+        # changed in place (fields not in here are stored with the default)
+        self._snapshots = {}
+        # changes passed to the backend but not written yet (option name ->
+        # value/default), applied again if the backend is reloaded meanwhile
+        self._unwritten_changed = {}
+        self._unwritten_removed = {}
+        self.fields = dicts.BoundFieldsDict(fields, self, BoundField)
         for key, value in kwargs.iteritems():
             setattr(self, key, value)
 
         if self.logger is None:
-            self.logger = logging.Logger(self._class_name, self.logging_level)
-        self.logger.info("Logger initialized (%s)" % self.logger)
+            if self.stdlib_logging:
+                self.logger = logging.StdlibLogger(self._class_name)
+            else:
+                self.logger = logging.Logger(self._class_name,
+                                             self.logging_level)
+        self.logger.info("Logger initialized (%s)", self.logger)
 
         if not hasattr(self, 'backend_instance'):
             self.backend_instance = self.backend(weakref.ref(self))
-        self.backend_instance.connect('log', self.backend_log)
+        self.backend_instance.connect('log', self.backend_log, weak=True)
 
-        self.logger.info("Backend initialized (%s)" % self.backend)
-
-        for name, instance in self.fields.iteritems():
-            instance.connect('value-changed', self.on_field_value_changed)
+        self.logger.info("Backend initialized (%s)", self.backend)
 
         self.emit('initialized')
         if read:
-            self.read()
+            if self.lazy_read:
+                self._read_pending = True
+            else:
+                self.read()
         # read the config andd set it to the fields.
+        if self.hot_reload:
+            file_watcher.watch(self)
+
+
+    # VALUES:
+    def _get_value(self, name):
+        if self._read_pending:
+            self._read_field(name)
+        index = self._field_index[name]
+        value = self._values[index]
+        field = self.__class__.fields[name]
+        if field.mutable and value is field.default:
+            # see MutableFieldDescriptor
+            self._values[index] = value = field.copy_value(value)
+        return value
+
+    def _set_value(self, name, value):
+        """
+        Converts ``value`` using the field's :meth:`to_python` method and
+        stores it. Emits :signal:`field-value-changed` if the value changed.
+        """
+        if self._read_pending:
+            self._read_field(name)
+        field = self.__class__.fields[name]
+        if not field.editable:
+            raise AttributeError("Can't change value of non-editable field %r"
+                % field._class_name)
+        value = field.to_python(value)
+        self._store_value(name, value)
+        return value
+
+    def _reset_value(self, name):
+        if self._read_pending:
+            self._read_field(name)
+        self._store_value(name, self.__class__.fields[name]._get_default())
+        # the stored value is obsolete now, the default applies
+        self._changed.discard(name)
+        self._removed.add(name)
+        self._snapshots.pop(name, None)
+
+    def _snapshot(self, name):
+        """
+        Remembers the current value of field ``name`` as the stored one
+        (if the field is mutable, see :meth:`_collect_mutations`)
+        """
+        field = self.__class__.fields[name]
+        if field.mutable:
+            self._snapshots[name] = field.copy_value(
+                self._values[self._field_index[name]])
 
-    def on_field_value_changed(self, sender, field, new_value):
-        self.emit('field-value-changed', field.field_var, new_value)
-
+    def _collect_mutations(self):
+        """
+        Marks the mutable fields whose values were changed in place (e.g.
+        by appending to a list) since they were read or saved as changed.
+        """
+        fields = self.__class__.fields
+        for name, index in self._mutable_fields:
+            if name in self._changed:
+                continue
+            field = fields[name]
+            value = self._values[index]
+            if value is field.default:
+                # never handed out, so unchanged
+                continue
+            if value != self._snapshots.get(name, field.default):
+                self._changed.add(name)
+                self._removed.discard(name)
+
+    def _store_value(self, name, value):
+        index = self._field_index[name]
+        old_value = self._values[index]
+        emit = value != old_value
+        self._values[index] = value
+        if emit:
+            self._removed.discard(name)
+            self._changed.add(name)
+            if self._batch is None:
+                self.emit('field-value-changed', name, value)
+            else:
+                self._batch.setdefault(name, old_value)
 
-    # MAGIC/API:
-    def __setattr__(self, attr, value):
-        # if ``attr`` is a field, don't overwrite the field but its value
-        if attr in self.fields:
-            return self.fields[attr].set_value(value)
-        else:
-            super(Configuration, self).__setattr__(attr, value)
+    @contextmanager
+    def batch(self):
+        """
+        Context manager that applies all values set within it as a unit::
+
+            with conf.batch():
+                conf.foo = 42
+                conf.bar = 'baz'
+
+        When leaving the block, the changed values are validated. If one of
+        them is invalid (or an exception was raised within the block), all
+        values are rolled back to those before the block and the exception
+        (e.g. an
+        :exc:`InvalidOptionError <gpyconf._internal.exceptions.InvalidOptionError>`)
+        is re-raised.
+
+        Otherwise, :signal:`fields-changed` is emitted once, passing the names
+        of all fields that changed their value. Nested batches are part of the
+        outermost one.
+        """
+        if self._batch is not None:
+            yield self
+            return
 
-    def __getattr__(self, name):
+        if self._read_pending and not self._reads_lazily:
+            self.read()
+        self._batch = old_values = {}
+        dirty = set(self._changed), set(self._removed)
         try:
-            return self.fields[name].value
-        except KeyError:
-            raise AttributeError("No such attribute '%s'" % name)
+            yield self
+            fields = self.__class__.fields
+            for name, old_value in old_values.iteritems():
+                self._validate(name, fields[name],
+                               self._values[self._field_index[name]])
+        except:
+            for name, old_value in old_values.iteritems():
+                self._values[self._field_index[name]] = old_value
+            self._changed, self._removed = dirty
+            raise
+        finally:
+            self._batch = None
+
+        changed = [name for name, old_value in old_values.iteritems()
+                   if self._values[self._field_index[name]] != old_value]
+        if changed:
+            changed.sort(key=self._field_index.__getitem__)
+            self.emit('fields-changed', changed)
+
+    def update(self, values=(), **kwargs):
+        """
+        Sets the values of all fields named in ``values`` (a dictionary or an
+        iterable of ``(name, value)`` pairs) and ``kwargs`` within a
+        :meth:`batch`.
+        """
+        with self.batch():
+            for name, value in dict(values, **kwargs).iteritems():
+                if name not in self._field_index:
+                    raise AttributeError("No such field '%s'" % name)
+                self._set_value(name, value)
+
+    def _validate(self, name, field, value):
+        """
+        Raises an
+        :exc:`InvalidOptionError <gpyconf._internal.exceptions.InvalidOptionError>`
+        if ``value`` is blank but ``field`` does not allow blank values or if
+        it is invalid.
+        """
+        if field.isblank(value):
+            self.logger.info('Is blank', field=field)
+            if not field.blank:
+                # blank, but blank values are not allowed, raise error
+                raise InvalidOptionError(field, "The option '%s' wasn't "
+                    "set yet (is None). Use blank=True to safe anyway." % name)
+        elif not field.isvalid(value):
+            self.logger.error("Invalid option '%s'", value, field=field)
+            field.validation_error(value)
 
 
     # BACKEND:
     def save(self, save=True):
         """
-        Checks for every field wether it's value is valid and not emtpy;
-        if the value is invalid or empty and the field was not marked to allow
-        blank values, an
+        Checks for every field changed since the last read or save wether
+        it's value is valid and not emtpy; if the value is invalid or empty
+        and the field was not marked to allow blank values, an
         :exc:`InvalidOptionError <gpyconf._internal.exceptions.InvalidOptionError>`
         will be raised.
 
-        Otherwise, passes the fields' values to the backend. If the ``save``
-        argument is set :const:`True`, makes the backend store the values
-        permanently.
+        Otherwise, passes the changes to the backend (see
+        :meth:`Backend.apply_changes <gpyconf.backends.Backend.apply_changes>`).
+        If the ``save`` argument is set :const:`True`, makes the backend store
+        the values permanently. Nothing is stored if no field changed.
+
+        If :attr:`save_delay` is set, the values are stored in the background
+        (after emitting :signal:`pre-save` from the saver's thread).
         """
+        # (a reload from the watcher thread or a write in the background
+        # must not interfere with applying the changes)
+        with write_behind_saver.write_lock:
+            self._save_changes(save)
+
+    def _save_changes(self, save):
         self.logger.debug("Saving option values...")
+        if self._read_pending and not self._reads_lazily:
+            self.read()
         if self.backend_instance.compatibility_mode:
             self.logger.info("Backend runs in compatibility mode")
 
-        for name, field in self.fields.iteritems():
+        self._collect_mutations()
+        fields = self.__class__.fields
+        changed = {}
+        for name in sorted(self._changed, key=self._field_index.__getitem__):
+            field = fields[name]
             if not field.editable:
                 # not editable, ignore
                 continue
-            if field.isblank():
-                self.logger.info('Is blank', field=field)
-                if not field.blank:
-                    # blank, but blank values are not allowed, raise error
-                    raise InvalidOptionError("The option '%s' wasn't set yet" \
-                        % name + " (is None). Use blank=True to safe anyway.")
-                value = None
-            else:
-                # not blank, validate
-                if not field.isvalid():
-                    self.logger.error("Invalid option '%s'" % field.value,
-                                      field=field)
-                    field.validation_error(field.value)
-                value = field.value
-
-            # if backend runs in compatibility mode, convert to str type:
-            if self.backend_instance.compatibility_mode:
-                if value is None:
-                    value = u''
-                else:
-                    value = field.python_to_conf(value)
-                if not isinstance(value, unicode):
-                    self.logger.warning("Wrong datatype conversion: "
-                        "Got %s, not unicode" % type(value), field=field)
-
-            self.backend_instance.set_option(name, value)
-
-        if save:
+            value = self._values[self._field_index[name]]
+            self._validate(name, field, value)
+            changed[name] = self._to_backend(field, value)
+
+        # (defaults are passed for backends that can't remove options)
+        removed = dict((name, self._to_backend(fields[name],
+                                               fields[name]._get_default()))
+                       for name in self._removed if fields[name].editable)
+        if not (changed or removed):
+            self.logger.debug("No option values changed")
+            return
+
+        # only changes are passed, so the backend has to know the other options
+        self._read_backend()
+        self.backend_instance.apply_changes(changed, removed)
+        if self._tree is not None:
+            self._tree.update(changed)
+            for name in removed:
+                self._tree.pop(name, None)
+        for name in changed:
+            self._snapshot(name)
+        self._changed.clear()
+        self._removed.clear()
+        if save and self.save_delay is None:
             self._save()
+            return
+        for name, value in changed.iteritems():
+            self._unwritten_changed[name] = value
+            self._unwritten_removed.pop(name, None)
+        for name, default in removed.iteritems():
+            self._unwritten_removed[name] = default
+            self._unwritten_changed.pop(name, None)
+        if save:
+            write_behind_saver.schedule(self, self.save_delay / 1000.0)
+
+    def _to_backend(self, field, value):
+        """ Returns ``value`` of ``field`` in the form passed to the backend """
+        if field.isblank(value):
+            value = None
+
+        # if backend runs in compatibility mode, convert to str type:
+        if self.backend_instance.compatibility_mode:
+            if value is None:
+                value = u''
+            else:
+                value = field.python_to_conf(value)
+            if not isinstance(value, unicode):
+                self.logger.warning("Wrong datatype conversion: "
+                    "Got %s, not unicode", type(value), field=field)
+        return value
 
     def _save(self):
         self.emit('pre-save')
         self.backend_instance.save()
+        self._unwritten_changed.clear()
+        self._unwritten_removed.clear()
+
+    def flush(self):
+        """
+        Makes the backend store the values right now if they are waiting to
+        be stored in the background (see :attr:`save_delay`).
+        """
+        write_behind_saver.flush(self)
+
+    def wait(self):
+        """
+        Blocks until the values waiting to be stored in the background are
+        stored (see :attr:`save_delay`).
+        """
+        write_behind_saver.wait(self)
+
+    def _read_backend(self):
+        if not self.initially_read:
+            self.backend_instance.read()
+            self.initially_read = True
 
     def read(self):
         """
@@ -228,28 +550,180 @@ class Configuration(MVCComponent):
         fields' values
         """
         self.logger.debug("Reading option values...")
+        self._read_pending = False
         self.emit('pre-read')
-        if not self.initially_read:
-            self.backend_instance.read()
-            self.initially_read = True
-        for field, value in self.backend_instance.tree.iteritems():
+        self._read_backend()
+        if self.backend_instance.lazy_options:
+            # options are read when their field is accessed
+            self._pending_options = set(self.__class__.fields)
+            self._read_pending = bool(self._pending_options)
+            if self.hot_reload:
+                self._tree = {}
+            return
+        if self.backend_instance.lazy_sections:
+            # sections are read when one of their fields is accessed
+            self._pending_sections = set(field.section for field
+                                         in self.__class__.fields.itervalues())
+            self._read_pending = bool(self._pending_sections)
+            if self.hot_reload:
+                self._tree = {}
+            return
+        if self.hot_reload:
+            self._tree = dict(self.backend_instance.tree)
+        self._apply_tree(self.backend_instance.tree)
+
+    @property
+    def _reads_lazily(self):
+        # (True if values are read by section or option on first access)
+        return self._pending_sections is not None or \
+               self._pending_options is not None
+
+    def _read_field(self, name):
+        """ Reads the value of field ``name`` if it wasn't read yet """
+        if not self._reads_lazily:
+            self.read()
+        if self._pending_options is not None:
+            if name in self._pending_options:
+                self._read_option(name)
+        elif self._pending_sections is not None:
+            section = self.__class__.fields[name].section
+            if section in self._pending_sections:
+                self._read_section(section)
+
+    def _read_option(self, name):
+        self._pending_options.discard(name)
+        self._read_pending = bool(self._pending_options)
+        try:
+            value = self.backend_instance.get_option(name)
+        except MissingOption:
+            return
+        self._apply_read({name: value})
+
+    def _read_section(self, section):
+        self.logger.debug("Reading option values of section '%s'...", section)
+        self._pending_sections.discard(section)
+        self._read_pending = bool(self._pending_sections)
+        fields = self.__class__.fields
+        tree = dict((name, value) for name, value
+                    in self.backend_instance.read_section(section).iteritems()
+                    if name not in fields or fields[name].section == section)
+        self._apply_read(tree)
+
+    def _apply_read(self, tree):
+        """ Applies the options read lazily (by section or option) """
+        if self._tree is not None:
+            self._tree.update(tree)
+        # the values read don't belong to a running batch
+        batch, self._batch = self._batch, None
+        try:
+            self._apply_tree(tree)
+        finally:
+            self._batch = batch
+
+    def _apply_tree(self, tree):
+        fields = self.__class__.fields
+        for field, value in tree.iteritems():
             try:
                 if self.backend_instance.compatibility_mode:
-                    self.logger.info("Datatype conversion of '%s'" % field)
-                    self.fields[field].setfromconf(value)
-                else:
-                    self.fields[field].value = value
+                    self.logger.info("Datatype conversion of '%s'", field)
+                    value = fields[field].conf_to_python(value)
+                # (not using `_set_value`: stored values apply to
+                # non-editable fields as well)
+                self._store_value(field, fields[field].to_python(value))
+                # the value equals the stored one now
+                self._changed.discard(field)
+                self._removed.discard(field)
+                self._snapshot(field)
             except KeyError:
                 self.logger.warning("Got an unexpected option name '%s' "
-                    "(No field according to configuration option '%s')" % \
-                        (field, field))
+                    "(No field according to configuration option '%s')",
+                    field, field)
+
+    def reload(self):
+        """
+        Reads the backend's storage again and applies the options that
+        changed since the last read: only these are converted, and
+        :signal:`field-value-changed` is emitted for each field whose value
+        really changed. Removed options reset their fields to the default.
+        Values changed but not saved yet are kept, and values saved but
+        waiting to be stored in the background (see :attr:`save_delay`) are
+        stored on top of the reloaded options.
+
+        Configurations with :attr:`hot_reload` set are reloaded
+        automatically (from the watcher thread) if their files change.
+        """
+        # (runs in the watcher thread, so it must not interfere with saving
+        # or with writing in the background)
+        with write_behind_saver.write_lock:
+            self._reload()
+
+    def _reload(self):
+        if not self.initially_read or \
+           (self._read_pending and not self._reads_lazily):
+            # not read yet, the next access reads the current options anyway
+            return
+        self.logger.debug("Reloading option values...")
+        # (values changed in place are kept like the other unsaved ones)
+        self._collect_mutations()
+        self.backend_instance.read()
+        if self._unwritten_changed or self._unwritten_removed:
+            # reading dropped the changes waiting to be written in the
+            # background (see save), so they are applied to the new state
+            self.backend_instance.apply_changes(dict(self._unwritten_changed),
+                                                dict(self._unwritten_removed))
+        fields = self.__class__.fields
+        pending = self._pending_sections or ()
+        pending_options = self._pending_options or ()
+        if self._pending_options is not None:
+            # (only the options read before are read again)
+            tree = {}
+            for name in fields:
+                if name not in pending_options:
+                    try:
+                        tree[name] = self.backend_instance.get_option(name)
+                    except MissingOption:
+                        pass
+        elif self._pending_sections is None:
+            tree = dict(self.backend_instance.tree)
+        else:
+            # sections not read yet will be read when they are accessed
+            tree = {}
+            for section in set(field.section for field in fields.itervalues()):
+                if section not in pending:
+                    tree.update(self.backend_instance.read_section(section))
+        old_tree = self._tree
+        self._tree = tree if self.hot_reload else None
+        for name, field in fields.iteritems():
+            if name in self._changed or name in self._removed or \
+               field.section in pending or name in pending_options:
+                continue
+            value = tree.get(name, NONE)
+            if old_tree is not None and value == old_tree.get(name, NONE):
+                continue
+            if value is NONE:
+                self._store_value(name, field._get_default())
+                self._snapshots.pop(name, None)
+            else:
+                if self.backend_instance.compatibility_mode:
+                    value = field.conf_to_python(value)
+                self._store_value(name, field.to_python(value))
+                self._snapshot(name)
+            # the value equals the stored one now
+            self._changed.discard(name)
 
     def reset(self):
         """ Resets all configuration options """
         self.logger.debug("Resetting option values...")
         self.emit('pre-reset')
         self.backend_instance.reset_all()
-        map(lambda field:field.reset_value(), self.fields.values())
+        self._unwritten_changed.clear()
+        self._unwritten_removed.clear()
+        # nothing to read, the stored options are gone
+        self._read_pending = False
+        self._pending_sections = None
+        self._pending_options = None
+        for name in self.__class__.fields:
+            self._reset_value(name)
         self.read()
 
 
@@ -259,16 +733,16 @@ class Configuration(MVCComponent):
         Returns a (new) instance of the specified :attr:`frontend`
         """
         if self.frontend_instance is None:
-            self.logger.info("Using '%s' as frontend" % (self.frontend.__name__))
+            self.logger.info("Using '%s' as frontend", self.frontend.__name__)
             # initialize the frontend:
             self._init_frontend(self.fields)
-            self.frontend_instance.connect('save', self.frontend_save)
-            self.frontend_instance.connect('log', self.frontend_log)
+            self.frontend_instance.connect('save', self.frontend_save, weak=True)
+            self.frontend_instance.connect('log', self.frontend_log, weak=True)
 
-            self.logger.info("Initialized frontend (%s)" % self.frontend)
+            self.logger.info("Initialized frontend (%s)", self.frontend)
 
             self.frontend_instance.connect('field-value-changed',
-                self.frontend_field_value_changed)
+                self.frontend_field_value_changed, weak=True)
 
             self.emit('frontend-initialized')
         return self.frontend_instance
@@ -295,7 +769,7 @@ class Configuration(MVCComponent):
         setattr(self, field_name, new_value)
 
     def frontend_log(self, sender, msg, level):
-        getattr(self.logger, level)("Frontend: %s" % msg)
+        getattr(self.logger, level)("Frontend: %s", msg)
 
     def frontend_save(self, sender):
         self.save()
@@ -303,4 +777,4 @@ class Configuration(MVCComponent):
 
     # BACKEND:
     def backend_log(self, sender, msg, level):
-        getattr(self.logger, level)("Backend: %s" % msg)
+        getattr(self.logger, level)("Backend: %s", msg)
@@ -8,9 +8,11 @@ class MVCComponent(events.GSignals):
     Implements the :class:`gpyconf.events.GSignals` class, so signal emitting
     and connecting can be used for inheriting classes.
     """
+    __slots__ = ()
+    __base_events__ = ('log',)
+
     def __init__(self):
         events.GSignals.__init__(self)
-        self.add_event('log')
 
     def log(self, message, level='debug'):
         self.emit('log', message, level=level)